@@ -2,7 +2,8 @@
 """
 x-poster execution wrapper.
 
-Finds the xpost binary and executes the specified command.
+Sends the command to a running `xpost serve` daemon if there is one,
+otherwise finds the xpost binary and executes the command directly.
 Designed to be called by AI agents.
 
 Usage:
@@ -16,9 +17,24 @@ Examples:
     python3 scripts/xpost_run.py search 'AI news' -n 10 --latest --json
 """
 
+import json
+import os
 import shutil
+import socket
 import subprocess
 import sys
+from typing import List, Optional
+
+DEFAULT_PROFILE_DIR = os.path.expanduser("~/.local/share/x-poster-profile")
+DAEMON_SOCKET_NAME = "xpost.sock"
+
+# Mirrors x_poster/daemon_client.py; this script runs without the package.
+# Publishing commands without --submit hold the window open, and --ndjson
+# output has to stream, so only these run inside the daemon.
+ONE_SHOT_COMMANDS = {"read", "timeline", "search", "check"}
+SUBMIT_FLAGS = {"-s", "--submit"}
+STREAMING_FLAGS = {"--ndjson"}
+GLOBAL_VALUE_OPTIONS = {"--profile", "--chrome-path"}
 
 
 def find_xpost_binary() -> str:
@@ -32,12 +48,104 @@ def find_xpost_binary() -> str:
     )
 
 
+def command_name(args: List[str]) -> Optional[str]:
+    """Return the subcommand name from an xpost argument list."""
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in GLOBAL_VALUE_OPTIONS:
+            skip_next = True
+            continue
+        if arg.startswith("-"):
+            continue
+        return arg
+    return None
+
+
+def profile_option(args: List[str]) -> Optional[str]:
+    """Return the --profile value from an xpost argument list."""
+    for i, arg in enumerate(args):
+        if arg == "--profile" and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith("--profile="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def can_serve(args: List[str]) -> bool:
+    """Check whether a command line can be run inside the daemon."""
+    name = command_name(args)
+    if name is None or name == "serve":
+        return False
+    if any(a in STREAMING_FLAGS for a in args):
+        return False
+    return name in ONE_SHOT_COMMANDS or any(a in SUBMIT_FLAGS for a in args)
+
+
+def run_via_daemon(args: List[str]) -> Optional[int]:
+    """Run a command through the xpost daemon socket.
+
+    Once the request is sent the daemon may already have run it, so a
+    missing reply is a failure, never a reason to run it a second time.
+
+    Returns:
+        The command's exit code, or None if no daemon is running or the
+        daemon asked for the command to be run standalone.
+    """
+    if not hasattr(socket, "AF_UNIX") or not can_serve(args):
+        return None
+
+    profile_dir = (
+        profile_option(args) or os.environ.get("XPOST_PROFILE") or DEFAULT_PROFILE_DIR
+    )
+    sock_path = os.path.join(profile_dir, DAEMON_SOCKET_NAME)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(sock_path)
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        request = {"argv": args, "cwd": os.getcwd()}
+        chunks = []
+        try:
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError as e:
+            print(f"❌ Lost connection to xpost daemon: {e}", file=sys.stderr)
+            return 1
+
+    try:
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        print("❌ xpost daemon closed the connection without a reply", file=sys.stderr)
+        return 1
+    if response.get("fallback"):
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response.get("code", 1)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python3 xpost_run.py <command> [args...]")
-        print("Commands: post, video, quote, reply, article, read, timeline, search, check")
+        print("Commands: post, video, quote, reply, article, read, timeline, search, check, serve")
         sys.exit(1)
 
+    code = run_via_daemon(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
     try:
         xpost = find_xpost_binary()
     except FileNotFoundError as e:
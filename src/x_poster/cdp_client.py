@@ -11,16 +11,44 @@ Provides an async CDP client that handles:
 from __future__ import annotations
 
 import asyncio
+import inspect
+import itertools
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import websockets
-import websockets.client
+import websockets.exceptions
+from websockets.asyncio.client import ClientConnection, connect as ws_connect
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+if orjson is not None:
+    def _dumps(msg: Dict[str, Any]) -> str:
+        # Chrome's DevTools server rejects binary frames, so the bytes
+        # from orjson are decoded to send a text frame.
+        return orjson.dumps(msg).decode("utf-8")
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Frames larger than this are peeked at before parsing, so big payloads
+# nobody is waiting for (timed-out responses, events without listeners)
+# are dropped without building the full object tree.
+_LARGE_FRAME_SIZE = 64 * 1024
+# Chrome serializes "id" / "method" as the first key of every frame
+_FRAME_ID_RE = re.compile(r'\{"id":(\d+)[,}]')
+_FRAME_METHOD_RE = re.compile(r'\{"method":"([^"]+)"')
+
+
 class CdpError(Exception):
     """Error returned by CDP protocol."""
 
@@ -43,13 +71,23 @@ class CdpClient:
     """
 
     def __init__(self, default_timeout: float = 15.0):
-        self._ws: Optional[websockets.client.WebSocketClientProtocol] = None
-        self._msg_id: int = 0
+        self._ws: Optional[ClientConnection] = None
+        self._msg_ids = itertools.count(1)
         self._pending: Dict[int, asyncio.Future] = {}
-        self._event_listeners: Dict[str, List[Callable]] = {}
+        # Listener tuples are replaced (never mutated) so dispatch can
+        # iterate them safely while a callback calls on()/off().
+        self._sync_listeners: Dict[str, Tuple[Callable, ...]] = {}
+        self._async_listeners: Dict[str, Tuple[Callable, ...]] = {}
+        self._frame_prefixes: Dict[Tuple[str, Optional[str]], str] = {}
         self._recv_task: Optional[asyncio.Task] = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._default_timeout = default_timeout
         self._closed = False
+        # Checked once: logging is configured before any client is created,
+        # and send() is the hottest path in the package
+        self._log_sends = logger.isEnabledFor(logging.DEBUG)
 
     @property
     def connected(self) -> bool:
@@ -58,8 +96,9 @@ class CdpClient:
     async def connect(self, ws_url: str, timeout: float = 10.0) -> None:
         """Connect to Chrome CDP WebSocket endpoint."""
         logger.debug("Connecting to CDP: %s", ws_url)
+        self._loop = asyncio.get_running_loop()
         self._ws = await asyncio.wait_for(
-            websockets.connect(
+            ws_connect(
                 ws_url,
                 max_size=100 * 1024 * 1024,  # 100MB for large payloads
                 ping_interval=None,
@@ -68,6 +107,8 @@ class CdpClient:
             timeout=timeout,
         )
         self._closed = False
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer_loop())
         self._recv_task = asyncio.create_task(self._recv_loop())
         logger.debug("CDP connected")
 
@@ -97,21 +138,12 @@ class CdpClient:
         if not self.connected:
             raise ConnectionError("CDP client not connected")
 
-        self._msg_id += 1
-        msg_id = self._msg_id
-
-        msg = {"id": msg_id, "method": method}
-        if params:
-            msg["params"] = params
-        if session_id:
-            msg["sessionId"] = session_id
-
-        future: asyncio.Future = asyncio.get_running_loop().create_future()
-        self._pending[msg_id] = future
+        msg_id, frame, future = self._register(method, params, session_id)
 
         try:
-            await self._ws.send(json.dumps(msg))
-            logger.debug("CDP send [%d]: %s", msg_id, method)
+            self._write_queue.put_nowait((msg_id, frame))
+            if self._log_sends:
+                logger.debug("CDP send [%d]: %s", msg_id, method)
             result = await asyncio.wait_for(
                 future, timeout=timeout or self._default_timeout
             )
@@ -122,47 +154,158 @@ class CdpClient:
                 f"CDP command '{method}' timed out after {timeout or self._default_timeout}s"
             )
 
+    async def send_many(
+        self,
+        commands: List[Tuple[str, Optional[Dict[str, Any]]]],
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """Send several independent CDP commands and wait for all responses.
+
+        All frames are queued together and written back-to-back before any
+        response is awaited, so the batch costs a single round-trip instead
+        of one per command.
+
+        Args:
+            commands: List of (method, params) tuples; params may be None
+            session_id: Optional session ID applied to every command
+            timeout: Override default timeout for the whole batch (seconds)
+
+        Returns:
+            List of 'result' fields, in the same order as commands
+
+        Raises:
+            CdpError: If any command returns an error response
+            asyncio.TimeoutError: If responses not received within timeout
+            ConnectionError: If not connected
+        """
+        if not self.connected:
+            raise ConnectionError("CDP client not connected")
+
+        batch = [
+            self._register(method, params, session_id)
+            for method, params in commands
+        ]
+
+        try:
+            for (msg_id, frame, _), (method, _) in zip(batch, commands):
+                self._write_queue.put_nowait((msg_id, frame))
+                if self._log_sends:
+                    logger.debug("CDP send [%d]: %s", msg_id, method)
+            # Let every command settle before raising, so a failing command
+            # doesn't leave the others' errors unretrieved.
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(future for _, _, future in batch), return_exceptions=True
+                ),
+                timeout=timeout or self._default_timeout,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return list(results)
+        except asyncio.TimeoutError:
+            for msg_id, _, _ in batch:
+                self._pending.pop(msg_id, None)
+            methods = ", ".join(method for method, _ in commands)
+            raise asyncio.TimeoutError(
+                f"CDP commands [{methods}] timed out after {timeout or self._default_timeout}s"
+            )
+
+    def _register(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        session_id: Optional[str],
+    ) -> Tuple[int, str, asyncio.Future]:
+        """Allocate an ID, encode the frame and register its response future."""
+        msg_id = next(self._msg_ids)
+
+        # Empty params are omitted from the frame, so they take the
+        # pre-serialized path too and no message dict is built.
+        if not params:
+            frame = f"{self._frame_prefix(method, session_id)}{msg_id}}}"
+        else:
+            msg = {"id": msg_id, "method": method, "params": params}
+            if session_id:
+                msg["sessionId"] = session_id
+            frame = _dumps(msg)
+
+        future: asyncio.Future = self._loop.create_future()
+        self._pending[msg_id] = future
+        return msg_id, frame, future
+
+    def _frame_prefix(self, method: str, session_id: Optional[str]) -> str:
+        """Return the pre-serialized frame for a parameterless command, minus its ID.
+
+        Commands like Page.enable or Target.getTargets only differ by ID,
+        so the JSON is encoded once and the ID spliced onto the end.
+        """
+        key = (method, session_id)
+        prefix = self._frame_prefixes.get(key)
+        if prefix is None:
+            head: Dict[str, Any] = {"method": method}
+            if session_id:
+                head["sessionId"] = session_id
+            prefix = _dumps(head)[:-1] + ',"id":'
+            self._frame_prefixes[key] = prefix
+        return prefix
+
     def on(self, event: str, callback: Callable) -> None:
         """Register an event listener for a CDP event.
 
         Args:
             event: Event name (e.g. "Page.loadEventFired")
             callback: Callable that receives the event params dict.
-                      Can be sync or async.
+                      Can be a plain function or an ``async def`` function;
+                      the kind is detected once here, not per event. A
+                      plain callable that returns an awaitable (e.g. a
+                      partial of an async function) is awaited as well.
         """
-        if event not in self._event_listeners:
-            self._event_listeners[event] = []
-        self._event_listeners[event].append(callback)
+        if inspect.iscoroutinefunction(callback):
+            listeners = self._async_listeners
+        else:
+            listeners = self._sync_listeners
+        listeners[event] = listeners.get(event, ()) + (callback,)
 
     def off(self, event: str, callback: Optional[Callable] = None) -> None:
         """Remove event listener(s).
 
         If callback is None, removes all listeners for the event.
+        Otherwise removes one registration of callback, so a callback
+        registered twice needs two calls to be fully removed.
         """
         if callback is None:
-            self._event_listeners.pop(event, None)
-        elif event in self._event_listeners:
-            self._event_listeners[event] = [
-                cb for cb in self._event_listeners[event] if cb != callback
-            ]
+            self._sync_listeners.pop(event, None)
+            self._async_listeners.pop(event, None)
+            return
+        for listeners in (self._sync_listeners, self._async_listeners):
+            registered = listeners.get(event, ())
+            if callback not in registered:
+                continue
+            idx = registered.index(callback)
+            remaining = registered[:idx] + registered[idx + 1:]
+            if remaining:
+                listeners[event] = remaining
+            else:
+                del listeners[event]
+            return
 
     async def close(self) -> None:
         """Close the CDP connection and cleanup resources."""
         self._closed = True
 
-        # Cancel receive loop
-        if self._recv_task and not self._recv_task.done():
-            self._recv_task.cancel()
-            try:
-                await self._recv_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel writer and receive loops
+        for task in (self._writer_task, self._recv_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         # Reject all pending requests
-        for msg_id, future in self._pending.items():
-            if not future.done():
-                future.set_exception(ConnectionError("CDP connection closed"))
-        self._pending.clear()
+        self._reject_pending("CDP connection closed")
 
         # Close WebSocket
         if self._ws:
@@ -174,13 +317,90 @@ class CdpClient:
 
         logger.debug("CDP connection closed")
 
+    def _reject_pending(self, reason: str) -> None:
+        """Fail every in-flight request with ConnectionError.
+
+        The pending dict is swapped out first, so a send() racing with
+        shutdown registers on the fresh dict rather than the one being drained.
+        """
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+
+    async def _writer_loop(self) -> None:
+        """Background task that writes queued frames to the WebSocket.
+
+        Frames queued while a write is in progress are drained and written
+        back-to-back in the next pass. A failed write fails the matching
+        request instead of the caller.
+        """
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            for msg_id, frame in batch:
+                try:
+                    await self._ws.send(frame)
+                except Exception as e:
+                    future = self._pending.pop(msg_id, None)
+                    if future and not future.done():
+                        future.set_exception(ConnectionError(f"CDP send failed: {e}"))
+
+    def _is_unclaimed(self, raw_msg: Any) -> bool:
+        """Check from the frame header whether nothing will consume this frame."""
+        if isinstance(raw_msg, bytes):
+            raw_msg = raw_msg[:256].decode("utf-8", errors="replace")
+        match = _FRAME_ID_RE.match(raw_msg)
+        if match:
+            return int(match.group(1)) not in self._pending
+        match = _FRAME_METHOD_RE.match(raw_msg)
+        if match:
+            event = match.group(1)
+            return event not in self._sync_listeners and event not in self._async_listeners
+        return False
+
+    async def _dispatch_event(self, event_name: str, params: Dict[str, Any]) -> None:
+        """Invoke listeners for one event.
+
+        Sync listeners run inline; async listeners, and any awaitable a
+        sync listener returns, are awaited together so independent
+        listeners overlap.
+        """
+        # Sync callables may still return an awaitable (a lambda or
+        # functools.partial around an async function); await those too
+        awaitables = []
+        for cb in self._sync_listeners.get(event_name, ()):
+            try:
+                result = cb(params)
+            except Exception:
+                logger.exception("Error in event listener for %s", event_name)
+                continue
+            if inspect.isawaitable(result):
+                awaitables.append(result)
+
+        awaitables.extend(cb(params) for cb in self._async_listeners.get(event_name, ()))
+        if not awaitables:
+            return
+        results = await asyncio.gather(*awaitables, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    "Error in event listener for %s", event_name, exc_info=result
+                )
+
     async def _recv_loop(self) -> None:
         """Background task to receive and dispatch CDP messages."""
         try:
             async for raw_msg in self._ws:
+                if len(raw_msg) > _LARGE_FRAME_SIZE and self._is_unclaimed(raw_msg):
+                    continue
+
                 try:
-                    msg = json.loads(raw_msg)
-                except json.JSONDecodeError:
+                    msg = _loads(raw_msg)
+                except ValueError:
                     logger.warning("Invalid JSON from CDP: %s", raw_msg[:200])
                     continue
 
@@ -203,18 +423,7 @@ class CdpClient:
 
                 # Event notification
                 if "method" in msg and "id" not in msg:
-                    event_name = msg["method"]
-                    params = msg.get("params", {})
-                    listeners = self._event_listeners.get(event_name, [])
-                    for cb in listeners:
-                        try:
-                            result = cb(params)
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except Exception:
-                            logger.exception(
-                                "Error in event listener for %s", event_name
-                            )
+                    await self._dispatch_event(msg["method"], msg.get("params", {}))
 
         except websockets.exceptions.ConnectionClosed:
             logger.debug("CDP WebSocket connection closed")
@@ -224,7 +433,4 @@ class CdpClient:
             logger.exception("Unexpected error in CDP recv loop")
         finally:
             # Reject remaining pending
-            for msg_id, future in self._pending.items():
-                if not future.done():
-                    future.set_exception(ConnectionError("CDP connection lost"))
-            self._pending.clear()
+            self._reject_pending("CDP connection lost")
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import functools
 import hashlib
 import logging
 import os
@@ -25,10 +26,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import json
-import urllib.request
-import urllib.error
 
 from .cdp_client import CdpClient
+from .constants import DEFAULT_PROFILE_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,23 @@ CHROME_PATHS = [
     "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
 ]
 
-DEFAULT_PROFILE_DIR = os.path.expanduser("~/.local/share/x-poster-profile")
+# Always-disabled Chrome features (Chrome honours only one --disable-features)
+_DISABLED_FEATURES = ["VizDisplayCompositor"]
+
+# Extra trimming for read-only commands, opted into with XPOST_FAST_CHROME=1
+_SCRAPE_DISABLED_FEATURES = [
+    "Translate",
+    "BackForwardCache",
+    "AcceptCHFrame",
+    "MediaRouter",
+    "OptimizationHints",
+]
+_SCRAPE_ARGS = [
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--blink-settings=imagesEnabled=false",
+]
 
 
 class ChromeError(Exception):
@@ -58,6 +74,7 @@ class ChromeSession:
         target_id: The page target ID
         process: The Chrome subprocess (None if reusing existing)
         port: The CDP debugging port
+        stderr_task: Task draining the subprocess's stderr pipe
     """
 
     def __init__(
@@ -65,9 +82,10 @@ class ChromeSession:
         cdp: CdpClient,
         session_id: str,
         target_id: str,
-        process: Optional[subprocess.Popen] = None,
+        process: Optional[asyncio.subprocess.Process] = None,
         port: int = 0,
         profile_dir: str = "",
+        stderr_task: Optional[asyncio.Task] = None,
     ):
         self.cdp = cdp
         self.session_id = session_id
@@ -75,6 +93,7 @@ class ChromeSession:
         self.process = process
         self.port = port
         self.profile_dir = profile_dir
+        self.stderr_task = stderr_task
         self._cleaned_up = False
 
     async def evaluate(self, expression: str, await_promise: bool = False) -> Any:
@@ -98,7 +117,7 @@ class ChromeSession:
 
     async def navigate(self, url: str, wait_event: str = "Page.loadEventFired", timeout: float = 30.0) -> None:
         """Navigate to URL and wait for page load."""
-        load_future = asyncio.get_event_loop().create_future()
+        load_future = asyncio.get_running_loop().create_future()
 
         def on_load(params: dict) -> None:
             if not load_future.done():
@@ -126,20 +145,72 @@ class ChromeSession:
 
         if self.process:
             try:
-                self.process.terminate()
-                try:
-                    self.process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self.process.kill()
-                    self.process.wait(timeout=3)
+                await _terminate_process_group(self.process)
             except Exception:
                 pass
             logger.debug("Chrome process terminated")
 
+        if self.stderr_task:
+            self.stderr_task.cancel()
+
+
+def _same_page_url(a: str, b: str) -> bool:
+    """Compare two page URLs, ignoring a fragment and a trailing slash."""
+    return a.split("#", 1)[0].rstrip("/") == b.split("#", 1)[0].rstrip("/")
 
+
+async def _terminate_process_group(
+    process: asyncio.subprocess.Process, grace: float = 1.0
+) -> None:
+    """Stop Chrome and its helper processes via Chrome's process group.
+
+    Sends SIGTERM to the whole group, then SIGKILL if Chrome hasn't
+    exited within the grace period.
+    """
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), timeout=grace)
+    except asyncio.TimeoutError:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            return
+        await asyncio.wait_for(process.wait(), timeout=1.0)
+
+
+def _kill_process_group_at_exit(
+    process: asyncio.subprocess.Process, grace: float = 1.0
+) -> None:
+    """Synchronous teardown for atexit, when no event loop is running."""
+    if process.returncode is not None:
+        return  # Already reaped by cleanup(); the group ID may be reused
+    pgid = process.pid
+    try:
+        os.killpg(pgid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    deadline = time.monotonic() + grace
+    while time.monotonic() < deadline:
+        try:
+            os.killpg(pgid, 0)
+        except ProcessLookupError:
+            return
+        time.sleep(0.05)
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+@functools.lru_cache(maxsize=4)
 def find_chrome(chrome_path: Optional[str] = None) -> str:
     """Find Chrome executable on macOS.
 
+    Results are memoized per process; failures are not cached.
+
     Args:
         chrome_path: Optional explicit path override.
                      Also checks CHROME_PATH environment variable.
@@ -199,23 +270,56 @@ def _clean_devtools_port_file(profile_dir: str) -> None:
 async def _probe_cdp_http(port: int, timeout: float = 2.0) -> Optional[Dict]:
     """Probe Chrome CDP HTTP endpoint.
 
+    Issues a minimal HTTP/1.1 request over asyncio streams so each probe
+    stays on the event loop instead of hopping to a worker thread.
+
     Returns:
         Version info dict if successful, None otherwise
     """
-    url = f"http://127.0.0.1:{port}/json/version"
-
-    def _do_request() -> Optional[Dict]:
+    async def _do_request() -> Optional[Dict]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
         try:
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                if resp.status == 200:
-                    return json.loads(resp.read().decode("utf-8"))
-        except Exception:
-            pass
+            writer.write(
+                b"GET /json/version HTTP/1.1\r\n"
+                b"Host: 127.0.0.1\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            await writer.drain()
+
+            head = await reader.readuntil(b"\r\n\r\n")
+            lines = head.decode("latin-1").split("\r\n")
+            status = lines[0].split(" ", 2)
+            if len(status) < 2 or status[1] != "200":
+                return None
+
+            length = None
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value.strip())
+                    break
+
+            body = await (reader.readexactly(length) if length is not None else reader.read())
+            return json.loads(body.decode("utf-8"))
+        finally:
+            writer.close()
+
+    try:
+        return await asyncio.wait_for(_do_request(), timeout=timeout)
+    except Exception:
         return None
 
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, _do_request)
+
+async def _is_port_open(port: int, timeout: float = 0.1) -> bool:
+    """Check whether something is listening on the local port."""
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection("127.0.0.1", port), timeout=timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
 
 
 async def _find_existing_instance(profile_dir: str) -> Optional[Tuple[int, Dict]]:
@@ -242,9 +346,20 @@ async def _find_existing_instance(profile_dir: str) -> Optional[Tuple[int, Dict]
     return None
 
 
+async def _drain_stderr(process: asyncio.subprocess.Process) -> None:
+    """Read and discard Chrome's stderr until it closes.
+
+    The pipe is only read for the error message of a failed launch; once
+    Chrome is up it has to be kept empty, or a long-lived Chrome (the
+    daemon's) blocks writing its log once the pipe buffer fills.
+    """
+    while await process.stderr.read(65536):
+        pass
+
+
 async def _wait_for_cdp_ready(
     port: int,
-    process: Optional[subprocess.Popen],
+    process: Optional[asyncio.subprocess.Process],
     total_timeout: float = 30.0,
 ) -> Dict:
     """Wait for Chrome CDP endpoint to become ready.
@@ -263,8 +378,8 @@ async def _wait_for_cdp_ready(
         ChromeError: If Chrome process exits or timeout reached
     """
     start = time.monotonic()
-    delay = 0.1  # Start at 100ms
-    max_delay = 3.0
+    delay = 0.025  # Start at 25ms; warm profiles are often ready in ~200-400ms
+    max_delay = 0.5
     attempt = 0
 
     while (time.monotonic() - start) < total_timeout:
@@ -272,11 +387,14 @@ async def _wait_for_cdp_ready(
 
         # Check if Chrome process is still alive
         if process is not None:
-            retcode = process.poll()
+            retcode = process.returncode
             if retcode is not None:
                 stderr_output = ""
                 try:
-                    stderr_output = process.stderr.read().decode("utf-8", errors="replace")
+                    stderr_bytes = await asyncio.wait_for(
+                        process.stderr.read(16384), timeout=1.0
+                    )
+                    stderr_output = stderr_bytes.decode("utf-8", errors="replace")
                 except Exception:
                     pass
                 raise ChromeError(
@@ -284,8 +402,10 @@ async def _wait_for_cdp_ready(
                     f"stderr: {stderr_output[:1000]}"
                 )
 
-        # Probe HTTP endpoint
-        version_info = await _probe_cdp_http(port, timeout=min(delay, 2.0))
+        # Only issue the HTTP request once the debugging port accepts connections
+        version_info = None
+        if await _is_port_open(port):
+            version_info = await _probe_cdp_http(port, timeout=1.0)
         if version_info:
             elapsed = time.monotonic() - start
             logger.info(
@@ -313,6 +433,7 @@ async def launch_chrome(
     profile_dir: Optional[str] = None,
     chrome_path: Optional[str] = None,
     reuse_existing: bool = True,
+    scrape_mode: bool = False,
 ) -> ChromeSession:
     """Launch Chrome with CDP and return a connected session.
 
@@ -328,6 +449,9 @@ async def launch_chrome(
         profile_dir: Chrome user data directory for persistent sessions
         chrome_path: Optional explicit Chrome executable path
         reuse_existing: Whether to try reusing an existing Chrome instance
+        scrape_mode: Caller only reads pages; if XPOST_FAST_CHROME=1, a
+            newly launched Chrome skips extensions, images and other
+            features that reading does not need
 
     Returns:
         ChromeSession with CDP client and session ID
@@ -340,6 +464,7 @@ async def launch_chrome(
 
     chrome_exe = find_chrome(chrome_path)
     process = None
+    stderr_task = None
     port = 0
 
     # Step 1: Try to reuse existing instance
@@ -360,12 +485,16 @@ async def launch_chrome(
         logger.info("Allocated port %d for Chrome CDP", port)
 
         # Step 4: Build Chrome launch arguments
+        fast = scrape_mode and os.environ.get("XPOST_FAST_CHROME") == "1"
+        disabled_features = _DISABLED_FEATURES + (
+            _SCRAPE_DISABLED_FEATURES if fast else []
+        )
         args = [
             chrome_exe,
             f"--remote-debugging-port={port}",
             f"--user-data-dir={profile_dir}",
             "--disable-blink-features=AutomationControlled",
-            "--disable-features=VizDisplayCompositor",
+            f"--disable-features={','.join(disabled_features)}",
             "--no-first-run",
             "--no-default-browser-check",
             "--disable-background-networking",
@@ -373,6 +502,7 @@ async def launch_chrome(
             "--disable-translate",
             "--metrics-recording-only",
             "--safebrowsing-disable-auto-update",
+            *(_SCRAPE_ARGS if fast else []),
             url,
         ]
 
@@ -380,13 +510,16 @@ async def launch_chrome(
         port_sock.close()
 
         logger.info("Launching Chrome: %s", chrome_exe)
-        logger.debug("Chrome args: %s", " ".join(args))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Chrome args: %s", " ".join(args))
 
         try:
-            process = subprocess.Popen(
-                args,
-                stdout=subprocess.PIPE,
+            # Own process group, so teardown reaches the renderer/GPU helpers too
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
+                start_new_session=True,
             )
         except FileNotFoundError:
             raise ChromeError(f"Chrome executable not found: {chrome_exe}")
@@ -394,20 +527,11 @@ async def launch_chrome(
             raise ChromeError(f"Permission denied launching Chrome: {chrome_exe}")
 
         # Register cleanup on exit
-        def _cleanup_on_exit():
-            try:
-                process.terminate()
-                process.wait(timeout=3)
-            except Exception:
-                try:
-                    process.kill()
-                except Exception:
-                    pass
-
-        atexit.register(_cleanup_on_exit)
+        atexit.register(_kill_process_group_at_exit, process)
 
         # Step 6: Wait for CDP to become ready
         version_info = await _wait_for_cdp_ready(port, process)
+        stderr_task = asyncio.create_task(_drain_stderr(process))
 
     # Step 7: Connect CDP WebSocket
     ws_url = version_info.get("webSocketDebuggerUrl", "")
@@ -450,14 +574,16 @@ async def launch_chrome(
     session_id = attach_result["sessionId"]
 
     # Step 10: Enable necessary CDP domains
-    await cdp.send("Page.enable", session_id=session_id)
-    await cdp.send("DOM.enable", session_id=session_id)
-    await cdp.send("Runtime.enable", session_id=session_id)
+    await cdp.send_many(
+        [("Page.enable", None), ("DOM.enable", None), ("Runtime.enable", None)],
+        session_id=session_id,
+    )
 
-    # Navigate to URL if we reused an existing blank page
+    # Navigate to URL if the reused page is somewhere else (a blank tab,
+    # or a page left behind by an earlier command on a shared Chrome)
     if page_target and url != "about:blank":
         current_url = page_target.get("url", "")
-        if current_url != url and current_url in ("about:blank", "chrome://newtab/", ""):
+        if not _same_page_url(url, current_url):
             session = ChromeSession(
                 cdp=cdp,
                 session_id=session_id,
@@ -465,6 +591,7 @@ async def launch_chrome(
                 process=process,
                 port=port,
                 profile_dir=profile_dir,
+                stderr_task=stderr_task,
             )
             await session.navigate(url)
             return session
@@ -476,6 +603,7 @@ async def launch_chrome(
         process=process,
         port=port,
         profile_dir=profile_dir,
+        stderr_task=stderr_task,
     )
 
     logger.info("Chrome session ready (port=%d, target=%s)", port, target_id)
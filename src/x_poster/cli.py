@@ -1,21 +1,56 @@
 """
 CLI main entry point for x-poster.
 
-Registers all subcommands: post, video, quote, article, read, timeline, search, check.
+Registers all subcommands: post, video, quote, article, read, timeline, search, check, serve.
+Subcommand modules are imported lazily, only when the command is invoked.
 """
 
 from __future__ import annotations
 
 import asyncio
+import importlib
 import logging
 import sys
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import click
 
 from . import __version__
 
 
+# Subcommand name -> (module under x_poster.commands, attribute name)
+_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "post": ("post", "post"),
+    "video": ("video", "video"),
+    "quote": ("quote", "quote"),
+    "reply": ("reply", "reply"),
+    "article": ("article", "article"),
+    "read": ("read", "read_tweet"),
+    "timeline": ("timeline", "timeline"),
+    "search": ("search", "search"),
+    "check": ("check", "check"),
+    "serve": ("serve", "serve"),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module on first lookup.
+
+    Keeps `xpost <cmd>` from importing the Chrome/CDP/Markdown stacks of
+    every other command at startup.
+    """
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(_COMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in _COMMANDS:
+            return None
+        module_name, attr = _COMMANDS[cmd_name]
+        module = importlib.import_module(f".commands.{module_name}", __package__)
+        return getattr(module, attr)
+
+
 def _setup_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
@@ -25,7 +60,7 @@ def _setup_logging(verbose: bool) -> None:
     )
 
 
-@click.group()
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="xpost")
 @click.option(
     "--profile",
@@ -53,30 +88,30 @@ def cli(ctx: click.Context, profile: Optional[str], chrome_path: Optional[str],
     ctx.obj["chrome_path"] = chrome_path
 
 
-# Import and register subcommands
-from .commands.post import post
-from .commands.video import video
-from .commands.quote import quote
-from .commands.reply import reply
-from .commands.article import article
-from .commands.read import read_tweet
-from .commands.timeline import timeline
-from .commands.search import search
-from .commands.check import check
-
-cli.add_command(post)
-cli.add_command(video)
-cli.add_command(quote)
-cli.add_command(reply)
-cli.add_command(article)
-cli.add_command(read_tweet)
-cli.add_command(timeline)
-cli.add_command(search)
-cli.add_command(check)
+def _install_uvloop() -> None:
+    """Use uvloop for all asyncio.run() calls if it is installed."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main() -> None:
-    """Entry point for the CLI."""
+    """Entry point for the CLI.
+
+    Hands the command line to a running `xpost serve` daemon when it can
+    take it, and only runs it in this process otherwise.
+    """
+    from .daemon_client import run_via_daemon
+
+    code = run_via_daemon(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+    _install_uvloop()
     cli()
 
 
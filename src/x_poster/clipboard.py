@@ -2,24 +2,37 @@
 macOS clipboard operations via Swift/AppKit.
 
 Compiles Swift source code to a binary that can write images or HTML
-to the macOS system clipboard. The binary is cached using MD5 hash
-of the source to avoid recompilation.
+to the macOS system clipboard. The binary is cached using a BLAKE2b hash
+of the source (computed once at import) to avoid recompilation.
+
+Copies go through a long-lived clipboard daemon on a Unix socket when
+possible, falling back to the one-shot helpers if it cannot be started.
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
 import os
+import socket
 import subprocess
-import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 CACHE_DIR = os.path.expanduser("~/.cache/x-poster/clipboard")
 
+# Read-only, machine-wide directory of prebuilt helpers (e.g. installed by
+# an administrator); binaries are named like the per-user cache entries
+SYSTEM_CACHE_DIR = "/usr/local/share/x-poster/clipboard-cache"
+
+# Resolved binary paths by helper name, so warm calls skip the filesystem
+_COMPILED_BINARIES: Dict[str, str] = {}
+
 # Swift source for image clipboard operations
 SWIFT_IMAGE_SOURCE = """\
 import AppKit
@@ -64,14 +77,22 @@ import Foundation
 
 let args = CommandLine.arguments
 guard args.count >= 2 else {
-    fputs("Usage: clipboard-html <html-string-or-file-path>\\n", stderr)
+    fputs("Usage: clipboard-html (<html-string> | --file <path> | --stdin) [--with-rtf]\\n", stderr)
     exit(1)
 }
+let withRTF = args.dropFirst(2).contains("--with-rtf")
 
 var htmlContent: String
 let input = args[1]
 
-if input == "--file" && args.count >= 3 {
+if input == "--stdin" {
+    let data = FileHandle.standardInput.readDataToEndOfFile()
+    guard let content = String(data: data, encoding: .utf8) else {
+        fputs("Error: Cannot decode stdin as UTF-8\\n", stderr)
+        exit(1)
+    }
+    htmlContent = content
+} else if input == "--file" && args.count >= 3 {
     let filePath = args[2]
     guard let data = FileManager.default.contents(atPath: filePath),
           let content = String(data: data, encoding: .utf8) else {
@@ -91,8 +112,9 @@ if let htmlData = htmlContent.data(using: .utf8) {
     pb.setData(htmlData, forType: .html)
 }
 
-// Also set as RTF for rich text paste compatibility
-if let attrStr = try? NSAttributedString(
+// Optionally set RTF for rich text paste compatibility. This parses the
+// HTML with WebKit, which dominates the cost for large documents.
+if withRTF, let attrStr = try? NSAttributedString(
     data: htmlContent.data(using: .utf8)!,
     options: [.documentType: NSAttributedString.DocumentType.html,
               .characterEncoding: String.Encoding.utf8.rawValue],
@@ -113,27 +135,235 @@ pb.setString(htmlContent, forType: .string)
 print("HTML copied to clipboard")
 """
 
+# Swift source for the long-lived clipboard daemon. It serves requests on a
+# Unix socket so repeated copies skip process spawn and AppKit startup.
+#
+# Protocol (one request per connection):
+# - Request:  "<IMG|HTML|HTMLFILE> <byte-length>[ rtf]\n" followed by the
+#             payload (an image path, HTML content, or an HTML file path);
+#             "rtf" also puts an RTF rendering of HTML on the clipboard
+# - Response: "OK\n" or "ERR <message>\n"
+SWIFT_DAEMON_SOURCE = """\
+import AppKit
+import Foundation
+
+let args = CommandLine.arguments
+guard args.count >= 2 else {
+    fputs("Usage: clipboard-daemon <socket-path>\\n", stderr)
+    exit(1)
+}
+let socketPath = args[1]
+let idleTimeoutMs: Int32 = 10 * 60 * 1000
+
+func copyImage(_ imagePath: String) -> String? {
+    guard let image = NSImage(contentsOfFile: imagePath) else {
+        return "Cannot load image: \\(imagePath)"
+    }
+    guard let tiffData = image.tiffRepresentation,
+          let bitmapRep = NSBitmapImageRep(data: tiffData),
+          let pngData = bitmapRep.representation(using: .png, properties: [:]) else {
+        return "Cannot convert image to PNG"
+    }
+    let pb = NSPasteboard.general
+    pb.clearContents()
+    pb.setData(pngData, forType: .png)
+    pb.setData(tiffData, forType: .tiff)
+    pb.writeObjects([URL(fileURLWithPath: imagePath) as NSURL])
+    return nil
+}
+
+func copyHTML(_ htmlContent: String, withRTF: Bool) -> String? {
+    guard let htmlData = htmlContent.data(using: .utf8) else {
+        return "Invalid HTML encoding"
+    }
+    let pb = NSPasteboard.general
+    pb.clearContents()
+    pb.setData(htmlData, forType: .html)
+    if withRTF, let attrStr = try? NSAttributedString(
+        data: htmlData,
+        options: [.documentType: NSAttributedString.DocumentType.html,
+                  .characterEncoding: String.Encoding.utf8.rawValue],
+        documentAttributes: nil
+    ), let rtfData = try? attrStr.data(
+        from: NSRange(location: 0, length: attrStr.length),
+        documentAttributes: [.documentType: NSAttributedString.DocumentType.rtf]
+    ) {
+        pb.setData(rtfData, forType: .rtf)
+    }
+    pb.setString(htmlContent, forType: .string)
+    return nil
+}
+
+final class Connection {
+    let fd: Int32
+    var buffer = Data()
+
+    init(fd: Int32) { self.fd = fd }
+
+    func fill() -> Bool {
+        var chunk = [UInt8](repeating: 0, count: 65536)
+        let n = read(fd, &chunk, chunk.count)
+        if n <= 0 { return false }
+        buffer.append(contentsOf: chunk[0..<n])
+        return true
+    }
+
+    func readLine() -> String? {
+        while true {
+            if let idx = buffer.firstIndex(of: 0x0A) {
+                let line = buffer[buffer.startIndex..<idx]
+                buffer.removeSubrange(buffer.startIndex...idx)
+                return String(data: line, encoding: .utf8)
+            }
+            if !fill() { return nil }
+        }
+    }
+
+    func readExactly(_ count: Int) -> Data? {
+        while buffer.count < count {
+            if !fill() { return nil }
+        }
+        let data = Data(buffer.prefix(count))
+        buffer.removeFirst(count)
+        return data
+    }
+
+    func reply(_ line: String) {
+        let bytes = Array((line + "\\n").utf8)
+        _ = bytes.withUnsafeBytes { write(fd, $0.baseAddress, bytes.count) }
+    }
+}
+
+func handle(_ conn: Connection) {
+    guard let header = conn.readLine() else { return }
+    let parts = header.split(separator: " ").map(String.init)
+    guard parts.count >= 2, let length = Int(parts[1]),
+          let payload = conn.readExactly(length),
+          let text = String(data: payload, encoding: .utf8) else {
+        conn.reply("ERR Malformed request")
+        return
+    }
+    let withRTF = parts.dropFirst(2).contains("rtf")
+    let error: String?
+    switch parts[0] {
+    case "IMG":
+        error = copyImage(text)
+    case "HTML":
+        error = copyHTML(text, withRTF: withRTF)
+    case "HTMLFILE":
+        if let data = FileManager.default.contents(atPath: text),
+           let content = String(data: data, encoding: .utf8) {
+            error = copyHTML(content, withRTF: withRTF)
+        } else {
+            error = "Cannot read file: \\(text)"
+        }
+    default:
+        error = "Unknown command: \\(parts[0])"
+    }
+    conn.reply(error.map { "ERR " + $0 } ?? "OK")
+}
+
+signal(SIGPIPE, SIG_IGN)
+
+let serverFd = socket(AF_UNIX, SOCK_STREAM, 0)
+guard serverFd >= 0 else {
+    perror("socket")
+    exit(1)
+}
+
+var addr = sockaddr_un()
+addr.sun_family = sa_family_t(AF_UNIX)
+let pathBytes = Array(socketPath.utf8CString)
+guard pathBytes.count <= MemoryLayout.size(ofValue: addr.sun_path) else {
+    fputs("Error: Socket path too long: \\(socketPath)\\n", stderr)
+    exit(1)
+}
+withUnsafeMutableBytes(of: &addr.sun_path) { dst in
+    pathBytes.withUnsafeBytes { src in dst.copyMemory(from: src) }
+}
+
+unlink(socketPath)
+let bound = withUnsafePointer(to: &addr) {
+    $0.withMemoryRebound(to: sockaddr.self, capacity: 1) {
+        bind(serverFd, $0, socklen_t(MemoryLayout<sockaddr_un>.size))
+    }
+}
+guard bound == 0, listen(serverFd, 16) == 0 else {
+    perror("bind")
+    exit(1)
+}
+chmod(socketPath, 0o600)
+
+// Serve requests one at a time; exit after a period of inactivity
+while true {
+    var pfd = pollfd(fd: serverFd, events: Int16(POLLIN), revents: 0)
+    let ready = poll(&pfd, 1, idleTimeoutMs)
+    if ready == 0 { break }
+    if ready < 0 { continue }
+    let clientFd = accept(serverFd, nil, nil)
+    if clientFd < 0 { continue }
+    autoreleasepool {
+        handle(Connection(fd: clientFd))
+    }
+    close(clientFd)
+}
+
+unlink(socketPath)
+"""
 
-def _get_cache_path(source: str, name: str) -> str:
+
+def _source_hash(source: str) -> str:
+    """Short content hash of Swift source, used in cached binary names."""
+    return hashlib.blake2b(source.encode(), digest_size=6).hexdigest()
+
+
+SWIFT_IMAGE_HASH = _source_hash(SWIFT_IMAGE_SOURCE)
+SWIFT_HTML_HASH = _source_hash(SWIFT_HTML_SOURCE)
+SWIFT_DAEMON_HASH = _source_hash(SWIFT_DAEMON_SOURCE)
+
+# How long to wait for a freshly launched daemon to accept connections
+DAEMON_START_TIMEOUT = 5.0
+
+
+@functools.lru_cache(maxsize=None)
+def _toolchain_tag() -> str:
+    """Short hash of the Swift compiler version and macOS build.
+
+    Binaries are cached per toolchain so an Xcode or macOS upgrade
+    triggers a rebuild instead of reusing a stale binary.
+    """
+    parts = []
+    for cmd in (["swiftc", "--version"], ["sw_vers", "-buildVersion"]):
+        try:
+            parts.append(subprocess.run(
+                cmd, capture_output=True, timeout=10
+            ).stdout.strip())
+        except (OSError, subprocess.SubprocessError):
+            parts.append(b"")
+    return hashlib.blake2b(b"\n".join(parts), digest_size=4).hexdigest()
+
+
+def _get_cache_path(source_hash: str, name: str) -> str:
     """Get the cache path for a compiled Swift binary.
 
     Args:
-        source: Swift source code
+        source_hash: Precomputed hash of the Swift source
         name: Binary name prefix
 
     Returns:
         Path to the cached binary
     """
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    source_hash = hashlib.md5(source.encode()).hexdigest()[:12]
-    return os.path.join(CACHE_DIR, f"{name}-{source_hash}")
+    cache_dir = os.path.join(CACHE_DIR, _toolchain_tag())
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{name}-{source_hash}")
 
 
-def _ensure_compiled(source: str, name: str) -> str:
+def _ensure_compiled(source: str, source_hash: str, name: str) -> str:
     """Compile Swift source to binary if not already cached.
 
     Args:
         source: Swift source code
+        source_hash: Precomputed hash of the source (e.g. SWIFT_IMAGE_HASH)
         name: Binary name prefix
 
     Returns:
@@ -142,24 +372,38 @@ def _ensure_compiled(source: str, name: str) -> str:
     Raises:
         RuntimeError: If compilation fails
     """
-    binary_path = _get_cache_path(source, name)
+    cached = _COMPILED_BINARIES.get(name)
+    if cached is not None:
+        return cached
+
+    binary_path = _get_cache_path(source_hash, name)
 
     if os.path.isfile(binary_path) and os.access(binary_path, os.X_OK):
         logger.debug("Using cached binary: %s", binary_path)
+        _COMPILED_BINARIES[name] = binary_path
         return binary_path
 
-    logger.info("Compiling Swift clipboard helper: %s", name)
+    # Link a matching prebuilt helper instead of compiling
+    system_binary = os.path.join(SYSTEM_CACHE_DIR, f"{name}-{source_hash}")
+    if os.path.isfile(system_binary) and os.access(system_binary, os.X_OK):
+        try:
+            os.symlink(system_binary, binary_path)
+        except FileExistsError:
+            pass  # another process linked or compiled it first
+        logger.debug("Using system-wide binary: %s", system_binary)
+        _COMPILED_BINARIES[name] = binary_path
+        return binary_path
 
-    # Write source to temp file
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".swift", delete=False
-    ) as f:
-        f.write(source)
-        source_file = f.name
+    logger.info("Compiling Swift clipboard helper: %s", name)
 
+    # Compile to a private path and rename into place, so a concurrent
+    # x-poster process never sees a partially written binary
+    tmp_binary = f"{binary_path}.{os.getpid()}.tmp"
     try:
+        # "-" makes swiftc read the source from stdin
         result = subprocess.run(
-            ["swiftc", "-O", "-o", binary_path, source_file],
+            ["swiftc", "-O", "-o", tmp_binary, "-"],
+            input=source,
             capture_output=True,
             text=True,
             timeout=60,
@@ -168,11 +412,141 @@ def _ensure_compiled(source: str, name: str) -> str:
             raise RuntimeError(
                 f"Swift compilation failed:\n{result.stderr}"
             )
-        os.chmod(binary_path, 0o755)
-        logger.info("Compiled: %s", binary_path)
-        return binary_path
+        os.chmod(tmp_binary, 0o755)
+        os.replace(tmp_binary, binary_path)
     finally:
-        os.unlink(source_file)
+        if os.path.exists(tmp_binary):
+            os.unlink(tmp_binary)
+    logger.info("Compiled: %s", binary_path)
+    _COMPILED_BINARIES[name] = binary_path
+    return binary_path
+
+
+def ensure_all_compiled() -> List[str]:
+    """Compile every clipboard helper that is not cached yet, in parallel.
+
+    Each swiftc run takes a second or more, so doing this up front avoids
+    a compile stall the first time a particular helper is needed.
+
+    Returns:
+        Paths of the image, HTML and daemon binaries
+
+    Raises:
+        RuntimeError: If any compilation fails
+    """
+    helpers = [
+        (SWIFT_IMAGE_SOURCE, SWIFT_IMAGE_HASH, "clipboard-image"),
+        (SWIFT_HTML_SOURCE, SWIFT_HTML_HASH, "clipboard-html"),
+        (SWIFT_DAEMON_SOURCE, SWIFT_DAEMON_HASH, "clipboard-daemon"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(helpers)) as executor:
+        return list(executor.map(lambda h: _ensure_compiled(*h), helpers))
+
+
+def warm_up() -> None:
+    """Get clipboard copies ready without touching the clipboard.
+
+    Starts the clipboard daemon (compiling it if needed), or compiles the
+    one-shot image helper if the daemon is unavailable, so the first real
+    copy does not pay that cost.
+
+    Raises:
+        RuntimeError: If the helper cannot be compiled
+    """
+    try:
+        _get_socket().close()
+    except OSError as e:
+        logger.debug("Clipboard daemon unavailable, warming one-shot helper: %s", e)
+        _ensure_compiled(SWIFT_IMAGE_SOURCE, SWIFT_IMAGE_HASH, "clipboard-image")
+
+
+def _daemon_socket_path() -> str:
+    """Socket path for the clipboard daemon, unique per daemon source."""
+    return os.path.join(CACHE_DIR, f"clipboard-daemon-{SWIFT_DAEMON_HASH}.sock")
+
+
+def _connect(path: str) -> Optional[socket.socket]:
+    """Connect to the daemon socket, or return None if nobody is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _get_socket() -> socket.socket:
+    """Connect to the clipboard daemon, launching it if needed.
+
+    Raises:
+        OSError: If the daemon cannot be started
+        RuntimeError: If the daemon cannot be compiled
+    """
+    path = _daemon_socket_path()
+    sock = _connect(path)
+    if sock is not None:
+        return sock
+
+    binary = _ensure_compiled(SWIFT_DAEMON_SOURCE, SWIFT_DAEMON_HASH, "clipboard-daemon")
+    logger.debug("Starting clipboard daemon: %s", path)
+    subprocess.Popen(
+        [binary, path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.02)
+        sock = _connect(path)
+        if sock is not None:
+            return sock
+    raise OSError(f"Clipboard daemon did not start: {path}")
+
+
+def _daemon_request(
+    command: str, payload: str, timeout: float, flags: Tuple[str, ...] = ()
+) -> Optional[str]:
+    """Send one request to the clipboard daemon.
+
+    Returns:
+        None on success, the daemon's error message on failure
+
+    Raises:
+        OSError: If the daemon is unreachable (callers fall back to the
+            one-shot helpers)
+    """
+    data = payload.encode("utf-8")
+    with _get_socket() as sock:
+        sock.settimeout(timeout)
+        header = " ".join([command, str(len(data)), *flags])
+        sock.sendall(f"{header}\n".encode() + data)
+        with sock.makefile("rb") as reply_file:
+            reply = reply_file.readline().decode("utf-8", "replace").rstrip("\n")
+    if reply == "OK":
+        return None
+    if reply.startswith("ERR "):
+        return reply[4:]
+    raise OSError(f"Unexpected clipboard daemon reply: {reply!r}")
+
+
+def _try_daemon(
+    command: str, payload: str, timeout: float, flags: Tuple[str, ...] = ()
+) -> Optional[str]:
+    """Run a daemon request, returning "" if the daemon is unavailable.
+
+    Returns:
+        None on success, an error message on failure, or "" if the
+        caller should use the one-shot helper instead
+    """
+    try:
+        return _daemon_request(command, payload, timeout, flags)
+    except (OSError, RuntimeError) as e:
+        logger.debug("Clipboard daemon unavailable, using one-shot helper: %s", e)
+        return ""
 
 
 def copy_image(image_path: str) -> None:
@@ -189,53 +563,78 @@ def copy_image(image_path: str) -> None:
     if not os.path.isfile(image_path):
         raise FileNotFoundError(f"Image not found: {image_path}")
 
-    binary = _ensure_compiled(SWIFT_IMAGE_SOURCE, "clipboard-image")
+    error = _try_daemon("IMG", image_path, timeout=10)
+    if error is None:
+        logger.debug("Image copied to clipboard: %s", image_path)
+        return
+    if error:
+        raise RuntimeError(f"Failed to copy image to clipboard: {error}")
+
+    binary = _ensure_compiled(SWIFT_IMAGE_SOURCE, SWIFT_IMAGE_HASH, "clipboard-image")
 
+    # stdout is unused and stderr is only decoded on failure
     result = subprocess.run(
         [binary, image_path],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         timeout=10,
     )
 
     if result.returncode != 0:
         raise RuntimeError(
-            f"Failed to copy image to clipboard: {result.stderr}"
+            f"Failed to copy image to clipboard: {result.stderr.decode(errors='replace')}"
         )
     logger.debug("Image copied to clipboard: %s", image_path)
 
 
-def copy_html(html: str, from_file: bool = False) -> None:
+def copy_html(html: str, from_file: bool = False, with_rtf: bool = False) -> None:
     """Copy HTML content to the macOS system clipboard.
 
-    Sets HTML, RTF, and plain text representations.
+    Sets HTML and plain text representations, plus RTF if requested.
 
     Args:
         html: HTML string or file path (if from_file=True)
         from_file: If True, treat html as a file path
+        with_rtf: Also set RTF, for targets that don't accept HTML. Off by
+            default since converting HTML to RTF is slow for large content.
 
     Raises:
         RuntimeError: If clipboard operation fails
     """
-    binary = _ensure_compiled(SWIFT_HTML_SOURCE, "clipboard-html")
+    if from_file:
+        html = os.path.abspath(html)
+        if not os.path.isfile(html):
+            raise FileNotFoundError(f"HTML file not found: {html}")
+
+    error = _try_daemon(
+        "HTMLFILE" if from_file else "HTML", html, timeout=15,
+        flags=("rtf",) if with_rtf else (),
+    )
+    if error is None:
+        logger.debug("HTML copied to clipboard")
+        return
+    if error:
+        raise RuntimeError(f"Failed to copy HTML to clipboard: {error}")
 
+    binary = _ensure_compiled(SWIFT_HTML_SOURCE, SWIFT_HTML_HASH, "clipboard-html")
     if from_file:
-        html_path = os.path.abspath(html)
-        if not os.path.isfile(html_path):
-            raise FileNotFoundError(f"HTML file not found: {html_path}")
-        args = [binary, "--file", html_path]
+        args, stdin = [binary, "--file", html], None
     else:
-        args = [binary, html]
+        # Stream the body on stdin; large articles can exceed ARG_MAX as argv
+        args, stdin = [binary, "--stdin"], html.encode("utf-8")
+    if with_rtf:
+        args.append("--with-rtf")
 
     result = subprocess.run(
         args,
-        capture_output=True,
-        text=True,
+        input=stdin,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         timeout=15,
     )
 
     if result.returncode != 0:
         raise RuntimeError(
-            f"Failed to copy HTML to clipboard: {result.stderr}"
+            f"Failed to copy HTML to clipboard: {result.stderr.decode(errors='replace')}"
         )
     logger.debug("HTML copied to clipboard")
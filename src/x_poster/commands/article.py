@@ -13,6 +13,7 @@ Converts Markdown to HTML and publishes as an X Article:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import time
@@ -21,11 +22,13 @@ from typing import Optional
 import click
 
 from ..chrome import ChromeSession, launch_chrome
-from ..clipboard import copy_html, copy_image
+from ..clipboard import copy_html, copy_image, ensure_all_compiled
 from ..constants import LOGIN_INDICATOR
 from ..markdown_converter import ParsedArticle, parse_markdown
 from ..page import PageHelper
-from ..paste import send_paste
+from ..paste import send_paste_async
+from ..paste import warm_up as warm_up_paste
+from ..utils import login_prompt, wait_for_interrupt
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +36,37 @@ logger = logging.getLogger(__name__)
 ARTICLE_EDITOR = '[data-testid="editor"]'  # DraftJS editor
 ARTICLE_TITLE = '[data-testid="articleTitle"], [placeholder*="Title"], [data-placeholder*="Title"]'
 ARTICLE_BODY = '[data-contents="true"], [contenteditable="true"]'
+ARTICLE_IMAGES = "figure, img"  # Image blocks inside ARTICLE_BODY
 COVER_UPLOAD_BUTTON = '[data-testid="addCoverPhoto"], [aria-label*="cover"], [aria-label*="Cover"]'
 COVER_APPLY_BUTTON = '[data-testid="applyButton"], [data-testid="confirmationSheetConfirm"]'
 PUBLISH_BUTTON = '[data-testid="publishButton"], [data-testid="tweetButton"]'
 WRITE_BUTTON = '[data-testid="write"], [href*="/compose/articles"]'
 
+# Defines window.__xpDeletePlaceholder(needle): selects the first occurrence
+# of needle in the editor text and deletes it, returning whether it was found
+PLACEHOLDER_DELETE_JS = """
+window.__xpDeletePlaceholder = (needle) => {
+  const walker = document.createTreeWalker(
+    document.querySelector('[contenteditable="true"]') || document.body,
+    NodeFilter.SHOW_TEXT
+  );
+  while (walker.nextNode()) {
+    const idx = walker.currentNode.textContent.indexOf(needle);
+    if (idx >= 0) {
+      const range = document.createRange();
+      range.setStart(walker.currentNode, idx);
+      range.setEnd(walker.currentNode, idx + needle.length);
+      const sel = window.getSelection();
+      sel.removeAllRanges();
+      sel.addRange(range);
+      document.execCommand('delete', false);
+      return true;
+    }
+  }
+  return false;
+};
+"""
+
 
 async def _wait_for_article_editor(page: PageHelper, timeout: float = 60.0) -> None:
     """Wait for the article editor to be ready."""
@@ -47,7 +76,7 @@ async def _wait_for_article_editor(page: PageHelper, timeout: float = 60.0) -> N
             timeout=timeout,
         )
         if selector == LOGIN_INDICATOR or idx == 2:
-            click.echo("🔑 Please log in to X in Chrome...")
+            login_prompt("🔑 Please log in to X in Chrome...")
             await page.wait_for_any_selector(
                 [ARTICLE_BODY, ARTICLE_TITLE], timeout=300.0
             )
@@ -69,7 +98,7 @@ async def _upload_cover_image(page: PageHelper, cover_path: str) -> None:
 
     # Try clicking the cover upload button
     try:
-        await page.click_selector(COVER_UPLOAD_BUTTON, timeout=5.0)
+        await page.click_selector(COVER_UPLOAD_BUTTON, timeout=5.0, trusted=True)
         await asyncio.sleep(1.0)
 
         # Upload via file input
@@ -90,7 +119,7 @@ async def _upload_cover_image(page: PageHelper, cover_path: str) -> None:
         click.echo("  ⚠️  Cover button not found, trying clipboard paste...")
         copy_image(cover_path)
         await asyncio.sleep(0.3)
-        send_paste()
+        await send_paste_async()
         await asyncio.sleep(2.0)
 
 
@@ -157,11 +186,12 @@ async def _paste_html_content(page: PageHelper, html: str) -> bool:
             if success:
                 # Verify content was actually inserted
                 await asyncio.sleep(1.0)
-                text_length = await page.evaluate(
-                    f"(() => {{"
-                    f"  const el = document.querySelector('{selector}');"
-                    f"  return el ? el.textContent.length : 0;"
-                    f"}})()"
+                text_length = await page.call_function(
+                    "function(sel) {"
+                    "  const el = document.querySelector(sel);"
+                    "  return el ? el.textContent.length : 0;"
+                    "}",
+                    selector,
                 )
                 if text_length and text_length > 10:
                     click.echo("✅ Content pasted via ClipboardEvent")
@@ -174,36 +204,44 @@ async def _paste_html_content(page: PageHelper, html: str) -> bool:
     copy_html(html)
     await asyncio.sleep(0.5)
 
-    # Focus the editor
-    for selector in body_selectors:
-        try:
-            await page.evaluate(
-                f"(() => {{"
-                f"  const el = document.querySelector('{selector}');"
-                f"  if (el) el.focus();"
-                f"}})()"
-            )
-            break
-        except RuntimeError:
-            continue
+    # Focus the editor, noting which element it is and how much text it
+    # already holds
+    focused = await page.call_function(
+        "function(sels) {"
+        "  for (let i = 0; i < sels.length; i++) {"
+        "    const el = document.querySelector(sels[i]);"
+        "    if (el) { el.focus(); return [i, el.textContent.length]; }"
+        "  }"
+        "  return null;"
+        "}",
+        body_selectors,
+    )
+    focused_selector = body_selectors[focused[0]] if focused else ARTICLE_BODY
+    initial_length = focused[1] if focused else 0
 
-    send_paste()
-    await asyncio.sleep(2.0)
+    await send_paste_async()
+    await page.wait_for_mutation(
+        focused_selector, min_text_delta=10, timeout=3.0, baseline=initial_length
+    )
 
-    # Check if content appeared
-    for selector in body_selectors:
-        try:
-            text_length = await page.evaluate(
-                f"(() => {{"
-                f"  const el = document.querySelector('{selector}');"
-                f"  return el ? el.textContent.length : 0;"
-                f"}})()"
-            )
-            if text_length and text_length > 10:
-                click.echo("✅ Content pasted via system clipboard")
-                return True
-        except RuntimeError:
-            continue
+    # Check if content appeared, in one evaluate over all selectors
+    try:
+        text_length = await page.call_function(
+            "function(sels, minLength) {"
+            "  for (const s of sels) {"
+            "    const el = document.querySelector(s);"
+            "    if (el && el.textContent.length > minLength) return el.textContent.length;"
+            "  }"
+            "  return 0;"
+            "}",
+            body_selectors,
+            max(initial_length, 10),
+        )
+    except RuntimeError:
+        text_length = 0
+    if text_length:
+        click.echo("✅ Content pasted via system clipboard")
+        return True
 
     click.echo(
         "⚠️  Auto-paste failed. HTML has been copied to your clipboard.\n"
@@ -218,16 +256,18 @@ async def _replace_image_placeholders(
     """Replace XIMGPH_N placeholders with actual images.
 
     For each placeholder:
-    1. Find the placeholder text in the editor
-    2. Select it
-    3. Delete it
-    4. Paste the image via clipboard
+    1. Find the placeholder text in the editor, select and delete it
+       (one CDP call)
+    2. Paste the image via clipboard
     """
     if not article.image_placeholders:
         return
 
     click.echo(f"🖼️  Replacing {len(article.image_placeholders)} image placeholder(s)...")
 
+    # Define the lookup once; each placeholder is then a cheap function call
+    await page.evaluate(PLACEHOLDER_DELETE_JS)
+
     for placeholder, image_path in article.image_placeholders.items():
         if not os.path.isfile(image_path):
             click.echo(f"  ⚠️  Image not found: {image_path}, skipping {placeholder}")
@@ -235,42 +275,44 @@ async def _replace_image_placeholders(
 
         click.echo(f"  📎 {placeholder} -> {os.path.basename(image_path)}")
 
-        # Find and select the placeholder text
-        selected = await page.evaluate(
-            f"(() => {{"
-            f"  const walker = document.createTreeWalker("
-            f"    document.querySelector('[contenteditable=\"true\"]') || document.body,"
-            f"    NodeFilter.SHOW_TEXT"
-            f"  );"
-            f"  while (walker.nextNode()) {{"
-            f"    const idx = walker.currentNode.textContent.indexOf('[{placeholder}]');"
-            f"    if (idx >= 0) {{"
-            f"      const range = document.createRange();"
-            f"      range.setStart(walker.currentNode, idx);"
-            f"      range.setEnd(walker.currentNode, idx + {len(f'[{placeholder}]')});"
-            f"      const sel = window.getSelection();"
-            f"      sel.removeAllRanges();"
-            f"      sel.addRange(range);"
-            f"      return true;"
-            f"    }}"
-            f"  }}"
-            f"  return false;"
-            f"}})()"
+        # Find, select and delete the placeholder text
+        needle = f"[{placeholder}]"
+        deleted = await page.call_function(
+            "function(needle) { return window.__xpDeletePlaceholder(needle); }",
+            needle,
         )
 
-        if not selected:
+        if not deleted:
             click.echo(f"  ⚠️  Placeholder [{placeholder}] not found in editor")
             continue
+        # DraftJS re-renders after the delete; paste once the text is gone
+        await page.wait_for_predicate(
+            f"!document.querySelector({json.dumps(ARTICLE_BODY)})"
+            f".textContent.includes({json.dumps(needle)})",
+            timeout=3.0,
+        )
 
-        # Delete selected text
-        await page.evaluate("document.execCommand('delete', false)")
-        await asyncio.sleep(0.3)
+        # Count images before pasting, so an image that lands before the
+        # wait starts still counts and unrelated mutations don't
+        images_before = await page.call_function(
+            "function(body, images) {"
+            "  return document.querySelector(body).querySelectorAll(images).length;"
+            "}",
+            ARTICLE_BODY,
+            ARTICLE_IMAGES,
+        )
 
-        # Paste image
+        # copy_image returns once the pasteboard is written
         copy_image(image_path)
-        await asyncio.sleep(0.3)
-        send_paste()
-        await asyncio.sleep(1.5)
+        await send_paste_async()
+        # Chrome may read the clipboard late; don't let the next copy
+        # replace it before this image is in the editor
+        if not await page.wait_for_predicate(
+            f"document.querySelector({json.dumps(ARTICLE_BODY)})"
+            f".querySelectorAll({json.dumps(ARTICLE_IMAGES)}).length > {images_before or 0}",
+            timeout=15.0,
+        ):
+            click.echo(f"  ⚠️  {os.path.basename(image_path)} did not appear in the editor")
 
     click.echo("✅ Image placeholders replaced")
 
@@ -285,6 +327,13 @@ async def _run_article(
 ) -> None:
     """Core article implementation."""
     session: Optional[ChromeSession] = None
+    warmed = False
+
+    # Compile the clipboard helpers and start the keystroke helper while
+    # Chrome starts, instead of stalling on them at the first paste
+    loop = asyncio.get_running_loop()
+    compile_future = loop.run_in_executor(None, ensure_all_compiled)
+    paste_future = loop.run_in_executor(None, warm_up_paste)
 
     try:
         # Parse Markdown
@@ -333,6 +382,16 @@ async def _run_article(
         )
         await asyncio.sleep(0.5)
 
+        try:
+            await compile_future
+        except (RuntimeError, OSError) as e:
+            logger.debug("Clipboard helper precompile failed: %s", e)
+        try:
+            await paste_future
+        except (RuntimeError, OSError) as e:
+            logger.debug("Paste warm-up failed: %s", e)
+        warmed = True
+
         # Paste HTML content
         await _paste_html_content(page, article.html)
         await asyncio.sleep(1.0)
@@ -344,10 +403,12 @@ async def _run_article(
         if submit:
             click.echo("📤 Publishing article...")
             try:
-                await page.click_selector(PUBLISH_BUTTON, timeout=5.0)
+                await page.click_selector(PUBLISH_BUTTON, timeout=5.0, trusted=True)
             except TimeoutError:
                 # Try alternative publish buttons
-                await page.click_selector('[data-testid="tweetButton"]', timeout=5.0)
+                await page.click_selector(
+                    '[data-testid="tweetButton"]', timeout=5.0, trusted=True
+                )
             await asyncio.sleep(3.0)
             click.echo("✅ Article published!")
         else:
@@ -360,14 +421,17 @@ async def _run_article(
         click.echo(f"❌ Error: {e}", err=True)
         raise
     finally:
+        if not warmed:
+            # Executor jobs cannot be cancelled; wait for them so their
+            # errors are not reported as never retrieved
+            await asyncio.gather(compile_future, paste_future, return_exceptions=True)
         if session and submit:
             await session.cleanup()
         elif session:
-            click.echo("💡 Chrome window left open for review.")
+            click.echo("💡 Chrome window left open for review. Press Ctrl+C to exit.")
             try:
-                while True:
-                    await asyncio.sleep(1)
-            except (KeyboardInterrupt, asyncio.CancelledError):
+                await wait_for_interrupt()
+            finally:
                 await session.cleanup()
 
 
@@ -12,19 +12,29 @@ Checks:
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
 import shutil
 import subprocess
 import sys
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
 
 import click
 
+try:
+    import psutil
+except ImportError:  # optional: falls back to pgrep
+    psutil = None
+
 from ..chrome import CHROME_PATHS, DEFAULT_PROFILE_DIR, find_chrome
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; PATH does not change while a check runs
+_SWIFTC = shutil.which("swiftc")
+
 
 def _check_chrome() -> Tuple[bool, str]:
     """Check if Chrome is installed and accessible."""
@@ -83,11 +93,11 @@ def _check_accessibility() -> Tuple[bool, str]:
 
 def _check_swift() -> Tuple[bool, str]:
     """Check Swift compiler availability."""
-    swiftc = shutil.which("swiftc")
+    swiftc = _SWIFTC
     if swiftc:
         try:
             result = subprocess.run(
-                ["swiftc", "--version"],
+                [swiftc, "--version"],
                 capture_output=True,
                 text=True,
                 timeout=10,
@@ -105,24 +115,42 @@ def _check_swift() -> Tuple[bool, str]:
 def _check_clipboard() -> Tuple[bool, str]:
     """Check clipboard functionality."""
     try:
-        from ..clipboard import _ensure_compiled, SWIFT_IMAGE_SOURCE
-        binary = _ensure_compiled(SWIFT_IMAGE_SOURCE, "clipboard-image")
-        return True, f"Clipboard binary ready: {binary}"
+        from ..clipboard import ensure_all_compiled
+        binaries = ensure_all_compiled()
+        return True, f"Clipboard binaries ready: {os.path.dirname(binaries[0])}"
     except Exception as e:
         return False, f"Clipboard compilation failed: {e}"
 
 
+def _find_cdp_chrome_pids() -> List[str]:
+    """List PIDs of Chrome processes started with a remote debugging port."""
+    if psutil is not None:
+        pids = []
+        for proc in psutil.process_iter(["name", "cmdline"]):
+            name = proc.info["name"] or ""
+            cmdline = proc.info["cmdline"] or []
+            if "Chrome" in name and any(
+                arg.startswith("--remote-debugging-port") for arg in cmdline
+            ):
+                pids.append(str(proc.pid))
+        return pids
+
+    result = subprocess.run(
+        ["pgrep", "-f", "Chrome.*remote-debugging-port"],
+        capture_output=True,
+        text=True,
+        timeout=5,
+    )
+    if result.returncode != 0:
+        return []
+    return result.stdout.strip().split("\n")
+
+
 def _check_chrome_instances() -> Tuple[bool, str]:
     """Check for existing Chrome CDP instances."""
     try:
-        result = subprocess.run(
-            ["pgrep", "-f", "Chrome.*remote-debugging-port"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            pids = result.stdout.strip().split("\n")
+        pids = _find_cdp_chrome_pids()
+        if pids:
             return True, (
                 f"Found {len(pids)} existing Chrome CDP instance(s) (PIDs: {', '.join(pids)})\n"
                 f"  These can be reused or kill with: pkill -f 'Chrome.*remote-debugging-port'"
@@ -141,10 +169,9 @@ def _check_dependencies() -> Tuple[bool, str]:
         "pygments": "Pygments",
     }
 
+    # find_spec only locates the package, without executing its imports
     for pkg in packages:
-        try:
-            __import__(pkg)
-        except ImportError:
+        if importlib.util.find_spec(pkg) is None:
             pip_name = import_names.get(pkg, pkg)
             missing.append(pip_name)
 
@@ -153,6 +180,14 @@ def _check_dependencies() -> Tuple[bool, str]:
     return True, "All dependencies installed"
 
 
+def _run_check(check_fn: Callable[[], Tuple[bool, str]]) -> Tuple[bool, str]:
+    """Run a single check, turning unexpected errors into a failure."""
+    try:
+        return check_fn()
+    except Exception as e:
+        return False, f"Check error: {e}"
+
+
 @click.command()
 @click.pass_context
 def check(ctx: click.Context) -> None:
@@ -175,14 +210,13 @@ def check(ctx: click.Context) -> None:
 
     click.echo("🔍 x-poster Environment Check\n")
 
-    all_passed = True
-    for name, check_fn in checks:
-        try:
-            passed, message = check_fn()
-        except Exception as e:
-            passed = False
-            message = f"Check error: {e}"
+    # The checks are independent and mostly wait on subprocesses, so run
+    # them concurrently and report in the original order
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        results = list(executor.map(_run_check, [fn for _, fn in checks]))
 
+    all_passed = True
+    for (name, _), (passed, message) in zip(checks, results):
         icon = "✅" if passed else "❌"
         if not passed:
             all_passed = False
@@ -3,82 +3,105 @@ Post command - Create regular posts on X (text + images).
 
 Supports:
 - Pure text posts
-- Text with up to 4 images
+- Text with up to 4 images (uploaded via the file input, falling back
+  to clipboard paste)
 - Preview mode (default) and --submit for actual posting
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
-import time
 from typing import Optional, Tuple
 
 import click
 
 from ..chrome import ChromeSession, launch_chrome
-from ..clipboard import copy_image
+from ..clipboard import copy_image, warm_up
 from ..constants import LOGIN_INDICATOR, TWEET_BUTTON, TWEET_EDITOR
 from ..page import PageHelper
-from ..paste import send_paste
+from ..paste import send_paste_async
+from ..paste import warm_up as warm_up_paste
+from ..utils import interruptible, login_prompt, progress, wait_for_interrupt
 
 logger = logging.getLogger(__name__)
 BLOB_IMAGE = 'img[src^="blob:"]'
+# Hidden file input behind the compose toolbar's media button
+MEDIA_FILE_INPUT = 'input[data-testid="fileInput"]'
 
 
-async def _wait_for_editor_or_login(
-    page: PageHelper, timeout: float = 60.0
+async def _await_blob_count(
+    page: PageHelper, expected_count: int, timeout: float
 ) -> bool:
-    """Wait for the tweet editor to appear, handling login redirect.
+    """Wait until the editor holds at least expected_count blob images.
+
+    Resolves from a MutationObserver inside the page, so it returns as
+    soon as the image appears instead of on the next polling tick.
 
     Returns:
-        True if editor is ready, False if login is needed
+        True if the count was reached, False on timeout
     """
-    try:
-        idx, selector = await page.wait_for_any_selector(
-            [TWEET_EDITOR, LOGIN_INDICATOR],
-            timeout=timeout,
-        )
-        if idx == 0:
-            return True
-        else:
-            return False
-    except TimeoutError:
-        raise TimeoutError(
-            "Neither tweet editor nor login page appeared. "
-            "Check if X is accessible and Chrome is working."
-        )
+    return bool(await page.call_function(
+        "function(sel, n, timeoutMs) {"
+        "  const check = () => document.querySelectorAll(sel).length >= n;"
+        "  if (check()) return true;"
+        "  return new Promise(resolve => {"
+        "    let timer;"
+        "    const mo = new MutationObserver(() => {"
+        "      if (check()) { mo.disconnect(); clearTimeout(timer); resolve(true); }"
+        "    });"
+        "    mo.observe(document.body, {"
+        "      childList: true, subtree: true, attributes: true, attributeFilter: ['src']"
+        "    });"
+        "    timer = setTimeout(() => { mo.disconnect(); resolve(false); }, timeoutMs);"
+        "  });"
+        "}",
+        BLOB_IMAGE,
+        expected_count,
+        int(timeout * 1000),
+        await_promise=True,
+    ))
+
+
+async def _copy_image_async(image_path: str) -> None:
+    """Copy an image to the clipboard in a worker thread."""
+    await asyncio.to_thread(copy_image, image_path)
+
+
+async def _warm_helpers() -> None:
+    """Warm up the clipboard and keystroke helpers in worker threads.
+
+    Failures are only logged; they resurface with a proper error on the
+    first copy or paste.
+    """
+    results = await asyncio.gather(
+        asyncio.to_thread(warm_up),
+        asyncio.to_thread(warm_up_paste),
+        return_exceptions=True,
+    )
+    for name, result in zip(("Clipboard", "Paste"), results):
+        if isinstance(result, (RuntimeError, OSError)):
+            logger.debug("%s warm-up failed: %s", name, result)
+        elif isinstance(result, BaseException):
+            raise result
 
 
-async def _paste_image(
+async def _verify_image_paste(
     page: PageHelper, image_path: str, expected_count: int, timeout: float = 15.0
 ) -> None:
-    """Copy image to clipboard and paste it into X editor.
+    """Wait for a pasted image to show up in the X editor.
 
     Args:
         page: PageHelper instance
-        image_path: Path to the image file
+        image_path: Path to the pasted image file
         expected_count: Expected number of blob images after paste
         timeout: Timeout for paste verification
     """
-    # Copy image to system clipboard via Swift
-    copy_image(image_path)
-
-    # Small delay to ensure clipboard is ready
-    await asyncio.sleep(0.3)
-
-    # Send real Cmd+V via osascript
-    send_paste()
-
-    # Wait and verify image upload
-    start = time.monotonic()
-    while (time.monotonic() - start) < timeout:
-        count = await page.count_elements(BLOB_IMAGE)
-        if count >= expected_count:
-            logger.info("Image %d uploaded: %s", expected_count, os.path.basename(image_path))
-            return
-        await asyncio.sleep(0.5)
+    if await _await_blob_count(page, expected_count, timeout):
+        logger.info("Image %d uploaded: %s", expected_count, os.path.basename(image_path))
+        return
 
     current_count = await page.count_elements(BLOB_IMAGE)
     raise TimeoutError(
@@ -87,6 +110,53 @@ async def _paste_image(
     )
 
 
+async def _upload_images(page: PageHelper, images: Tuple[str, ...]) -> None:
+    """Attach images through the compose page's hidden file input.
+
+    Sets the files directly via CDP, with no clipboard or keystrokes.
+
+    Args:
+        page: PageHelper instance
+        images: Absolute image paths
+    """
+    for i, abs_path in enumerate(images, 1):
+        progress(f"  📎 Uploading image {i}/{len(images)}: {os.path.basename(abs_path)}")
+        await page.upload_file(abs_path, MEDIA_FILE_INPUT)
+        await _verify_image_paste(page, abs_path, expected_count=i)
+
+
+async def _paste_images(page: PageHelper, images: Tuple[str, ...]) -> None:
+    """Attach images by pasting them from the system clipboard.
+
+    Args:
+        page: PageHelper instance
+        images: Absolute image paths
+    """
+    # Pipeline: image i+1 is copied to the clipboard while the editor
+    # regains focus after image i; pastes themselves stay sequential
+    copy_task = asyncio.create_task(_copy_image_async(images[0]))
+    for i, abs_path in enumerate(images, 1):
+        progress(f"  📎 Pasting image {i}/{len(images)}: {os.path.basename(abs_path)}")
+        # copy_image returns once the pasteboard is written, so the
+        # clipboard is ready as soon as the copy task is done
+        await copy_task
+        # Cmd+V goes to whatever has focus; wait until the editor has it
+        # back after the previous attachment
+        await page.wait_for_predicate(
+            f"document.activeElement?.closest({json.dumps(TWEET_EDITOR)})",
+            timeout=2.0,
+        )
+        # Send real Cmd+V off the event loop, so CDP traffic keeps flowing
+        # during the focus delay
+        await send_paste_async()
+
+        # Only replace the clipboard once Chrome has attached this image;
+        # it may read the clipboard late on a loaded machine
+        await _verify_image_paste(page, abs_path, expected_count=i)
+        if i < len(images):
+            copy_task = asyncio.create_task(_copy_image_async(images[i]))
+
+
 async def _run_post(
     text: str,
     images: Tuple[str, ...],
@@ -96,10 +166,12 @@ async def _run_post(
 ) -> None:
     """Core post implementation."""
     session: Optional[ChromeSession] = None
+    cleanup_task: Optional[asyncio.Task] = None
+    cancelled = False
 
     try:
         # Launch Chrome and open compose page
-        click.echo("🚀 Launching Chrome...")
+        progress("🚀 Launching Chrome...")
         session = await launch_chrome(
             url="https://x.com/compose/post",
             profile_dir=profile,
@@ -109,43 +181,69 @@ async def _run_post(
         page = PageHelper(session.cdp, session.session_id)
 
         # Wait for editor
-        click.echo("⏳ Waiting for editor...")
-        editor_ready = await _wait_for_editor_or_login(page)
-
-        if not editor_ready:
-            click.echo(
-                "🔑 Login required! Please log in to X in the Chrome window, "
-                "then the script will continue automatically..."
+        progress("⏳ Waiting for editor...")
+        try:
+            logged_in = await interruptible(page.wait_for_selector_with_optional_login(
+                TWEET_EDITOR,
+                LOGIN_INDICATOR,
+                timeout=60.0,
+                login_timeout=300.0,
+                on_login=lambda: login_prompt(
+                    "🔑 Login required! Please log in to X in the Chrome window, "
+                    "then the script will continue automatically (Ctrl+C to cancel)..."
+                ),
+            ))
+        except TimeoutError:
+            raise TimeoutError(
+                "Neither tweet editor nor login page appeared. "
+                "Check if X is accessible and Chrome is working."
             )
-            await page.wait_for_selector(TWEET_EDITOR, timeout=300.0)
+        if logged_in:
             click.echo("✅ Login detected!")
 
-        # Give the editor a moment to fully initialize
-        await asyncio.sleep(1.0)
+        # Wait until the editor is initialized and editable
+        await page.wait_for_predicate(
+            f"document.querySelector({json.dumps(TWEET_EDITOR)}).isContentEditable"
+        )
 
         # Type text
         if text:
-            click.echo(f"📝 Typing text ({len(text)} chars)...")
+            progress(f"📝 Typing text ({len(text)} chars)...")
             await page.type_text(TWEET_EDITOR, text)
-            await asyncio.sleep(0.5)
+            # Newlines become blocks, not characters, in the editor text
+            typed_length = len(text.replace("\n", ""))
+            await page.wait_for_predicate(
+                f"document.querySelector({json.dumps(TWEET_EDITOR)}).textContent.length"
+                f" >= {typed_length}"
+            )
 
         # Upload images
         if images:
-            click.echo(f"🖼️  Uploading {len(images)} image(s)...")
-            for i, img_path in enumerate(images, 1):
-                abs_path = os.path.abspath(img_path)
-                if not os.path.isfile(abs_path):
-                    raise FileNotFoundError(f"Image not found: {abs_path}")
-
-                click.echo(f"  📎 Pasting image {i}/{len(images)}: {os.path.basename(img_path)}")
-                await _paste_image(page, abs_path, expected_count=i)
-                await asyncio.sleep(0.5)
+            progress(f"🖼️  Uploading {len(images)} image(s)...")
+            if await page.count_elements(MEDIA_FILE_INPUT):
+                await _upload_images(page, images)
+            else:
+                # Only the clipboard fallback needs these helpers; start
+                # them together rather than one after the other
+                await _warm_helpers()
+                await _paste_images(page, images)
 
         # Submit or preview
         if submit:
-            click.echo("📤 Submitting post...")
-            await page.click_selector(TWEET_BUTTON)
-            await asyncio.sleep(2.0)
+            progress("📤 Submitting post...")
+            await page.click_selector(TWEET_BUTTON, trusted=True)
+            # X leaves the compose page once the post has been sent
+            if not await page.wait_for_predicate(
+                "!location.pathname.startsWith('/compose/')", timeout=10.0
+            ):
+                click.echo(
+                    "⚠️  Composer still open, the post may not have been sent", err=True
+                )
+                raise SystemExit(1)
+            # Nothing left to do in the browser. Let the shutdown get as far
+            # as its first wait (the CDP close handshake) before reporting
+            cleanup_task = asyncio.create_task(session.cleanup())
+            await asyncio.sleep(0)
             click.echo("✅ Post submitted!")
         else:
             click.echo(
@@ -153,20 +251,24 @@ async def _run_post(
                 "   Review and click 'Post' manually, or re-run with --submit."
             )
 
+    except click.Abort:
+        # Ctrl+C while waiting for login; nothing left to review
+        cancelled = True
+        raise
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
         raise
     finally:
-        if session and submit:
-            # Only auto-cleanup if we submitted
+        if cleanup_task is not None:
+            await cleanup_task
+        elif session and (submit or cancelled):
+            # Only auto-cleanup if we submitted or the user cancelled
             await session.cleanup()
         elif session:
             click.echo("💡 Chrome window left open for review. Press Ctrl+C to exit.")
             try:
-                # Keep alive until user exits
-                while True:
-                    await asyncio.sleep(1)
-            except (KeyboardInterrupt, asyncio.CancelledError):
+                await wait_for_interrupt()
+            finally:
                 await session.cleanup()
 
 
@@ -175,7 +277,7 @@ async def _run_post(
 @click.option(
     "--image", "-i",
     multiple=True,
-    type=click.Path(exists=True),
+    type=click.Path(exists=True, dir_okay=False),
     help="Image file to attach (can be repeated, max 4)",
 )
 @click.option("--submit", "-s", is_flag=True, help="Actually submit the post")
@@ -197,7 +299,11 @@ def post(ctx: click.Context, text: str, image: Tuple[str, ...], submit: bool) ->
     if len(image) > 4:
         raise click.UsageError("Maximum 4 images allowed per post.")
 
+    # Click has already checked the files exist; resolve them once here,
+    # before Chrome is launched
+    abs_images = tuple(os.path.abspath(p) for p in image)
+
     profile = ctx.obj.get("profile")
     chrome_path = ctx.obj.get("chrome_path")
 
-    asyncio.run(_run_post(text, image, submit, profile, chrome_path))
+    asyncio.run(_run_post(text, abs_images, submit, profile, chrome_path))
@@ -8,6 +8,7 @@ selects "Quote" from the dropdown, and types a comment.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from typing import Optional
 
@@ -22,10 +23,19 @@ from ..constants import (
     UNRETWEET_BUTTON,
 )
 from ..page import PageHelper
-from ..utils import normalize_tweet_url
+from ..utils import (
+    interruptible,
+    login_prompt,
+    normalize_tweet_url,
+    progress,
+    wait_for_interrupt,
+)
 
 logger = logging.getLogger(__name__)
 
+# Matches whichever of the retweet/unretweet buttons the tweet shows
+_RT_SELECTOR = RETWEET_BUTTON + ", " + UNRETWEET_BUTTON
+
 # Multi-language quote menu item text patterns
 QUOTE_PATTERNS = [
     "quote",           # English
@@ -36,6 +46,66 @@ QUOTE_PATTERNS = [
     "zitieren",        # German
     "citer",           # French
 ]
+_QUOTE_PATTERNS_LOWER = [p.lower() for p in QUOTE_PATTERNS]
+
+
+# Finds the Quote entry in the open retweet dropdown: returns
+# [element, label] or null. Shared by the JS snippets below.
+_FIND_QUOTE_ITEM_JS = """(patterns) => {
+    // Strategy 1: role=menuitem
+    const items = document.querySelectorAll('[role="menuitem"]');
+    for (const item of items) {
+        const text = (item.textContent || '').trim().toLowerCase();
+        for (const p of patterns) {
+            if (text.includes(p)) return [item, 'menuitem:' + text];
+        }
+    }
+    // Strategy 2: spans inside #layers with matching text
+    const spans = document.querySelectorAll('#layers span');
+    for (const span of spans) {
+        const text = (span.textContent || '').trim().toLowerCase();
+        for (const p of patterns) {
+            if (text === p) return [span.closest('[role="menuitem"]') || span, 'span:' + text];
+        }
+    }
+    return null;
+}"""
+
+# Clicks the Quote entry if the dropdown is open; returns its label or false
+CLICK_QUOTE_OPTION_JS = (
+    "function(patterns) {"
+    "  const found = (" + _FIND_QUOTE_ITEM_JS + ")(patterns);"
+    "  if (!found) return false;"
+    "  found[0].click();"
+    "  return found[1];"
+    "}"
+)
+
+# Clicks the retweet button, waits for the dropdown via MutationObserver
+# and clicks Quote, all in one call; resolves with the label or false
+OPEN_MENU_AND_QUOTE_JS = (
+    "function(rtSelector, patterns, timeoutMs) {"
+    "  const find = " + _FIND_QUOTE_ITEM_JS + ";"
+    "  const btn = document.querySelector(rtSelector);"
+    "  if (!btn) return false;"
+    "  btn.click();"
+    "  return new Promise(resolve => {"
+    "    let timer;"
+    "    const attempt = () => {"
+    "      const found = find(patterns);"
+    "      if (!found) return;"
+    "      mo.disconnect();"
+    "      clearTimeout(timer);"
+    "      found[0].click();"
+    "      resolve(found[1]);"
+    "    };"
+    "    const mo = new MutationObserver(attempt);"
+    "    mo.observe(document.body, {childList: true, subtree: true});"
+    "    timer = setTimeout(() => { mo.disconnect(); resolve(false); }, timeoutMs);"
+    "    attempt();"
+    "  });"
+    "}"
+)
 
 
 async def _click_quote_option(page: PageHelper, timeout: float = 10.0) -> None:
@@ -46,45 +116,20 @@ async def _click_quote_option(page: PageHelper, timeout: float = 10.0) -> None:
     import time
 
     start = time.monotonic()
+    # Poll tightly at first (the menu usually opens within ~50ms), then
+    # back off to spare CDP traffic on slow pages
+    delay = 0.05
 
     while (time.monotonic() - start) < timeout:
-        # Look for menu items in the dropdown (try multiple selector strategies)
-        found = await page.evaluate(
-            """(() => {
-                const patterns = """
-            + repr([p.lower() for p in QUOTE_PATTERNS])
-            + """;
-                // Strategy 1: role=menuitem
-                const items = document.querySelectorAll('[role="menuitem"]');
-                for (const item of items) {
-                    const text = (item.textContent || '').trim().toLowerCase();
-                    for (const p of patterns) {
-                        if (text.includes(p)) {
-                            item.click();
-                            return 'menuitem:' + text;
-                        }
-                    }
-                }
-                // Strategy 2: spans inside #layers with matching text
-                const spans = document.querySelectorAll('#layers span');
-                for (const span of spans) {
-                    const text = (span.textContent || '').trim().toLowerCase();
-                    for (const p of patterns) {
-                        if (text === p) {
-                            const clickTarget = span.closest('[role="menuitem"]') || span;
-                            clickTarget.click();
-                            return 'span:' + text;
-                        }
-                    }
-                }
-                return false;
-            })()"""
+        found = await page.call_function(
+            CLICK_QUOTE_OPTION_JS, _QUOTE_PATTERNS_LOWER
         )
         if found:
             logger.debug("Clicked quote option (matched: %s)", found)
             return
 
-        await asyncio.sleep(0.3)
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.6, 0.5)
 
     raise TimeoutError(
         "Could not find 'Quote' option in retweet dropdown. "
@@ -101,11 +146,12 @@ async def _run_quote(
 ) -> None:
     """Core quote implementation."""
     session: Optional[ChromeSession] = None
+    cancelled = False
 
     try:
         tweet_url = normalize_tweet_url(tweet_url)
 
-        click.echo("🚀 Launching Chrome...")
+        progress("🚀 Launching Chrome...")
         session = await launch_chrome(
             url=tweet_url,
             profile_dir=profile,
@@ -115,74 +161,68 @@ async def _run_quote(
         page = PageHelper(session.cdp, session.session_id)
 
         # Wait for page to load - check for login or tweet content
-        click.echo("⏳ Loading tweet...")
+        progress("⏳ Loading tweet...")
         try:
-            idx, _ = await page.wait_for_any_selector(
-                [RETWEET_BUTTON, UNRETWEET_BUTTON, LOGIN_INDICATOR],
+            await interruptible(page.wait_for_selector_with_optional_login(
+                _RT_SELECTOR,
+                LOGIN_INDICATOR,
                 timeout=30.0,
-            )
-            if idx == 2:
-                click.echo("🔑 Please log in to X in Chrome...")
-                await page.wait_for_any_selector(
-                    [RETWEET_BUTTON, UNRETWEET_BUTTON], timeout=300.0
-                )
+                login_timeout=300.0,
+                on_login=lambda: login_prompt(
+                    "🔑 Please log in to X in Chrome (Ctrl+C to cancel)..."
+                ),
+            ))
         except TimeoutError:
             raise TimeoutError(
                 f"Tweet page did not load properly: {tweet_url}\n"
                 "The tweet may have been deleted or you may be blocked."
             )
 
-        await asyncio.sleep(1.0)
-
-        # Click retweet button to open dropdown
-        click.echo("🔁 Opening retweet menu...")
-        rt_selector = RETWEET_BUTTON + ", " + UNRETWEET_BUTTON
-        # Try CDP mouse click first, then JS click as fallback
-        try:
-            await page.click_selector(RETWEET_BUTTON)
-        except (TimeoutError, RuntimeError):
-            try:
-                await page.click_selector(UNRETWEET_BUTTON)
-            except (TimeoutError, RuntimeError):
-                pass
-
-        await asyncio.sleep(0.8)
-
-        # Check if dropdown appeared; if not, retry with JS click
-        has_menu = await page.evaluate(
-            'document.querySelectorAll(\'[role="menuitem"]\').length > 0'
+        # The button can be in the DOM before the tweet is laid out
+        await page.wait_for_selector(_RT_SELECTOR, timeout=10.0, visible=True)
+
+        # Open the retweet dropdown and pick Quote in a single round trip
+        progress("🔁 Opening retweet menu and selecting 'Quote'...")
+        matched = await page.call_function(
+            OPEN_MENU_AND_QUOTE_JS,
+            _RT_SELECTOR,
+            _QUOTE_PATTERNS_LOWER,
+            3000,
+            await_promise=True,
         )
-        if not has_menu:
-            logger.debug("CDP click didn't open dropdown, retrying with JS click")
-            await page.evaluate("""
-                (() => {
-                    const btn = document.querySelector('[data-testid="retweet"]')
-                             || document.querySelector('[data-testid="unretweet"]');
-                    if (btn) btn.click();
-                })()
-            """)
-            await asyncio.sleep(0.8)
-
-        # Select Quote from dropdown
-        click.echo("💬 Selecting 'Quote'...")
-        await _click_quote_option(page)
+        if matched:
+            logger.debug("Clicked quote option (matched: %s)", matched)
+        else:
+            # Fall back to a trusted CDP click (unless the menu is already
+            # open) and polling for the Quote option
+            logger.debug("JS click didn't yield a Quote option, retrying with CDP click")
+            has_menu = await page.evaluate(
+                'document.querySelectorAll(\'[role="menuitem"]\').length > 0'
+            )
+            if not has_menu:
+                await page.click_selector(_RT_SELECTOR, trusted=True)
+            await _click_quote_option(page)
 
         # Wait for quote editor to appear
-        await asyncio.sleep(1.5)
         await page.wait_for_selector(TWEET_EDITOR, timeout=10.0)
 
         # Type comment
         if comment:
-            click.echo(f"📝 Typing comment ({len(comment)} chars)...")
+            progress(f"📝 Typing comment ({len(comment)} chars)...")
             await page.type_text(TWEET_EDITOR, comment)
-            await asyncio.sleep(0.5)
+            # Newlines become blocks, not characters, in the editor text
+            typed_length = len(comment.replace("\n", ""))
+            await page.wait_for_predicate(
+                f"document.querySelector({json.dumps(TWEET_EDITOR)}).textContent.length"
+                f" >= {typed_length}"
+            )
 
         # Submit or preview
         if submit:
-            click.echo("📤 Submitting quote...")
+            progress("📤 Submitting quote...")
             # Try CDP click first, then JS click as fallback
             try:
-                await page.click_selector('[data-testid="tweetButton"]')
+                await page.click_selector('[data-testid="tweetButton"]', trusted=True)
             except (TimeoutError, RuntimeError):
                 logger.debug("CDP click on tweet button failed, using JS click")
                 await page.evaluate("""
@@ -192,7 +232,16 @@ async def _run_quote(
                         if (btn) btn.click();
                     })()
                 """)
-            await asyncio.sleep(3.0)
+            # The quote composer closes once the post has been sent
+            if not await page.wait_for_predicate(
+                "!location.pathname.startsWith('/compose/')"
+                f" || !document.querySelector({json.dumps(TWEET_EDITOR)})",
+                timeout=10.0,
+            ):
+                click.echo(
+                    "⚠️  Composer still open, the quote may not have been sent", err=True
+                )
+                raise SystemExit(1)
             click.echo("✅ Quote tweet submitted!")
         else:
             click.echo(
@@ -200,18 +249,21 @@ async def _run_quote(
                 "   Review and click 'Post' manually, or re-run with --submit."
             )
 
+    except click.Abort:
+        # Ctrl+C while waiting for login; nothing left to review
+        cancelled = True
+        raise
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
         raise
     finally:
-        if session and submit:
+        if session and (submit or cancelled):
             await session.cleanup()
         elif session:
-            click.echo("💡 Chrome window left open for review.")
+            click.echo("💡 Chrome window left open for review. Press Ctrl+C to exit.")
             try:
-                while True:
-                    await asyncio.sleep(1)
-            except (KeyboardInterrupt, asyncio.CancelledError):
+                await wait_for_interrupt()
+            finally:
                 await session.cleanup()
 
 
@@ -1,5 +1,5 @@
 """
-Read command - Read a single tweet's content from X.
+Read command - Read tweets' content from X.
 
 Extracts:
 - Tweet text
@@ -8,32 +8,234 @@ Extracts:
 - Media (images/videos)
 - Engagement metrics (likes, retweets, replies, views)
 - Quoted tweet (if any)
+
+Several URLs are read concurrently, each in its own tab of one Chrome.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 
 from ..chrome import ChromeSession, launch_chrome
-from ..constants import LOGIN_INDICATOR, TWEET_ARTICLE, TWEET_TEXT, USER_NAME
+from ..constants import (
+    LOGIN_INDICATOR,
+    MEDIA_URL_PATTERNS,
+    TWEET_ARTICLE,
+    TWEET_TEXT,
+    USER_NAME,
+)
 from ..page import PageHelper
+from ..utils import dump_json, login_prompt, normalize_tweet_url
 
 logger = logging.getLogger(__name__)
 
+# Tabs loading at once when reading several tweets
+MAX_PARALLEL_TABS = 5
+
+
+# Extracts one tweet article element into a plain object. The number
+# patterns are built once per install rather than once per tweet.
+_EXTRACT_FROM_ARTICLE_JS = """
+const RE_WAN = /(\\d+\\.?\\d*)\\s*万/;
+const RE_YI = /(\\d+\\.?\\d*)\\s*亿/;
+const RE_B = /(\\d+\\.?\\d*)\\s*[Bb]/;
+const RE_M = /(\\d+\\.?\\d*)\\s*[Mm]/;
+const RE_K = /(\\d+\\.?\\d*)\\s*[Kk]/;
+const RE_PLAIN = /(\\d+)/;
+const RE_ARIA_NUM = /(\\d[\\d,]*)/;
+const RE_STATUS_HREF = /\\/status\\/\\d+$/;
+const RE_NOT_MEDIA_IMG = /emoji|profile_image/;
+
+// Parse localized number strings like "282.7万", "1.2亿", "3.5K", "1.2M"
+function parseLocalizedNum(str) {
+    if (!str) return null;
+    str = str.replace(/,/g, '');
+    // Chinese: 万 = 10000, 亿 = 100000000
+    var m = str.match(RE_WAN);
+    if (m) return String(Math.round(parseFloat(m[1]) * 10000));
+    m = str.match(RE_YI);
+    if (m) return String(Math.round(parseFloat(m[1]) * 100000000));
+    // English: K = 1000, M = 1000000, B = 1000000000
+    m = str.match(RE_B);
+    if (m) return String(Math.round(parseFloat(m[1]) * 1000000000));
+    m = str.match(RE_M);
+    if (m) return String(Math.round(parseFloat(m[1]) * 1000000));
+    m = str.match(RE_K);
+    if (m) return String(Math.round(parseFloat(m[1]) * 1000));
+    // Plain number
+    m = str.match(RE_PLAIN);
+    if (m) return m[1];
+    return null;
+}
+
+function extractMetric(el) {
+    if (!el) return null;
+    var label = el.getAttribute('aria-label') || '';
+    // aria-label usually has raw numbers like "1510 retweets" or "1510 次转推"
+    var m = label.match(RE_ARIA_NUM);
+    if (m) return m[1].replace(/,/g, '');
+    // Fallback to text content with localized parsing
+    return parseLocalizedNum(el.textContent || '');
+}
+
+// Everything extractFromArticle() reads, so one subtree walk finds it all
+const ARTICLE_PARTS = [
+    '[data-testid="tweetText"]', '[data-testid="User-Name"]', 'time',
+    '[data-testid="tweetPhoto"] img', 'video', '[data-testid="reply"]',
+    '[data-testid="retweet"]', '[data-testid="like"]', '[data-testid="unlike"]',
+    '[data-testid="quoteTweet"]', 'a[href*="/analytics"]', 'a[href*="/status/"]'
+].join(', ');
+
+function extractFromArticle(article) {
+    // Sort the article's parts by kind. The first match in document order
+    // wins, as with querySelector, so the main tweet takes precedence over
+    // a quoted one.
+    let textEl = null, userEl = null, timeEl = null, quoteEl = null;
+    let replyBtn = null, retweetBtn = null, likeBtn = null, viewsEl = null;
+    let tweetUrl = '';
+    const imgEls = [], videoEls = [];
+    for (const node of article.querySelectorAll(ARTICLE_PARTS)) {
+        switch (node.tagName) {
+            case 'TIME': if (!timeEl) timeEl = node; continue;
+            case 'IMG': imgEls.push(node); continue;
+            case 'VIDEO': videoEls.push(node); continue;
+            case 'A': {
+                const href = node.getAttribute('href') || '';
+                if (!viewsEl && href.includes('/analytics')) viewsEl = node;
+                if (!tweetUrl && RE_STATUS_HREF.test(href)) tweetUrl = 'https://x.com' + href;
+            }
+        }
+        switch (node.getAttribute('data-testid')) {
+            case 'tweetText': if (!textEl) textEl = node; break;
+            case 'User-Name': if (!userEl) userEl = node; break;
+            case 'reply': if (!replyBtn) replyBtn = node; break;
+            case 'retweet': if (!retweetBtn) retweetBtn = node; break;
+            case 'like': case 'unlike': if (!likeBtn) likeBtn = node; break;
+            case 'quoteTweet': if (!quoteEl) quoteEl = node; break;
+        }
+    }
+
+    // Tweet text
+    const text = textEl ? textEl.innerText : '';
+
+    // Author info
+    let displayName = '', handle = '';
+    if (userEl) {
+        const spans = userEl.querySelectorAll('span');
+        for (const span of spans) {
+            const t = span.textContent.trim();
+            if (t.startsWith('@')) { handle = t; break; }
+        }
+        // Display name is usually the first text node
+        const nameLink = userEl.querySelector('a');
+        if (nameLink) {
+            const nameSpans = nameLink.querySelectorAll('span');
+            if (nameSpans.length > 0) displayName = nameSpans[0].textContent.trim();
+        }
+    }
+
+    // Timestamp
+    const timestamp = timeEl ? timeEl.getAttribute('datetime') : '';
+    const timeText = timeEl ? timeEl.textContent : '';
+
+    // Images
+    const images = imgEls
+        .map(img => img.getAttribute('src') || '')
+        .filter(src => src && !RE_NOT_MEDIA_IMG.test(src));
+
+    // Video
+    const videos = [];
+    videoEls.forEach(function(v) {
+        const src = v.getAttribute('src') || v.querySelector('source')?.getAttribute('src') || '';
+        if (src) videos.push(src);
+    });
+
+    // Engagement metrics
+    const metrics = {};
+
+    var v;
+    v = extractMetric(replyBtn); if (v) metrics.replies = v;
+    v = extractMetric(retweetBtn); if (v) metrics.retweets = v;
+    v = extractMetric(likeBtn); if (v) metrics.likes = v;
+
+    if (viewsEl) {
+        // aria-label may have raw number like "2825805 次查看"
+        var label = viewsEl.getAttribute('aria-label') || '';
+        var vm = label.match(RE_ARIA_NUM);
+        if (vm) {
+            metrics.views = vm[1].replace(/,/g, '');
+        } else {
+            // Fallback: text may be localized like "282.7万 查看"
+            var parsed = parseLocalizedNum(viewsEl.textContent || '');
+            if (parsed) metrics.views = parsed;
+        }
+    }
+
+    // Quoted tweet
+    let quoted = null;
+    if (quoteEl) {
+        const qText = quoteEl.querySelector('[data-testid="tweetText"]');
+        const qUser = quoteEl.querySelector('[data-testid="User-Name"]');
+        quoted = {
+            text: qText ? qText.innerText : '',
+            author: qUser ? qUser.textContent.trim() : ''
+        };
+    }
+
+    return {
+        text: text,
+        displayName: displayName,
+        handle: handle,
+        timestamp: timestamp,
+        timeText: timeText,
+        images: images,
+        videos: videos,
+        metrics: metrics,
+        quoted: quoted,
+        url: tweetUrl
+    };
+}
+"""
 
-def _normalize_url(url: str) -> str:
-    """Normalize a tweet URL to full https format."""
-    url = url.strip()
-    if url.startswith("x.com") or url.startswith("twitter.com"):
-        url = "https://" + url
-    url = url.replace("twitter.com", "x.com")
-    return url
+# Defines window.__xpExtractTweet(idx) and window.__xpExtractNewTweets(), so
+# the extractor source is sent and compiled once per document. The latter
+# returns only articles it has not returned before.
+_INSTALL_EXTRACTOR_JS = (
+    "(function() {"
+    + _EXTRACT_FROM_ARTICLE_JS
+    + "  const articles = () => document.querySelectorAll('article[data-testid=\"tweet\"]');"
+    "  const done = new WeakSet();"
+    "  window.__xpExtractTweet = function(idx) {"
+    "    const article = articles()[idx];"
+    "    return article ? extractFromArticle(article) : null;"
+    "  };"
+    "  window.__xpExtractNewTweets = function() {"
+    "    const fresh = Array.from(articles()).filter(a => !done.has(a));"
+    "    fresh.forEach(a => done.add(a));"
+    "    return fresh.map(extractFromArticle);"
+    "  };"
+    "})()"
+)
+
+
+async def _run_extractor(page: PageHelper, declaration: str, *args: Any) -> Any:
+    """Call a function that uses the installed extractor.
+
+    The call goes through Runtime.callFunctionOn on the cached global
+    object, so the small wrapper source is compiled once and not re-parsed
+    per call. The extractor lives on window, so it is gone after a
+    navigation; on the resulting error it is (re)installed and the call
+    retried once.
+    """
+    try:
+        return await page.call_function(declaration, *args)
+    except RuntimeError:
+        await page.evaluate(_INSTALL_EXTRACTOR_JS)
+        return await page.call_function(declaration, *args)
 
 
 async def _extract_tweet_data(page: PageHelper, index: int = 0) -> Dict[str, Any]:
@@ -46,153 +248,73 @@ async def _extract_tweet_data(page: PageHelper, index: int = 0) -> Dict[str, Any
     Returns:
         Dictionary with tweet data
     """
-    js = """
-    (function(idx) {
-        const articles = document.querySelectorAll('article[data-testid="tweet"]');
-        if (!articles[idx]) return null;
-        const article = articles[idx];
-
-        // Tweet text
-        const textEl = article.querySelector('[data-testid="tweetText"]');
-        const text = textEl ? textEl.innerText : '';
-
-        // Author info
-        const userEl = article.querySelector('[data-testid="User-Name"]');
-        let displayName = '', handle = '';
-        if (userEl) {
-            const spans = userEl.querySelectorAll('span');
-            for (const span of spans) {
-                const t = span.textContent.trim();
-                if (t.startsWith('@')) { handle = t; break; }
-            }
-            // Display name is usually the first text node
-            const nameLink = userEl.querySelector('a');
-            if (nameLink) {
-                const nameSpans = nameLink.querySelectorAll('span');
-                if (nameSpans.length > 0) displayName = nameSpans[0].textContent.trim();
-            }
-        }
+    return await _run_extractor(
+        page, "function(idx) { return this.__xpExtractTweet(idx); }", index
+    )
 
-        // Timestamp
-        const timeEl = article.querySelector('time');
-        const timestamp = timeEl ? timeEl.getAttribute('datetime') : '';
-        const timeText = timeEl ? timeEl.textContent : '';
-
-        // Images
-        const images = [];
-        const imgEls = article.querySelectorAll('[data-testid="tweetPhoto"] img');
-        imgEls.forEach(function(img) {
-            const src = img.getAttribute('src') || '';
-            if (src && !src.includes('emoji') && !src.includes('profile_image')) {
-                images.push(src);
-            }
-        });
-
-        // Video
-        const videoEls = article.querySelectorAll('video');
-        const videos = [];
-        videoEls.forEach(function(v) {
-            const src = v.getAttribute('src') || v.querySelector('source')?.getAttribute('src') || '';
-            if (src) videos.push(src);
-        });
-
-        // Engagement metrics
-        const metrics = {};
-        const replyBtn = article.querySelector('[data-testid="reply"]');
-        const retweetBtn = article.querySelector('[data-testid="retweet"]');
-        const likeBtn = article.querySelector('[data-testid="like"], [data-testid="unlike"]');
-        const viewsEl = article.querySelector('a[href*="/analytics"]');
-
-        // Parse localized number strings like "282.7万", "1.2亿", "3.5K", "1.2M"
-        function parseLocalizedNum(str) {
-            if (!str) return null;
-            str = str.replace(/,/g, '');
-            // Chinese: 万 = 10000, 亿 = 100000000
-            var m = str.match(/(\\d+\\.?\\d*)\\s*万/);
-            if (m) return String(Math.round(parseFloat(m[1]) * 10000));
-            m = str.match(/(\\d+\\.?\\d*)\\s*亿/);
-            if (m) return String(Math.round(parseFloat(m[1]) * 100000000));
-            // English: K = 1000, M = 1000000, B = 1000000000
-            m = str.match(/(\\d+\\.?\\d*)\\s*[Bb]/);
-            if (m) return String(Math.round(parseFloat(m[1]) * 1000000000));
-            m = str.match(/(\\d+\\.?\\d*)\\s*[Mm]/);
-            if (m) return String(Math.round(parseFloat(m[1]) * 1000000));
-            m = str.match(/(\\d+\\.?\\d*)\\s*[Kk]/);
-            if (m) return String(Math.round(parseFloat(m[1]) * 1000));
-            // Plain number
-            m = str.match(/(\\d+)/);
-            if (m) return m[1];
-            return null;
-        }
 
-        function extractMetric(el) {
-            if (!el) return null;
-            var label = el.getAttribute('aria-label') || '';
-            // aria-label usually has raw numbers like "1510 retweets" or "1510 次转推"
-            var m = label.match(/(\\d[\\d,]*)/);
-            if (m) return m[1].replace(/,/g, '');
-            // Fallback to text content with localized parsing
-            return parseLocalizedNum(el.textContent || '');
-        }
+async def _extract_new_tweet_data(page: PageHelper) -> List[Dict[str, Any]]:
+    """Extract the tweet articles added since the previous call.
 
-        var v;
-        v = extractMetric(replyBtn); if (v) metrics.replies = v;
-        v = extractMetric(retweetBtn); if (v) metrics.retweets = v;
-        v = extractMetric(likeBtn); if (v) metrics.likes = v;
-
-        if (viewsEl) {
-            // aria-label may have raw number like "2825805 次查看"
-            var label = viewsEl.getAttribute('aria-label') || '';
-            var vm = label.match(/(\\d[\\d,]*)/);
-            if (vm) {
-                metrics.views = vm[1].replace(/,/g, '');
-            } else {
-                // Fallback: text may be localized like "282.7万 查看"
-                var parsed = parseLocalizedNum(viewsEl.textContent || '');
-                if (parsed) metrics.views = parsed;
-            }
-        }
-
-        // Quoted tweet
-        let quoted = null;
-        const quoteEl = article.querySelector('[data-testid="quoteTweet"]');
-        if (quoteEl) {
-            const qText = quoteEl.querySelector('[data-testid="tweetText"]');
-            const qUser = quoteEl.querySelector('[data-testid="User-Name"]');
-            quoted = {
-                text: qText ? qText.innerText : '',
-                author: qUser ? qUser.textContent.trim() : ''
-            };
-        }
+    The first call on a page returns every article. Articles already
+    returned are skipped in the page, so each scroll round only extracts
+    and transfers the newly rendered tweets.
 
-        // Tweet URL (from permalink)
-        let tweetUrl = '';
-        const links = article.querySelectorAll('a[href*="/status/"]');
-        for (const link of links) {
-            const href = link.getAttribute('href') || '';
-            if (href.match(/\\/status\\/\\d+$/)) {
-                tweetUrl = 'https://x.com' + href;
-                break;
-            }
-        }
+    Returns:
+        List of tweet data dictionaries, in page order
+    """
+    return await _run_extractor(
+        page, "function() { return this.__xpExtractNewTweets(); }"
+    ) or []
+
+
+# Scrolls the last tweet article into view and resolves true once a tweet
+# article is added to the page, or false after timeoutMs. Scrolling to the
+# last article (rather than by a fixed distance) never skips past articles
+# X's virtual list has not rendered yet. X recycles article nodes while
+# scrolling, so this watches for added articles rather than a growing count.
+_SCROLL_FOR_MORE_JS = (
+    "function(timeoutMs) {"
+    "  const isTweet = n => n.nodeType === 1 && (n.matches('article[data-testid=\"tweet\"]')"
+    "    || !!n.querySelector('article[data-testid=\"tweet\"]'));"
+    "  return new Promise(resolve => {"
+    "    let timer;"
+    "    const mo = new MutationObserver(records => {"
+    "      for (const r of records) {"
+    "        for (const n of r.addedNodes) {"
+    "          if (isTweet(n)) { mo.disconnect(); clearTimeout(timer); resolve(true); return; }"
+    "        }"
+    "      }"
+    "    });"
+    "    mo.observe(document.body, {childList: true, subtree: true});"
+    "    timer = setTimeout(() => { mo.disconnect(); resolve(false); }, timeoutMs);"
+    "    const arts = document.querySelectorAll('article[data-testid=\"tweet\"]');"
+    "    const last = arts[arts.length - 1];"
+    "    if (last) last.scrollIntoView({block: 'end'});"
+    "    else window.scrollBy(0, window.innerHeight * 2);"
+    "  });"
+    "}"
+)
+
+
+async def _scroll_for_more_tweets(page: PageHelper, timeout: float = 3.0) -> bool:
+    """Scroll to the last tweet and wait until X renders another one.
 
-        return {
-            text: text,
-            displayName: displayName,
-            handle: handle,
-            timestamp: timestamp,
-            timeText: timeText,
-            images: images,
-            videos: videos,
-            metrics: metrics,
-            quoted: quoted,
-            url: tweetUrl
-        };
-    })
+    Returns:
+        True if a new article appeared, False on timeout
     """
+    return bool(await page.call_function(
+        _SCROLL_FOR_MORE_JS, int(timeout * 1000), await_promise=True
+    ))
 
-    result = await page.evaluate(f"({js})({index})")
-    return result
+
+# Metric keys in display order, with their labels
+_METRIC_LABELS = (
+    ("replies", "💬"),
+    ("retweets", "🔁"),
+    ("likes", "❤️ "),
+    ("views", "👁️ "),
+)
 
 
 def _format_tweet(data: Dict[str, Any]) -> str:
@@ -200,61 +322,115 @@ def _format_tweet(data: Dict[str, Any]) -> str:
     if not data:
         return "No tweet data found."
 
-    lines = []
-    lines.append(f"👤 {data.get('displayName', '')} {data.get('handle', '')}")
-
-    if data.get("timeText"):
-        lines.append(f"🕐 {data['timeText']}  ({data.get('timestamp', '')})")
+    get = data.get
+    time_text = get("timeText")
+    images = get("images") or ()
+    videos = get("videos") or ()
+    metrics = get("metrics") or {}
+    quoted = get("quoted")
+    url = get("url")
 
-    lines.append("")
-    lines.append(data.get("text", "(no text)"))
-    lines.append("")
+    lines = [f"👤 {get('displayName', '')} {get('handle', '')}"]
+    if time_text:
+        lines.append(f"🕐 {time_text}  ({get('timestamp', '')})")
+    lines += ["", get("text", "(no text)"), ""]
 
     # Media
-    images = data.get("images", [])
     if images:
         lines.append(f"🖼️  {len(images)} image(s):")
-        for i, url in enumerate(images, 1):
-            lines.append(f"  [{i}] {url}")
+        lines.extend(f"  [{i}] {src}" for i, src in enumerate(images, 1))
 
-    videos = data.get("videos", [])
     if videos:
         lines.append(f"🎬 {len(videos)} video(s):")
-        for i, url in enumerate(videos, 1):
-            lines.append(f"  [{i}] {url}")
+        lines.extend(f"  [{i}] {src}" for i, src in enumerate(videos, 1))
 
     # Metrics
-    metrics = data.get("metrics", {})
-    if metrics:
-        parts = []
-        if "replies" in metrics:
-            parts.append(f"💬 {metrics['replies']}")
-        if "retweets" in metrics:
-            parts.append(f"🔁 {metrics['retweets']}")
-        if "likes" in metrics:
-            parts.append(f"❤️  {metrics['likes']}")
-        if "views" in metrics:
-            parts.append(f"👁️  {metrics['views']}")
-        if parts:
-            lines.append("  ".join(parts))
+    parts = [f"{label} {metrics[key]}" for key, label in _METRIC_LABELS if key in metrics]
+    if parts:
+        lines.append("  ".join(parts))
 
     # Quoted tweet
-    quoted = data.get("quoted")
     if quoted:
-        lines.append("")
-        lines.append(f"📎 Quoted: {quoted.get('author', '')}")
-        lines.append(f"   {quoted.get('text', '')}")
+        lines += [
+            "",
+            f"📎 Quoted: {quoted.get('author', '')}",
+            f"   {quoted.get('text', '')}",
+        ]
 
-    if data.get("url"):
-        lines.append("")
-        lines.append(f"🔗 {data['url']}")
+    if url:
+        lines += ["", f"🔗 {url}"]
 
     return "\n".join(lines)
 
 
+def _echo_ndjson(tweet: Dict[str, Any]) -> None:
+    """Print one tweet as a single line of JSON."""
+    click.echo(dump_json(tweet, indent=False))
+
+
+async def _load_without_media(
+    session: ChromeSession, page: PageHelper, url: str
+) -> None:
+    """Block media downloads on the session's page, then load url in it.
+
+    The page is opened blank first so the block list covers the first
+    load as well as later scrolling.
+    """
+    await page.block_urls(MEDIA_URL_PATTERNS)
+    await session.navigate(url, wait_event="Page.domContentEventFired")
+
+
+async def _open_tab(
+    session: ChromeSession, url: str, with_media: bool = False
+) -> Tuple[PageHelper, str]:
+    """Open a URL in a new tab of the session's Chrome and attach to it.
+
+    Returns:
+        Tuple of (PageHelper for the tab, target ID)
+    """
+    target = await session.cdp.send(
+        "Target.createTarget", {"url": url if with_media else "about:blank"}
+    )
+    target_id = target["targetId"]
+    attach = await session.cdp.send(
+        "Target.attachToTarget", {"targetId": target_id, "flatten": True}
+    )
+    page = PageHelper(session.cdp, attach["sessionId"])
+    if not with_media:
+        await page.block_urls(MEDIA_URL_PATTERNS)
+        await session.cdp.send(
+            "Page.navigate", {"url": url}, session_id=page.session_id
+        )
+    return page, target_id
+
+
+async def _read_loaded_tweet(page: PageHelper) -> Optional[Dict[str, Any]]:
+    """Extract the main tweet once its page has rendered."""
+    # Wait for content (metrics, media) to finish loading
+    await page.wait_for_network_idle()
+    return await _extract_tweet_data(page, index=0)
+
+
+async def _read_in_new_tab(
+    session: ChromeSession, url: str, limit: asyncio.Semaphore, with_media: bool
+) -> Optional[Dict[str, Any]]:
+    """Read one tweet in its own tab, at most `limit` tabs at a time."""
+    async with limit:
+        page, target_id = await _open_tab(session, url, with_media)
+        try:
+            try:
+                await page.wait_for_selector(TWEET_ARTICLE, timeout=30.0)
+            except TimeoutError:
+                raise TimeoutError(f"Tweet page did not load: {url}")
+            return await _read_loaded_tweet(page)
+        finally:
+            await session.cdp.send("Target.closeTarget", {"targetId": target_id})
+
+
 async def _run_read(
-    tweet_url: str,
+    tweet_urls: Tuple[str, ...],
     output_json: bool,
+    with_media: bool,
     profile: Optional[str],
     chrome_path: Optional[str],
 ) -> None:
@@ -262,16 +438,22 @@ async def _run_read(
     session: Optional[ChromeSession] = None
 
     try:
-        url = _normalize_url(tweet_url)
-        click.echo(f"🔍 Reading tweet: {url}")
+        urls = [normalize_tweet_url(u) for u in tweet_urls]
+        if len(urls) == 1:
+            click.echo(f"🔍 Reading tweet: {urls[0]}")
+        else:
+            click.echo(f"🔍 Reading {len(urls)} tweets")
 
         session = await launch_chrome(
-            url=url,
+            url=urls[0] if with_media else "about:blank",
             profile_dir=profile,
             chrome_path=chrome_path,
+            scrape_mode=not with_media,
         )
 
         page = PageHelper(session.cdp, session.session_id)
+        if not with_media:
+            await _load_without_media(session, page, urls[0])
 
         # Wait for tweet content to load
         click.echo("⏳ Loading tweet...")
@@ -281,28 +463,50 @@ async def _run_read(
                 timeout=30.0,
             )
             if idx == 1:
-                click.echo(
-                    "🔑 Login required! Please log in to X in the Chrome window..."
-                )
+                login_prompt("🔑 Login required! Please log in to X in the Chrome window...")
                 await page.wait_for_selector(TWEET_ARTICLE, timeout=300.0)
         except TimeoutError:
             raise TimeoutError("Tweet page did not load.")
 
-        # Wait for content to render
-        await asyncio.sleep(2.0)
+        if len(urls) == 1:
+            data = await _read_loaded_tweet(page)
 
-        # Extract tweet data
-        data = await _extract_tweet_data(page, index=0)
+            if not data:
+                click.echo("❌ Could not extract tweet data.", err=True)
+                return
 
-        if not data:
-            click.echo("❌ Could not extract tweet data.", err=True)
+            if output_json:
+                click.echo(dump_json(data))
+            else:
+                click.echo("")
+                click.echo(_format_tweet(data))
             return
 
+        # Logged in by now; load the remaining tweets in parallel tabs
+        limit = asyncio.Semaphore(MAX_PARALLEL_TABS)
+        results = await asyncio.gather(
+            _read_loaded_tweet(page),
+            *(_read_in_new_tab(session, url, limit, with_media) for url in urls[1:]),
+            return_exceptions=True,
+        )
+
+        tweets: List[Optional[Dict[str, Any]]] = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                click.echo(f"❌ {url}: {result}", err=True)
+                result = None
+            elif not result:
+                click.echo(f"❌ Could not extract tweet data: {url}", err=True)
+            tweets.append(result or None)
+
         if output_json:
-            click.echo(json.dumps(data, ensure_ascii=False, indent=2))
+            click.echo(dump_json(tweets))
         else:
-            click.echo("")
-            click.echo(_format_tweet(data))
+            for i, (url, tweet) in enumerate(zip(urls, tweets), 1):
+                click.echo(f"{'─' * 50}")
+                click.echo(f"[{i}/{len(urls)}]")
+                click.echo(_format_tweet(tweet) if tweet else f"No tweet data found: {url}")
+                click.echo("")
 
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
@@ -313,19 +517,31 @@ async def _run_read(
 
 
 @click.command("read")
-@click.argument("tweet_url")
+@click.argument("tweet_urls", nargs=-1, required=True)
 @click.option("--json", "-j", "output_json", is_flag=True, help="Output as JSON")
+@click.option(
+    "--with-media",
+    is_flag=True,
+    help="Let Chrome download images (skipped by default)",
+)
 @click.pass_context
-def read_tweet(ctx: click.Context, tweet_url: str, output_json: bool) -> None:
-    """Read a single tweet's content.
+def read_tweet(
+    ctx: click.Context, tweet_urls: Tuple[str, ...], output_json: bool, with_media: bool
+) -> None:
+    """Read one or more tweets.
+
+    Several URLs are loaded in parallel tabs of one Chrome; the output is
+    then a list (a JSON array with --json, null for tweets that failed).
 
     Examples:
 
         xpost read 'https://x.com/user/status/123456'
 
         xpost read 'https://x.com/user/status/123456' --json
+
+        xpost read 'https://x.com/a/status/1' 'https://x.com/b/status/2' --json
     """
     profile = ctx.obj.get("profile")
     chrome_path = ctx.obj.get("chrome_path")
 
-    asyncio.run(_run_read(tweet_url, output_json, profile, chrome_path))
+    asyncio.run(_run_read(tweet_urls, output_json, with_media, profile, chrome_path))
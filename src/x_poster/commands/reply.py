@@ -16,7 +16,7 @@ import click
 from ..chrome import ChromeSession, launch_chrome
 from ..constants import LOGIN_INDICATOR, REPLY_BUTTON, TWEET_BUTTON, TWEET_EDITOR
 from ..page import PageHelper
-from ..utils import normalize_tweet_url
+from ..utils import login_prompt, normalize_tweet_url, wait_for_interrupt
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +62,7 @@ async def _run_reply(
                 timeout=30.0,
             )
             if idx == 1:
-                click.echo("🔑 Please log in to X in Chrome...")
+                login_prompt("🔑 Please log in to X in Chrome...")
                 await page.wait_for_selector(REPLY_BUTTON, timeout=300.0)
         except TimeoutError:
             raise TimeoutError(
@@ -91,23 +91,16 @@ async def _run_reply(
             click.echo("📤 Submitting reply...")
 
             # Check if the tweet button is enabled before clicking
-            is_enabled = await page.evaluate("""
-                (() => {
-                    const btn = document.querySelector('[data-testid="tweetButton"]')
-                             || document.querySelector('[data-testid="tweetButtonInline"]');
-                    if (!btn) return 'not_found';
-                    return btn.disabled ? 'disabled' : 'enabled';
-                })()
-            """)
-            logger.debug("Tweet button state before click: %s", is_enabled)
-
-            if is_enabled == 'disabled':
+            button = await page.inspect_element(TWEET_BUTTON, enabled=True)
+            logger.debug("Tweet button state before click: %s", button)
+
+            if button["exists"] and not button["enabled"]:
                 click.echo("⚠️  Tweet button is disabled, waiting for editor to settle...")
                 await asyncio.sleep(2.0)
 
             # Try CDP click first, then JS click as fallback
             try:
-                await page.click_selector(TWEET_BUTTON)
+                await page.click_selector(TWEET_BUTTON, trusted=True)
             except (TimeoutError, RuntimeError):
                 logger.debug("CDP click on tweet button failed, using JS click")
                 await page.evaluate("""
@@ -132,11 +125,10 @@ async def _run_reply(
         if session and submit:
             await session.cleanup()
         elif session:
-            click.echo("💡 Chrome window left open for review.")
+            click.echo("💡 Chrome window left open for review. Press Ctrl+C to exit.")
             try:
-                while True:
-                    await asyncio.sleep(1)
-            except (KeyboardInterrupt, asyncio.CancelledError):
+                await wait_for_interrupt()
+            finally:
                 await session.cleanup()
 
 
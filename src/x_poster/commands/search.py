@@ -10,21 +10,29 @@ Supports:
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import logging
 import urllib.parse
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import click
 
 from ..chrome import ChromeSession, launch_chrome
 from ..constants import LOGIN_INDICATOR, TWEET_ARTICLE
 from ..page import PageHelper
-from .read import _extract_tweet_data, _format_tweet
+from ..utils import dump_json, login_prompt
+from .read import (
+    _echo_ndjson,
+    _extract_new_tweet_data,
+    _format_tweet,
+    _load_without_media,
+    _scroll_for_more_tweets,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
 def _build_search_url(query: str, search_type: str = "Latest") -> str:
     """Build X search URL.
 
@@ -35,7 +43,11 @@ def _build_search_url(query: str, search_type: str = "Latest") -> str:
     Returns:
         Full search URL
     """
-    encoded = urllib.parse.quote(query)
+    if query.isascii() and query.replace(" ", "").isalnum():
+        # Plain words: only spaces need escaping in a query string
+        encoded = query.replace(" ", "+")
+    else:
+        encoded = urllib.parse.quote(query)
     f_param = "live" if search_type == "Latest" else "top"
     return f"https://x.com/search?q={encoded}&src=typed_query&f={f_param}"
 
@@ -44,36 +56,31 @@ async def _scroll_and_collect_search(
     page: PageHelper,
     count: int,
     max_scroll_attempts: int = 50,
+    on_tweet: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> List[Dict[str, Any]]:
     """Scroll search results and collect tweets."""
     collected = []
-    seen_texts = set()
+    seen = set()
     scroll_attempts = 0
     last_count = 0
     stale_rounds = 0
 
     while len(collected) < count and scroll_attempts < max_scroll_attempts:
-        total_on_page = await page.evaluate(
-            "document.querySelectorAll('article[data-testid=\"tweet\"]').length"
-        )
-
-        if total_on_page is None:
-            total_on_page = 0
-
-        for i in range(total_on_page):
+        for data in await _extract_new_tweet_data(page):
             if len(collected) >= count:
                 break
-
-            data = await _extract_tweet_data(page, index=i)
             if not data:
                 continue
 
-            key = (data.get("text", ""), data.get("handle", ""))
-            if key in seen_texts:
+            # Key on the permalink, falling back to text + handle
+            key = data.get("url") or (data.get("text", ""), data.get("handle", ""))
+            if key in seen:
                 continue
 
-            seen_texts.add(key)
+            seen.add(key)
             collected.append(data)
+            if on_tweet is not None:
+                on_tweet(data)
 
         if len(collected) >= count:
             break
@@ -87,8 +94,7 @@ async def _scroll_and_collect_search(
             stale_rounds = 0
             last_count = len(collected)
 
-        await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
-        await asyncio.sleep(1.5)
+        await _scroll_for_more_tweets(page)
         scroll_attempts += 1
 
     return collected[:count]
@@ -99,6 +105,8 @@ async def _run_search(
     count: int,
     latest: bool,
     output_json: bool,
+    ndjson: bool,
+    with_media: bool,
     profile: Optional[str],
     chrome_path: Optional[str],
 ) -> None:
@@ -108,43 +116,53 @@ async def _run_search(
     try:
         search_type = "Latest" if latest else "Top"
         url = _build_search_url(query, search_type)
-        click.echo(f"🔍 Searching: '{query}' (type: {search_type}, count: {count})")
+        click.echo(f"🔍 Searching: '{query}' (type: {search_type}, count: {count})", err=ndjson)
 
         session = await launch_chrome(
-            url=url,
+            url=url if with_media else "about:blank",
             profile_dir=profile,
             chrome_path=chrome_path,
+            scrape_mode=not with_media,
         )
 
         page = PageHelper(session.cdp, session.session_id)
+        if not with_media:
+            await _load_without_media(session, page, url)
 
         # Wait for results to load
-        click.echo("⏳ Loading search results...")
+        click.echo("⏳ Loading search results...", err=ndjson)
         try:
             idx, selector = await page.wait_for_any_selector(
                 [TWEET_ARTICLE, LOGIN_INDICATOR],
                 timeout=30.0,
             )
             if idx == 1:
-                click.echo(
-                    "🔑 Login required! Please log in to X in the Chrome window..."
+                login_prompt(
+                    "🔑 Login required! Please log in to X in the Chrome window...",
+                    err=ndjson,
                 )
                 await page.wait_for_selector(TWEET_ARTICLE, timeout=300.0)
         except TimeoutError:
-            click.echo("⚠️  No search results found or page did not load.")
+            click.echo("⚠️  No search results found or page did not load.", err=ndjson)
             return
 
-        await asyncio.sleep(2.0)
+        await page.wait_for_network_idle()
 
         # Collect results
-        click.echo("📜 Scrolling and collecting results...")
-        tweets = await _scroll_and_collect_search(page, count)
+        click.echo("📜 Scrolling and collecting results...", err=ndjson)
+        tweets = await _scroll_and_collect_search(
+            page, count, on_tweet=_echo_ndjson if ndjson else None
+        )
+
+        click.echo(f"✅ Found {len(tweets)} tweet(s)", err=ndjson)
+        if ndjson:
+            # Each tweet was already printed as it was collected
+            return
 
-        click.echo(f"✅ Found {len(tweets)} tweet(s)")
         click.echo("")
 
         if output_json:
-            click.echo(json.dumps(tweets, ensure_ascii=False, indent=2))
+            click.echo(dump_json(tweets))
         else:
             for i, tweet in enumerate(tweets, 1):
                 click.echo(f"{'─' * 50}")
@@ -165,8 +183,26 @@ async def _run_search(
 @click.option("--count", "-n", default=10, show_default=True, help="Number of tweets to collect")
 @click.option("--latest", "-l", is_flag=True, help="Sort by Latest (default: Top)")
 @click.option("--json", "-j", "output_json", is_flag=True, help="Output as JSON")
+@click.option(
+    "--ndjson",
+    is_flag=True,
+    help="Stream one JSON object per line as tweets are found (status goes to stderr)",
+)
+@click.option(
+    "--with-media",
+    is_flag=True,
+    help="Let Chrome download images (skipped by default)",
+)
 @click.pass_context
-def search(ctx: click.Context, query: str, count: int, latest: bool, output_json: bool) -> None:
+def search(
+    ctx: click.Context,
+    query: str,
+    count: int,
+    latest: bool,
+    output_json: bool,
+    ndjson: bool,
+    with_media: bool,
+) -> None:
     """Search tweets on X.
 
     Examples:
@@ -176,6 +212,8 @@ def search(ctx: click.Context, query: str, count: int, latest: bool, output_json
         xpost search '#AI' -n 20 --latest
 
         xpost search 'from:elonmusk' -n 10 --json
+
+        xpost search 'AI news' -n 100 --ndjson | jq .url
     """
     if count < 1:
         raise click.UsageError("Count must be at least 1.")
@@ -185,4 +223,8 @@ def search(ctx: click.Context, query: str, count: int, latest: bool, output_json
     profile = ctx.obj.get("profile")
     chrome_path = ctx.obj.get("chrome_path")
 
-    asyncio.run(_run_search(query, count, latest, output_json, profile, chrome_path))
+    asyncio.run(
+        _run_search(
+            query, count, latest, output_json, ndjson, with_media, profile, chrome_path
+        )
+    )
@@ -0,0 +1,42 @@
+"""
+Serve command - Keep Chrome warm for repeated commands.
+
+Runs a long-lived daemon on a Unix socket in the profile directory
+so that wrappers like xpost_run.py can skip Python startup and the
+Chrome launch for every command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import click
+
+from ..daemon import run_server
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.pass_context
+def serve(ctx: click.Context) -> None:
+    """Run a background daemon that keeps Chrome open between commands.
+
+    Reading commands (read, timeline, search, check) and publishing
+    commands with --submit sent over the daemon socket reuse its Chrome
+    session. Preview-mode publishing commands still run standalone.
+
+    Examples:
+
+        xpost serve
+
+        xpost --profile ~/.x-poster/account-a serve
+    """
+    profile = ctx.obj.get("profile")
+    chrome_path = ctx.obj.get("chrome_path")
+
+    try:
+        asyncio.run(run_server(profile, chrome_path))
+    except KeyboardInterrupt:
+        click.echo("👋 xpost daemon stopped")
@@ -10,17 +10,22 @@ Supports:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import click
 
 from ..chrome import ChromeSession, launch_chrome
 from ..constants import LOGIN_INDICATOR, TWEET_ARTICLE
 from ..page import PageHelper
-from ..utils import normalize_profile_url
-from .read import _extract_tweet_data, _format_tweet
+from ..utils import dump_json, login_prompt, normalize_profile_url
+from .read import (
+    _echo_ndjson,
+    _extract_new_tweet_data,
+    _format_tweet,
+    _load_without_media,
+    _scroll_for_more_tweets,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +34,7 @@ async def _scroll_and_collect(
     page: PageHelper,
     count: int,
     max_scroll_attempts: int = 50,
+    on_tweet: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> List[Dict[str, Any]]:
     """Scroll page and collect tweets.
 
@@ -36,41 +42,35 @@ async def _scroll_and_collect(
         page: PageHelper instance
         count: Number of tweets to collect
         max_scroll_attempts: Maximum scroll attempts to prevent infinite loop
+        on_tweet: Called with each new tweet as soon as it is collected
 
     Returns:
         List of tweet data dictionaries
     """
     collected = []
-    seen_texts = set()
+    seen = set()
     scroll_attempts = 0
     last_count = 0
     stale_rounds = 0
 
     while len(collected) < count and scroll_attempts < max_scroll_attempts:
-        # Count available tweets on page
-        total_on_page = await page.evaluate(
-            "document.querySelectorAll('article[data-testid=\"tweet\"]').length"
-        )
-
-        if total_on_page is None:
-            total_on_page = 0
-
-        # Extract new tweets
-        for i in range(total_on_page):
+        # Extract the tweets rendered since the last round
+        for data in await _extract_new_tweet_data(page):
             if len(collected) >= count:
                 break
-
-            data = await _extract_tweet_data(page, index=i)
             if not data:
                 continue
 
-            # Deduplicate by text + handle
-            key = (data.get("text", ""), data.get("handle", ""))
-            if key in seen_texts:
+            # X can render the same tweet twice (e.g. in a thread); key on the
+            # permalink, falling back to text + handle
+            key = data.get("url") or (data.get("text", ""), data.get("handle", ""))
+            if key in seen:
                 continue
 
-            seen_texts.add(key)
+            seen.add(key)
             collected.append(data)
+            if on_tweet is not None:
+                on_tweet(data)
 
         if len(collected) >= count:
             break
@@ -85,9 +85,8 @@ async def _scroll_and_collect(
             stale_rounds = 0
             last_count = len(collected)
 
-        # Scroll down
-        await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
-        await asyncio.sleep(1.5)
+        # Scroll down and wait for X to render more tweets
+        await _scroll_for_more_tweets(page)
         scroll_attempts += 1
 
     return collected[:count]
@@ -97,6 +96,8 @@ async def _run_timeline(
     user_url: str,
     count: int,
     output_json: bool,
+    ndjson: bool,
+    with_media: bool,
     profile: Optional[str],
     chrome_path: Optional[str],
 ) -> None:
@@ -105,43 +106,53 @@ async def _run_timeline(
 
     try:
         url = normalize_profile_url(user_url)
-        click.echo(f"🔍 Reading timeline: {url} (up to {count} tweets)")
+        click.echo(f"🔍 Reading timeline: {url} (up to {count} tweets)", err=ndjson)
 
         session = await launch_chrome(
-            url=url,
+            url=url if with_media else "about:blank",
             profile_dir=profile,
             chrome_path=chrome_path,
+            scrape_mode=not with_media,
         )
 
         page = PageHelper(session.cdp, session.session_id)
+        if not with_media:
+            await _load_without_media(session, page, url)
 
         # Wait for page to load
-        click.echo("⏳ Loading timeline...")
+        click.echo("⏳ Loading timeline...", err=ndjson)
         try:
             idx, selector = await page.wait_for_any_selector(
                 [TWEET_ARTICLE, LOGIN_INDICATOR],
                 timeout=30.0,
             )
             if idx == 1:
-                click.echo(
-                    "🔑 Login required! Please log in to X in the Chrome window..."
+                login_prompt(
+                    "🔑 Login required! Please log in to X in the Chrome window...",
+                    err=ndjson,
                 )
                 await page.wait_for_selector(TWEET_ARTICLE, timeout=300.0)
         except TimeoutError:
             raise TimeoutError("Timeline page did not load. User may not exist or account is suspended.")
 
-        # Wait for initial render
-        await asyncio.sleep(2.0)
+        # Wait for the initial batch to finish loading
+        await page.wait_for_network_idle()
 
         # Scroll and collect tweets
-        click.echo("📜 Scrolling and collecting tweets...")
-        tweets = await _scroll_and_collect(page, count)
+        click.echo("📜 Scrolling and collecting tweets...", err=ndjson)
+        tweets = await _scroll_and_collect(
+            page, count, on_tweet=_echo_ndjson if ndjson else None
+        )
+
+        click.echo(f"✅ Collected {len(tweets)} tweet(s)", err=ndjson)
+        if ndjson:
+            # Each tweet was already printed as it was collected
+            return
 
-        click.echo(f"✅ Collected {len(tweets)} tweet(s)")
         click.echo("")
 
         if output_json:
-            click.echo(json.dumps(tweets, ensure_ascii=False, indent=2))
+            click.echo(dump_json(tweets))
         else:
             for i, tweet in enumerate(tweets, 1):
                 click.echo(f"{'─' * 50}")
@@ -161,8 +172,25 @@ async def _run_timeline(
 @click.argument("user_url")
 @click.option("--count", "-n", default=10, show_default=True, help="Number of tweets to read")
 @click.option("--json", "-j", "output_json", is_flag=True, help="Output as JSON")
+@click.option(
+    "--ndjson",
+    is_flag=True,
+    help="Stream one JSON object per line as tweets are found (status goes to stderr)",
+)
+@click.option(
+    "--with-media",
+    is_flag=True,
+    help="Let Chrome download images (skipped by default)",
+)
 @click.pass_context
-def timeline(ctx: click.Context, user_url: str, count: int, output_json: bool) -> None:
+def timeline(
+    ctx: click.Context,
+    user_url: str,
+    count: int,
+    output_json: bool,
+    ndjson: bool,
+    with_media: bool,
+) -> None:
     """Read tweets from a user's timeline.
 
     USER_URL can be a full URL or just the handle (@username or username).
@@ -174,6 +202,8 @@ def timeline(ctx: click.Context, user_url: str, count: int, output_json: bool) -
         xpost timeline 'https://x.com/elonmusk' -n 20
 
         xpost timeline 'elonmusk' -n 10 --json
+
+        xpost timeline 'elonmusk' -n 100 --ndjson | jq .text
     """
     if count < 1:
         raise click.UsageError("Count must be at least 1.")
@@ -183,4 +213,8 @@ def timeline(ctx: click.Context, user_url: str, count: int, output_json: bool) -
     profile = ctx.obj.get("profile")
     chrome_path = ctx.obj.get("chrome_path")
 
-    asyncio.run(_run_timeline(user_url, count, output_json, profile, chrome_path))
+    asyncio.run(
+        _run_timeline(
+            user_url, count, output_json, ndjson, with_media, profile, chrome_path
+        )
+    )
@@ -18,6 +18,7 @@ import click
 from ..chrome import ChromeSession, launch_chrome
 from ..constants import LOGIN_INDICATOR, TWEET_BUTTON, TWEET_EDITOR
 from ..page import PageHelper
+from ..utils import login_prompt, wait_for_interrupt
 
 logger = logging.getLogger(__name__)
 
@@ -30,44 +31,57 @@ SUPPORTED_VIDEO_FORMATS = (".mp4", ".mov", ".webm")
 MAX_VIDEO_WAIT = 180  # seconds
 
 
+# {ready: true} once the tweet button is enabled, {error: text} once an
+# error toast shows up, else null
+_VIDEO_STATE_CHECK = (
+    "() => {"
+    "  const btn = document.querySelector('[data-testid=\"tweetButton\"]');"
+    "  if (btn && !btn.disabled && !btn.getAttribute('aria-disabled')) return {ready: true};"
+    "  if (document.querySelector('[data-testid=\"toast\"] [role=\"alert\"]')) {"
+    "    return {error: document.querySelector('[data-testid=\"toast\"]').textContent};"
+    "  }"
+    "  return null;"
+    "}"
+)
+
+# Progress message interval while waiting
+_PROGRESS_INTERVAL = 10.0
+
+
+async def _report_progress(start: float) -> None:
+    """Print a "still processing" line every _PROGRESS_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(_PROGRESS_INTERVAL)
+        click.echo(f"  ⏳ Still processing... ({time.monotonic() - start:.0f}s)")
+
+
 async def _wait_for_video_ready(page: PageHelper, timeout: float = MAX_VIDEO_WAIT) -> None:
     """Wait for video processing to complete.
 
     X processes uploaded videos server-side. We detect completion by
-    checking if the tweet button becomes enabled/clickable.
+    checking if the tweet button becomes enabled/clickable. The page
+    reports the change as it happens (see PageHelper.wait_for_function),
+    so nothing is polled; progress lines come from a separate task.
     """
     click.echo(f"⏳ Waiting for video processing (up to {timeout}s)...")
     start = time.monotonic()
 
-    while (time.monotonic() - start) < timeout:
-        # Check if tweet button is enabled (video processing done)
-        enabled = await page.is_element_enabled(
-            '[data-testid="tweetButton"]'
-        )
-        if enabled:
-            elapsed = time.monotonic() - start
-            click.echo(f"✅ Video processing complete ({elapsed:.0f}s)")
-            return
-
-        # Also check for error indicators
-        has_error = await page.evaluate(
-            "!!document.querySelector('[data-testid=\"toast\"] [role=\"alert\"]')"
-        )
-        if has_error:
-            error_text = await page.get_element_text('[data-testid="toast"]')
-            raise RuntimeError(f"Video upload error: {error_text}")
-
-        elapsed = time.monotonic() - start
-        # Show progress every ~10 seconds
-        if elapsed >= 10 and int(elapsed) // 10 != int(elapsed - 2) // 10:
-            click.echo(f"  ⏳ Still processing... ({elapsed:.0f}s)")
+    progress_task = asyncio.create_task(_report_progress(start))
+    try:
+        state = await page.wait_for_function(_VIDEO_STATE_CHECK, timeout=timeout)
+    finally:
+        progress_task.cancel()
 
-        await asyncio.sleep(2.0)
+    if state is None:
+        raise TimeoutError(
+            f"Video processing did not complete within {timeout}s. "
+            "The video may be too large or in an unsupported format."
+        )
+    if "error" in state:
+        raise RuntimeError(f"Video upload error: {state['error']}")
 
-    raise TimeoutError(
-        f"Video processing did not complete within {timeout}s. "
-        "The video may be too large or in an unsupported format."
-    )
+    elapsed = time.monotonic() - start
+    click.echo(f"✅ Video processing complete ({elapsed:.0f}s)")
 
 
 async def _run_video(
@@ -108,7 +122,7 @@ async def _run_video(
                 [TWEET_EDITOR, LOGIN_INDICATOR], timeout=60.0
             )
             if idx == 1:
-                click.echo("🔑 Please log in to X in Chrome...")
+                login_prompt("🔑 Please log in to X in Chrome...")
                 await page.wait_for_selector(TWEET_EDITOR, timeout=300.0)
         except TimeoutError:
             raise TimeoutError("Editor did not appear. Is X accessible?")
@@ -118,16 +132,7 @@ async def _run_video(
         # Upload video via file input
         click.echo(f"🎬 Uploading video: {os.path.basename(video_path)}")
 
-        # Find and set file input - X may have hidden file inputs
-        # First try to make file input visible/accessible
-        await page.evaluate(
-            "(() => {"
-            "  const inputs = document.querySelectorAll('input[type=\"file\"]');"
-            "  inputs.forEach(i => { i.style.display = 'block'; i.style.opacity = '1'; });"
-            "})()"
-        )
-        await asyncio.sleep(0.3)
-
+        # X's file inputs are hidden; DOM.setFileInputFiles does not care
         await page.upload_file(abs_video, 'input[type="file"]')
 
         # Wait for video processing
@@ -142,7 +147,7 @@ async def _run_video(
         # Submit or preview
         if submit:
             click.echo("📤 Submitting post...")
-            await page.click_selector('[data-testid="tweetButton"]')
+            await page.click_selector('[data-testid="tweetButton"]', trusted=True)
             await asyncio.sleep(2.0)
             click.echo("✅ Video post submitted!")
         else:
@@ -158,11 +163,10 @@ async def _run_video(
         if session and submit:
             await session.cleanup()
         elif session:
-            click.echo("💡 Chrome window left open for review.")
+            click.echo("💡 Chrome window left open for review. Press Ctrl+C to exit.")
             try:
-                while True:
-                    await asyncio.sleep(1)
-            except (KeyboardInterrupt, asyncio.CancelledError):
+                await wait_for_interrupt()
+            finally:
                 await session.cleanup()
 
 
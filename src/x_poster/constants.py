@@ -5,6 +5,10 @@ Centralizes X DOM selectors and common configuration
 to avoid duplication across command modules.
 """
 
+import os
+
+DEFAULT_PROFILE_DIR = os.path.expanduser("~/.local/share/x-poster-profile")
+
 # ── Tweet compose/edit selectors ──────────────────────────────────
 TWEET_EDITOR = '[data-testid="tweetTextarea_0"]'
 TWEET_BUTTON = '[data-testid="tweetButton"], [data-testid="tweetButtonInline"]'
@@ -21,3 +25,16 @@ UNRETWEET_BUTTON = '[data-testid="unretweet"]'
 
 # ── Auth selectors ────────────────────────────────────────────────
 LOGIN_INDICATOR = '[data-testid="loginButton"], [href="/login"]'
+
+# ── Scraping ──────────────────────────────────────────────────────
+# Image, emoji and font downloads that reading commands never look at;
+# image URLs come from the DOM, not from the loaded bytes. X serves
+# images with the format in the query string, so block by host. Video
+# stays allowed: the player only sets the <video> src that read reports
+# after fetching the playlist from video.twimg.com.
+MEDIA_URL_PATTERNS = [
+    "*://pbs.twimg.com/*",
+    "*://abs.twimg.com/emoji/*",
+    "*.woff2",
+    "*.woff",
+]
@@ -0,0 +1,180 @@
+"""
+Background server that keeps a Python process and Chrome warm.
+
+`xpost serve` launches Chrome once and listens on a Unix socket inside
+the profile directory. Clients (`xpost` itself and the skill's
+xpost_run.py) send a command line as one JSON line and receive its exit
+code and output, skipping the Chrome launch/teardown per command.
+The client side lives in daemon_client.py.
+
+Protocol (one request per connection):
+- Request:  {"argv": ["read", "https://x.com/...", "--json"], "cwd": "/..."}
+            ("cwd" is optional; relative paths in argv resolve against it)
+- Response: {"code": 0, "stdout": "...", "stderr": "..."}
+            or {"fallback": true} if the command must run standalone
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+from .chrome import ChromeSession, launch_chrome
+from .constants import DEFAULT_PROFILE_DIR
+from .daemon_client import _profile_option, can_serve, socket_path
+
+logger = logging.getLogger(__name__)
+
+
+def _run_cli(
+    argv: List[str], cwd: Optional[str] = None, profile_dir: Optional[str] = None
+) -> Tuple[int, str, str]:
+    """Run one xpost command line in-process, capturing its output.
+
+    Runs in the client's working directory if given, so relative paths
+    (images, Markdown files) mean what they meant to the client. Commands
+    are serialized by the server lock, so changing the process-wide
+    directory is safe.
+
+    A client that picked the socket through XPOST_PROFILE sends no
+    --profile, and this process has its own environment; the daemon's
+    profile_dir is passed explicitly so such commands still use it.
+    """
+    from .cli import cli
+
+    if profile_dir and _profile_option(argv) is None:
+        argv = ["--profile", profile_dir] + argv
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    previous_cwd = os.getcwd()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            if cwd:
+                os.chdir(cwd)
+            cli.main(args=argv, prog_name="xpost", standalone_mode=False)
+            code = 0
+        except click.exceptions.Exit as e:
+            code = e.exit_code
+        except click.ClickException as e:
+            e.show()
+            code = e.exit_code
+        except click.Abort:
+            click.echo("Aborted!", err=True)
+            code = 1
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            # Commands already echo "❌ Error: ..." before re-raising
+            code = 1
+        finally:
+            os.chdir(previous_cwd)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+async def _handle_client(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    lock: asyncio.Lock,
+    profile_dir: str,
+) -> None:
+    """Handle a single client request.
+
+    Every request gets a response: once a client has sent its command
+    line it cannot tell whether the command ran, so it never retries on
+    its own.
+    """
+    try:
+        line = await reader.readline()
+        if not line:
+            return  # a liveness probe from _is_running
+        request = json.loads(line.decode("utf-8"))
+        argv = [str(a) for a in request.get("argv", [])]
+
+        response: Dict[str, Any]
+        if not can_serve(argv):
+            response = {"fallback": True}
+        else:
+            logger.info("Running: xpost %s", " ".join(argv))
+            # Commands drive the shared Chrome, so run them one at a time
+            async with lock:
+                loop = asyncio.get_running_loop()
+                code, out, err = await loop.run_in_executor(
+                    None, _run_cli, argv, request.get("cwd"), profile_dir
+                )
+            response = {"code": code, "stdout": out, "stderr": err}
+
+        writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writer.drain()
+    except Exception as e:
+        logger.exception("Error handling daemon request")
+        response = {"code": 1, "stderr": f"❌ xpost daemon error: {e}\n"}
+        try:
+            writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            await writer.drain()
+        except OSError:
+            pass
+    finally:
+        writer.close()
+
+
+async def _is_running(path: str) -> bool:
+    """Check whether another daemon is already listening on the socket."""
+    try:
+        _, writer = await asyncio.open_unix_connection(path)
+    except OSError:
+        return False
+    writer.close()
+    return True
+
+
+async def run_server(
+    profile_dir: Optional[str] = None,
+    chrome_path: Optional[str] = None,
+) -> None:
+    """Launch Chrome and serve xpost commands until interrupted.
+
+    Commands run in this process reuse the daemon's Chrome through the
+    profile's DevToolsActivePort file, so they attach instead of launching
+    and never tear Chrome down.
+    """
+    profile_dir = profile_dir or DEFAULT_PROFILE_DIR
+    path = socket_path(profile_dir)
+    # Commands fail at a login wall instead of waiting (see login_prompt)
+    os.environ["XPOST_DAEMON"] = "1"
+
+    if await _is_running(path):
+        raise click.ClickException(f"xpost daemon already running: {path}")
+    if os.path.exists(path):
+        os.unlink(path)
+
+    session: Optional[ChromeSession] = None
+    server: Optional[asyncio.AbstractServer] = None
+    lock = asyncio.Lock()
+
+    try:
+        session = await launch_chrome(
+            url="about:blank",
+            profile_dir=profile_dir,
+            chrome_path=chrome_path,
+        )
+        server = await asyncio.start_unix_server(
+            lambda r, w: _handle_client(r, w, lock, profile_dir), path=path
+        )
+        os.chmod(path, 0o600)
+        click.echo(f"🟢 xpost daemon listening on {path} (Ctrl+C to stop)")
+        await server.serve_forever()
+    finally:
+        os.environ.pop("XPOST_DAEMON", None)
+        if server is not None:
+            server.close()
+        if os.path.exists(path):
+            os.unlink(path)
+        if session is not None:
+            await session.cleanup()
@@ -0,0 +1,118 @@
+"""
+Client side of the `xpost serve` daemon protocol (see daemon.py).
+
+Kept to the standard library so `xpost` can check for a running daemon
+and hand its command line over without importing Chrome/CDP code.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from typing import List, Optional
+
+from .constants import DEFAULT_PROFILE_DIR
+
+SOCKET_NAME = "xpost.sock"
+
+# Commands that always finish on their own. Publishing commands only
+# finish with --submit; in preview mode they hold the window open until
+# Ctrl+C, which would block the server, so they run standalone instead.
+ONE_SHOT_COMMANDS = {"read", "timeline", "search", "check"}
+SUBMIT_FLAGS = {"-s", "--submit"}
+
+# The daemon replies once a command has finished, so output meant to be
+# read while the command runs would only arrive at the end
+STREAMING_FLAGS = {"--ndjson"}
+
+# Global options that consume the following argument
+_GLOBAL_VALUE_OPTIONS = {"--profile", "--chrome-path"}
+
+
+def socket_path(profile_dir: Optional[str] = None) -> str:
+    """Return the daemon socket path for a Chrome profile directory."""
+    return os.path.join(profile_dir or DEFAULT_PROFILE_DIR, SOCKET_NAME)
+
+
+def _command_name(argv: List[str]) -> Optional[str]:
+    """Return the subcommand name from a full xpost argument list."""
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in _GLOBAL_VALUE_OPTIONS:
+            skip_next = True
+            continue
+        if arg.startswith("-"):
+            continue
+        return arg
+    return None
+
+
+def _profile_option(argv: List[str]) -> Optional[str]:
+    """Return the --profile value from a full xpost argument list."""
+    for i, arg in enumerate(argv):
+        if arg == "--profile" and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith("--profile="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def can_serve(argv: List[str]) -> bool:
+    """Check whether a command line can be run inside the daemon."""
+    name = _command_name(argv)
+    if name is None or name == "serve":
+        return False
+    if any(a in STREAMING_FLAGS for a in argv):
+        return False
+    return name in ONE_SHOT_COMMANDS or any(a in SUBMIT_FLAGS for a in argv)
+
+
+def run_via_daemon(argv: List[str]) -> Optional[int]:
+    """Run a command line through a running daemon, if there is one.
+
+    Only a failed connect or an explicit fallback reply lets the caller
+    run the command standalone. Once the request is sent the daemon may
+    already have run it (e.g. published a post), so a missing reply is
+    reported as a failure rather than retried.
+
+    Returns:
+        The command's exit code, or None if no daemon is listening or the
+        command has to run standalone
+    """
+    if not hasattr(socket, "AF_UNIX") or not can_serve(argv):
+        return None
+
+    profile = _profile_option(argv) or os.environ.get("XPOST_PROFILE")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path(profile))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        request = {"argv": argv, "cwd": os.getcwd()}
+        try:
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                data = f.read()
+        except OSError as e:
+            sys.stderr.write(f"❌ Lost connection to xpost daemon: {e}\n")
+            return 1
+
+    try:
+        response = json.loads(data.decode("utf-8"))
+    except ValueError:
+        sys.stderr.write("❌ xpost daemon closed the connection without a reply\n")
+        return 1
+    if response.get("fallback"):
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response.get("code", 1)
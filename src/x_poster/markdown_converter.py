@@ -12,23 +12,36 @@ Features:
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import hashlib
+import html as _html
 import logging
 import os
 import re
+import shutil
 import tempfile
+import urllib.parse
+import urllib.request
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 try:
     import markdown
     from markdown.extensions import fenced_code
     from markdown.extensions.codehilite import CodeHiliteExtension
+    from markdown.treeprocessors import Treeprocessor
 except ImportError:
     markdown = None
+    Treeprocessor = object
 
 try:
     from pygments import highlight
@@ -42,6 +55,16 @@ logger = logging.getLogger(__name__)
 IMAGE_CACHE_DIR = os.path.expanduser("~/.cache/x-poster/images")
 IMAGE_PLACEHOLDER_PATTERN = "XIMGPH_{index}"
 
+# Remote images downloaded at once while converting an article
+MAX_IMAGE_DOWNLOADS = 8
+
+_IMG_RE = re.compile(r'<img\s+[^>]*src=["\']([^"\']+)["\'][^>]*/?>', re.IGNORECASE)
+_HEADING_RE = re.compile(r"<(/?)h[2-6]>")
+_CODE_BLOCK_RE = re.compile(
+    r'<pre><code\s*(?:class="language-(\w+)")?\s*>(.*?)</code></pre>',
+    re.DOTALL,
+)
+
 
 @dataclass
 class ParsedArticle:
@@ -70,18 +93,23 @@ def _parse_frontmatter(content: str) -> Tuple[dict, str]:
     Returns:
         Tuple of (frontmatter_dict, remaining_content)
     """
-    if not content.startswith("---"):
+    if content.startswith("---\n"):
+        start = 4
+    elif content.startswith("---\r\n"):
+        start = 5
+    else:
         return {}, content
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    # Slice around the closing fence instead of splitting the whole file
+    end = content.find("\n---", start - 1)
+    if end < 0:
         return {}, content
 
     try:
-        fm = yaml.safe_load(parts[1])
+        fm = yaml.load(content[start:end], Loader=_YamlLoader)
         if not isinstance(fm, dict):
             return {}, content
-        return fm, parts[2].strip()
+        return fm, content[end + 4:].strip()
     except yaml.YAMLError:
         return {}, content
 
@@ -94,29 +122,40 @@ def _download_image(url: str, base_dir: str) -> str:
         base_dir: Base directory for relative path resolution
 
     Returns:
-        Local path to the downloaded image
+        Local path to the downloaded image (the URL itself on failure)
     """
+    if urllib.parse.urlsplit(url).scheme.lower() not in ("http", "https"):
+        logger.warning("Not downloading image with unsupported URL scheme: %s", url)
+        return url
+
     os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
 
     # Generate cache filename from URL hash
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:16]
-    ext = os.path.splitext(url.split("?")[0])[1] or ".png"
+    url_hash = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+    ext = os.path.splitext(urllib.parse.urlsplit(url).path)[1] or ".png"
     cache_path = os.path.join(IMAGE_CACHE_DIR, f"{url_hash}{ext}")
 
     if os.path.isfile(cache_path):
         return cache_path
 
+    # Written under a per-process name and renamed into place when
+    # complete, so a crashed or concurrent download never yields a
+    # truncated cache hit
+    partial_path = f"{cache_path}.{os.getpid()}.partial"
     try:
-        import urllib.request
         req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
         with urllib.request.urlopen(req, timeout=30) as resp:
-            with open(cache_path, "wb") as f:
-                f.write(resp.read())
+            with open(partial_path, "wb") as f:
+                shutil.copyfileobj(resp, f, length=65536)
+        os.replace(partial_path, cache_path)
         logger.info("Downloaded image: %s -> %s", url, cache_path)
         return cache_path
     except Exception as e:
         logger.warning("Failed to download image %s: %s", url, e)
         return url
+    finally:
+        if os.path.exists(partial_path):
+            os.unlink(partial_path)
 
 
 def _resolve_image_path(src: str, base_dir: str) -> str:
@@ -136,34 +175,96 @@ def _resolve_image_path(src: str, base_dir: str) -> str:
     return os.path.abspath(os.path.join(base_dir, src))
 
 
-def _process_images(html: str, base_dir: str) -> Tuple[str, List[str], Dict[str, str]]:
+def _resolve_image_paths(srcs: List[str], base_dir: str) -> Dict[str, str]:
+    """Resolve image sources to local paths, downloading remote ones in parallel.
+
+    Returns:
+        Map of each distinct source to its local path
+    """
+    unique = list(dict.fromkeys(srcs))
+    remote = [src for src in unique if src.startswith(("http://", "https://"))]
+    resolved: Dict[str, str] = {}
+    if remote:
+        workers = min(MAX_IMAGE_DOWNLOADS, len(remote))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            paths = pool.map(lambda url: _download_image(url, base_dir), remote)
+            resolved.update(zip(remote, paths))
+    for src in unique:
+        if src not in resolved:
+            resolved[src] = _resolve_image_path(src, base_dir)
+    return resolved
+
+
+class _ImagePlaceholderProcessor(Treeprocessor):
+    """Swap Markdown images for [XIMGPH_N] paragraphs while rendering.
+
+    Images are replaced in the element tree, so no pass over the rendered
+    HTML is needed for them. Their sources are appended to `srcs` in
+    placeholder order.
+    """
+
+    def __init__(self, md: Any, srcs: List[str]):
+        super().__init__(md)
+        self.srcs = srcs
+
+    def run(self, root: Any) -> None:
+        for img in list(root.iter("img")):
+            placeholder = IMAGE_PLACEHOLDER_PATTERN.format(index=len(self.srcs))
+            self.srcs.append(img.get("src", ""))
+            img.tag = "p"
+            img.attrib.clear()
+            img.text = f"[{placeholder}]"
+
+
+def _process_images(
+    html: str, base_dir: str, srcs: Optional[List[str]] = None
+) -> Tuple[str, List[str], Dict[str, str]]:
     """Replace images in HTML with placeholders.
 
-    Scans for <img> tags, replaces them with XIMGPH_N placeholders,
-    and returns a mapping of placeholders to image paths.
+    Images already turned into placeholders during rendering are passed
+    in as srcs and keep their numbers; any raw <img> tags left in the HTML
+    are replaced after them. Returns a mapping of placeholders to image
+    paths.
 
     Args:
         html: HTML string with <img> tags
         base_dir: Base directory for relative image resolution
+        srcs: Sources of the images rendered as XIMGPH_0, XIMGPH_1, ...
 
     Returns:
         Tuple of (modified_html, image_list, placeholder_map)
     """
-    images = []
-    placeholders = {}
-    img_pattern = re.compile(r'<img\s+[^>]*src=["\']([^"\']+)["\'][^>]*/?>', re.IGNORECASE)
+    srcs = srcs or []
+    raw = [m.group(1) for m in _IMG_RE.finditer(html)]
+    paths = _resolve_image_paths(srcs + raw, base_dir)
+
+    images: List[str] = []
+    placeholders: Dict[str, str] = {}
+
+    def add(src: str) -> str:
+        placeholder = IMAGE_PLACEHOLDER_PATTERN.format(index=len(images))
+        images.append(paths[src])
+        placeholders[placeholder] = paths[src]
+        return placeholder
+
+    for src in srcs:
+        add(src)
+
+    if raw:
+        html = _IMG_RE.sub(lambda m: f'<p>[{add(m.group(1))}]</p>', html)
+    return html, images, placeholders
 
-    def replace_img(match: re.Match) -> str:
-        src = match.group(1)
-        local_path = _resolve_image_path(src, base_dir)
-        index = len(images)
-        placeholder = IMAGE_PLACEHOLDER_PATTERN.format(index=index)
-        images.append(local_path)
-        placeholders[placeholder] = local_path
-        return f'<p>[{placeholder}]</p>'
 
-    processed = img_pattern.sub(replace_img, html)
-    return processed, images, placeholders
+@functools.lru_cache(maxsize=None)
+def _lexer(name: str) -> Any:
+    """Get (and cache) the Pygments lexer for a language name."""
+    return get_lexer_by_name(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _formatter() -> Any:
+    """Get (and cache) the HTML formatter; it builds its style on creation."""
+    return HtmlFormatter(nowrap=True, style="monokai")
 
 
 def _highlight_code_block(code: str, language: str) -> str:
@@ -172,30 +273,33 @@ def _highlight_code_block(code: str, language: str) -> str:
     Falls back to plain <pre><code> if Pygments is unavailable.
     """
     if highlight is None:
-        escaped = code.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        escaped = _html.escape(code, quote=False)
         return f'<blockquote><pre><code class="language-{language}">{escaped}</code></pre></blockquote>'
 
     try:
         if language:
-            lexer = get_lexer_by_name(language)
+            lexer = _lexer(language)
         else:
             lexer = guess_lexer(code)
     except Exception:
         from pygments.lexers import TextLexer
         lexer = TextLexer()
 
-    formatter = HtmlFormatter(nowrap=True, style="monokai")
-    highlighted = highlight(code, lexer, formatter)
+    highlighted = highlight(code, lexer, _formatter())
     return f'<blockquote><pre>{highlighted}</pre></blockquote>'
 
 
-def _custom_render_markdown(md_content: str) -> str:
+def _custom_render_markdown(
+    md_content: str, image_srcs: Optional[List[str]] = None
+) -> Tuple[str, str]:
     """Render Markdown to HTML with custom rules for X Articles.
 
     Custom rules:
     - H1 is extracted as title (not rendered)
     - H2-H6 are all rendered as <h2>
     - Code blocks are wrapped in <blockquote> with syntax highlighting
+    - If image_srcs is given, Markdown images become [XIMGPH_N]
+      placeholders and their sources are appended to it
     """
     if markdown is None:
         raise RuntimeError(
@@ -217,31 +321,25 @@ def _custom_render_markdown(md_content: str) -> str:
 
     # Convert markdown to HTML
     extensions = ["fenced_code", "tables", "nl2br"]
-    html = markdown.markdown(processed_md, extensions=extensions)
+    md = markdown.Markdown(extensions=extensions)
+    if image_srcs is not None:
+        # Lowest priority: runs after the inline pass has created the images
+        md.treeprocessors.register(
+            _ImagePlaceholderProcessor(md, image_srcs), "xpost_images", 0
+        )
+    html = md.convert(processed_md)
 
     # Post-process: normalize headings (h2-h6 -> h2)
-    for level in range(6, 1, -1):
-        html = html.replace(f"<h{level}>", "<h2>").replace(f"</h{level}>", "</h2>")
+    html = _HEADING_RE.sub(r"<\1h2>", html)
 
     # Post-process: wrap code blocks in blockquote
-    code_block_pattern = re.compile(
-        r'<pre><code\s*(?:class="language-(\w+)")?\s*>(.*?)</code></pre>',
-        re.DOTALL,
-    )
-
     def replace_code(match: re.Match) -> str:
         language = match.group(1) or ""
-        code = match.group(2)
         # Unescape HTML entities in code
-        code = (
-            code.replace("&amp;", "&")
-            .replace("&lt;", "<")
-            .replace("&gt;", ">")
-            .replace("&quot;", '"')
-        )
+        code = _html.unescape(match.group(2))
         return _highlight_code_block(code, language)
 
-    html = code_block_pattern.sub(replace_code, html)
+    html = _CODE_BLOCK_RE.sub(replace_code, html)
 
     return html, extracted_title
 
@@ -277,7 +375,8 @@ def parse_markdown(
     frontmatter, md_content = _parse_frontmatter(content)
 
     # Render markdown to HTML
-    html, h1_title = _custom_render_markdown(md_content)
+    image_srcs: List[str] = []
+    html, h1_title = _custom_render_markdown(md_content, image_srcs)
 
     # Determine title (priority: CLI override > frontmatter > H1)
     title = title_override or frontmatter.get("title", "") or h1_title
@@ -288,7 +387,7 @@ def parse_markdown(
         cover = _resolve_image_path(cover, base_dir)
 
     # Process images -> placeholders
-    html, images, placeholders = _process_images(html, base_dir)
+    html, images, placeholders = _process_images(html, base_dir, image_srcs)
 
     return ParsedArticle(
         title=title,
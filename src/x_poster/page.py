@@ -12,13 +12,65 @@ Provides high-level abstractions for common page interactions:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from .cdp_client import CdpClient
+from .cdp_client import CdpClient, CdpError
 
 logger = logging.getLogger(__name__)
 
+# Longest single in-page wait, kept below the CDP command timeout
+_OBSERVE_CHUNK = 10.0
+
+# First delay before retrying a wait cut short by a navigation; it grows
+# by half on each further failure, up to the caller's retry delay
+_RETRY_DELAY_START = 0.025
+
+# Text longer than this is pasted in one event rather than typed
+_PASTE_THRESHOLD = 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _observing(check: str) -> str:
+    """Turn a JS check function into one that waits for it to pass.
+
+    The returned declaration takes (arg, timeoutMs). It re-runs check(arg)
+    on every DOM mutation and resolves with its first truthy result, or
+    with null after timeoutMs. A check that throws counts as not passed.
+    """
+    return (
+        "function(arg, timeoutMs) {"
+        f"  const check = {check};"
+        "  const test = () => { try { return check(arg); } catch (e) { return null; } };"
+        "  const now = test();"
+        "  if (now) return now;"
+        "  return new Promise(resolve => {"
+        "    let timer;"
+        "    const mo = new MutationObserver(() => {"
+        "      const r = test();"
+        "      if (r) { mo.disconnect(); clearTimeout(timer); resolve(r); }"
+        "    });"
+        "    mo.observe(document, {"
+        "      childList: true, subtree: true, attributes: true, characterData: true"
+        "    });"
+        "    timer = setTimeout(() => { mo.disconnect(); resolve(test() || null); }, timeoutMs);"
+        "  });"
+        "}"
+    )
+
+
+# First selector of a list that matches an element
+_FIRST_PRESENT_CHECK = "sels => sels.find(s => document.querySelector(s))"
+# Whether the element matching a selector is rendered
+_VISIBLE_CHECK = (
+    "sel => { const el = document.querySelector(sel); return !!el && el.offsetParent !== null; }"
+)
+# Clicks the element matching a selector as soon as there is one
+_CLICK_CHECK = (
+    "sel => { const el = document.querySelector(sel); if (el) { el.click(); return true; } }"
+)
+
 
 class PageHelper:
     """High-level page operation helper using CDP.
@@ -31,6 +83,8 @@ class PageHelper:
     def __init__(self, cdp: CdpClient, session_id: str):
         self.cdp = cdp
         self.session_id = session_id
+        self._global_object_id: Optional[str] = None
+        self._network_enabled = False
 
     async def evaluate(self, expression: str, await_promise: bool = False) -> Any:
         """Execute JavaScript in the page context.
@@ -49,7 +103,68 @@ class PageHelper:
         result = await self.cdp.send(
             "Runtime.evaluate", params, session_id=self.session_id
         )
+        return self._result_value(result)
+
+    async def call_function(
+        self,
+        declaration: str,
+        *args: Any,
+        await_promise: bool = False,
+        by_value: bool = True,
+    ) -> Any:
+        """Call a JavaScript function in the page with the given arguments.
+
+        Uses Runtime.callFunctionOn, so the function source is identical
+        across calls (V8 reuses its compiled code) and arguments are passed
+        as JSON values instead of being interpolated into the source.
+
+        Args:
+            declaration: Function source, e.g. "function(a, b) { ... }"
+            *args: JSON-serializable arguments
+            await_promise: Whether to await if the function returns a Promise
+            by_value: If False, return the Runtime.RemoteObject describing
+                the result (e.g. for its objectId) instead of its value
+
+        Returns:
+            The function's return value
+        """
+        params: Dict[str, Any] = {
+            "functionDeclaration": declaration,
+            "arguments": [{"value": arg} for arg in args],
+            "returnByValue": by_value,
+        }
+        if await_promise:
+            params["awaitPromise"] = True
+
+        for attempt in range(2):
+            params["objectId"] = await self._get_global_object_id()
+            try:
+                result = await self.cdp.send(
+                    "Runtime.callFunctionOn", params, session_id=self.session_id
+                )
+                break
+            except CdpError:
+                # The cached global object dies with its context on navigation
+                self._global_object_id = None
+                if attempt:
+                    raise
+        value = self._result_value(result)
+        return value if by_value else result["result"]
+
+    async def _get_global_object_id(self) -> str:
+        """Get (and cache) the remote object ID of the page's globalThis."""
+        if self._global_object_id is None:
+            result = await self.cdp.send(
+                "Runtime.evaluate",
+                {"expression": "globalThis"},
+                session_id=self.session_id,
+            )
+            self._global_object_id = result["result"]["objectId"]
+        return self._global_object_id
 
+    @staticmethod
+    def _result_value(result: Dict[str, Any]) -> Any:
+        """Extract the value from a Runtime.evaluate/callFunctionOn result."""
         if "exceptionDetails" in result:
             exc = result["exceptionDetails"]
             text = exc.get("text", "")
@@ -63,7 +178,7 @@ class PageHelper:
         self,
         selector: str,
         timeout: float = 15.0,
-        poll_interval: float = 0.3,
+        poll_interval: float = 0.5,
         visible: bool = False,
     ) -> bool:
         """Wait for a CSS selector to appear in the DOM.
@@ -71,7 +186,7 @@ class PageHelper:
         Args:
             selector: CSS selector string
             timeout: Maximum wait time in seconds
-            poll_interval: Time between checks
+            poll_interval: Longest delay between retries after a navigation
             visible: If True, also check element is visible (offsetParent != null)
 
         Returns:
@@ -80,25 +195,14 @@ class PageHelper:
         Raises:
             TimeoutError: If element not found within timeout
         """
-        js_selector = selector.replace("'", "\\'")
         if visible:
-            check_js = (
-                f"(() => {{"
-                f"  const el = document.querySelector('{js_selector}');"
-                f"  return el && el.offsetParent !== null;"
-                f"}})()"
-            )
+            check, arg = _VISIBLE_CHECK, selector
         else:
-            check_js = f"!!document.querySelector('{js_selector}')"
-
-        elapsed = 0.0
-        while elapsed < timeout:
-            found = await self.evaluate(check_js)
-            if found:
-                return True
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
-
+            check, arg = _FIRST_PRESENT_CHECK, [selector]
+        if await self.wait_for_function(
+            check, arg, timeout=timeout, retry_delay=poll_interval
+        ):
+            return True
         raise TimeoutError(
             f"Selector '{selector}' not found after {timeout}s"
         )
@@ -107,62 +211,312 @@ class PageHelper:
         self,
         selectors: List[str],
         timeout: float = 15.0,
-        poll_interval: float = 0.3,
+        poll_interval: float = 0.5,
     ) -> Tuple[int, str]:
         """Wait for any of the given selectors to appear.
 
+        Args:
+            selectors: CSS selectors, in order of preference
+            timeout: Maximum wait time in seconds
+            poll_interval: Longest delay between retries after a navigation
+
         Returns:
             Tuple of (index, matched_selector)
 
         Raises:
             TimeoutError: If none found within timeout
         """
-        escaped = [s.replace("'", "\\'") for s in selectors]
-        selectors_js = ", ".join(f"'{s}'" for s in escaped)
-        check_js = (
-            f"(() => {{"
-            f"  const sels = [{selectors_js}];"
-            f"  for (let i = 0; i < sels.length; i++) {{"
-            f"    if (document.querySelector(sels[i])) return i;"
-            f"  }}"
-            f"  return -1;"
-            f"}})()"
+        found = await self.wait_for_function(
+            _FIRST_PRESENT_CHECK, list(selectors), timeout=timeout,
+            retry_delay=poll_interval,
         )
+        if found is None:
+            raise TimeoutError(
+                f"None of selectors {selectors} found after {timeout}s"
+            )
+        idx = selectors.index(found)
+        return idx, selectors[idx]
 
-        elapsed = 0.0
-        while elapsed < timeout:
-            idx = await self.evaluate(check_js)
-            if idx is not None and idx >= 0:
-                return idx, selectors[idx]
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+    async def wait_for_function(
+        self,
+        check: str,
+        arg: Any = None,
+        timeout: float = 15.0,
+        retry_delay: float = 0.5,
+    ) -> Any:
+        """Wait for a JavaScript check function to return a truthy value.
 
-        raise TimeoutError(
-            f"None of selectors {selectors} found after {timeout}s"
+        Each call is a single awaited CDP round-trip: a MutationObserver
+        re-runs check(arg) on DOM changes, so nothing is polled from Python.
+        Long waits are split into chunks below the CDP command timeout,
+        and a call cut short by a navigation is retried with a short,
+        exponentially growing delay capped at retry_delay.
+
+        Args:
+            check: JavaScript function source, e.g. "sel => ..."; throwing
+                counts as not passed
+            arg: JSON-serializable argument passed to the check
+            timeout: Maximum wait time in seconds
+            retry_delay: Longest delay between retries after a navigation
+
+        Returns:
+            The check's first truthy result, or None on timeout
+        """
+        declaration = _observing(check)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = _RETRY_DELAY_START
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                result = await self.call_function(
+                    declaration,
+                    arg,
+                    int(min(remaining, _OBSERVE_CHUNK) * 1000),
+                    await_promise=True,
+                )
+            except (CdpError, RuntimeError):
+                # The document was replaced mid-wait (page still loading)
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 1.5, retry_delay)
+                continue
+            delay = _RETRY_DELAY_START
+            if result:
+                return result
+
+    async def wait_for_selector_with_optional_login(
+        self,
+        selector: str,
+        login_selector: str,
+        timeout: float = 60.0,
+        login_timeout: float = 300.0,
+        on_login: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """Wait for a selector, allowing extra time if a login page shows up.
+
+        Both selectors are watched by one MutationObserver in the page. If
+        the login indicator appears first, on_login is called and the
+        budget is reset to login_timeout for the target selector alone.
+        Like every wait_for_function() wait, it survives the navigations
+        of a login flow.
+
+        Args:
+            selector: CSS selector to wait for
+            login_selector: CSS selector indicating a login page
+            timeout: Maximum wait time for either selector
+            login_timeout: Maximum wait time once login was detected
+            on_login: Called once when the login page is detected
+
+        Returns:
+            True if the user had to log in first
+
+        Raises:
+            TimeoutError: If the selector did not appear within the budget
+        """
+        try:
+            idx, _ = await self.wait_for_any_selector(
+                [selector, login_selector], timeout=timeout
+            )
+        except TimeoutError:
+            raise TimeoutError(f"Selector '{selector}' not found after {timeout}s")
+        if idx == 0:
+            return False
+        if on_login is not None:
+            on_login()
+        await self.wait_for_selector(selector, timeout=login_timeout)
+        return True
+
+    async def wait_for_network_idle(
+        self,
+        idle_time: float = 0.5,
+        timeout: float = 2.0,
+        max_inflight: int = 2,
+    ) -> bool:
+        """Wait until the page's network traffic settles.
+
+        Tracks requests through Network events and returns once no more
+        than max_inflight of them have been in flight for idle_time. X
+        keeps a few long-lived connections open, so a strict zero would
+        rarely be reached. Unless block_urls() already enabled it, the
+        Network domain is only enabled for the duration of the wait.
+
+        Args:
+            idle_time: How long traffic has to stay quiet, in seconds
+            timeout: Maximum wait time in seconds
+            max_inflight: Requests allowed to remain open while "idle"
+
+        Returns:
+            True if the network went idle, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        inflight: Set[str] = set()
+        idle = asyncio.Event()
+        timer: Optional[asyncio.TimerHandle] = None
+
+        def update() -> None:
+            nonlocal timer
+            if len(inflight) <= max_inflight:
+                if timer is None:
+                    timer = loop.call_later(idle_time, idle.set)
+            elif timer is not None:
+                timer.cancel()
+                timer = None
+
+        def on_request(params: Dict[str, Any]) -> None:
+            inflight.add(params.get("requestId"))
+            update()
+
+        def on_done(params: Dict[str, Any]) -> None:
+            inflight.discard(params.get("requestId"))
+            update()
+
+        self.cdp.on("Network.requestWillBeSent", on_request)
+        self.cdp.on("Network.loadingFinished", on_done)
+        self.cdp.on("Network.loadingFailed", on_done)
+        keep_enabled = self._network_enabled
+        try:
+            if not keep_enabled:
+                await self.cdp.send("Network.enable", session_id=self.session_id)
+            update()
+            try:
+                await asyncio.wait_for(idle.wait(), timeout=timeout)
+                return True
+            except asyncio.TimeoutError:
+                return False
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self.cdp.off("Network.requestWillBeSent", on_request)
+            self.cdp.off("Network.loadingFinished", on_done)
+            self.cdp.off("Network.loadingFailed", on_done)
+            if not keep_enabled:
+                try:
+                    await self.cdp.send(
+                        "Network.disable", session_id=self.session_id
+                    )
+                except CdpError:
+                    pass
+
+    async def block_urls(self, patterns: List[str]) -> None:
+        """Stop the page from loading requests that match the patterns.
+
+        Blocked resources keep their URLs in the DOM; only the download is
+        skipped. This enables the Network domain (blocking needs it) for
+        the rest of the session.
+
+        Args:
+            patterns: URL patterns, with '*' as wildcard
+        """
+        await self.cdp.send_many(
+            [
+                ("Network.enable", None),
+                ("Network.setBlockedURLs", {"urls": list(patterns)}),
+            ],
+            session_id=self.session_id,
         )
+        self._network_enabled = True
+
+    async def wait_for_mutation(
+        self,
+        selector: str,
+        min_text_delta: int = 0,
+        timeout: float = 3.0,
+        baseline: Optional[int] = None,
+    ) -> bool:
+        """Wait for the DOM under an element to change.
+
+        Resolves as soon as a MutationObserver sees the change, instead of
+        sleeping for a fixed worst-case delay.
+
+        Args:
+            selector: CSS selector of the element to observe
+            min_text_delta: Minimum change in textContent length to count;
+                0 accepts any mutation (e.g. an inserted image)
+            timeout: Maximum wait time in seconds
+            baseline: textContent length from before the change was
+                triggered; if it already differs by min_text_delta, returns
+                immediately (the change happened before observing began)
+
+        Returns:
+            True if the change was seen, False on timeout or missing element
+        """
+        return bool(await self.call_function(
+            "function(sel, minDelta, timeoutMs, baseline) {"
+            "  const el = document.querySelector(sel);"
+            "  if (!el) return false;"
+            "  const start = baseline === null ? el.textContent.length : baseline;"
+            "  const changed = () => Math.abs(el.textContent.length - start) >= minDelta;"
+            "  if (minDelta > 0 && changed()) return true;"
+            "  return new Promise(resolve => {"
+            "    let timer;"
+            "    const mo = new MutationObserver(() => {"
+            "      if (changed()) { mo.disconnect(); clearTimeout(timer); resolve(true); }"
+            "    });"
+            "    mo.observe(el, {childList: true, subtree: true, characterData: true});"
+            "    timer = setTimeout(() => { mo.disconnect(); resolve(false); }, timeoutMs);"
+            "  });"
+            "}",
+            selector,
+            min_text_delta,
+            int(timeout * 1000),
+            baseline,
+            await_promise=True,
+        ))
+
+    async def wait_for_predicate(self, expression: str, timeout: float = 5.0) -> bool:
+        """Wait for a JavaScript expression to become truthy.
+
+        The expression is re-checked on every DOM mutation inside the page,
+        so this returns as soon as the state is reached, unlike a fixed
+        sleep. Exceptions thrown by the expression count as false.
+
+        Args:
+            expression: JavaScript expression to test
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if the expression became truthy, False on timeout
+        """
+        return bool(await self.wait_for_function(
+            f"() => !!({expression})", timeout=timeout
+        ))
 
     async def click_selector(
-        self, selector: str, timeout: float = 10.0
+        self, selector: str, timeout: float = 10.0, trusted: bool = False
     ) -> None:
         """Click an element matching the CSS selector.
 
-        Finds the element center and dispatches a click via CDP Input.
+        By default the element is clicked with el.click() as soon as it
+        appears, in the same round-trip as the wait. With trusted=True the
+        element center gets real mouse events via CDP Input instead, for
+        controls that require a user gesture (e.g. opening a file picker)
+        and for publishing buttons, which should see real user input.
 
         Args:
             selector: CSS selector
             timeout: Wait timeout before clicking
+            trusted: Dispatch trusted mouse events instead of el.click()
         """
+        if not trusted:
+            if not await self.wait_for_function(_CLICK_CHECK, selector, timeout=timeout):
+                raise TimeoutError(
+                    f"Selector '{selector}' not found after {timeout}s"
+                )
+            return
+
         await self.wait_for_selector(selector, timeout=timeout)
 
         # Get element position
-        js_selector = selector.replace("'", "\\'")
-        box = await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  if (!el) return null;"
-            f"  const rect = el.getBoundingClientRect();"
-            f"  return {{x: rect.x + rect.width/2, y: rect.y + rect.height/2}};"
-            f"}})()"
+        box = await self.call_function(
+            "function(sel) {"
+            "  const el = document.querySelector(sel);"
+            "  if (!el) return null;"
+            "  const rect = el.getBoundingClientRect();"
+            "  return {x: rect.x + rect.width/2, y: rect.y + rect.height/2};"
+            "}",
+            selector,
         )
 
         if not box:
@@ -189,37 +543,59 @@ class PageHelper:
     async def type_text(self, selector: str, text: str) -> None:
         """Type text into an element.
 
-        For text containing '#' or '@', uses CDP Input.insertText to
-        avoid triggering X's autocomplete popups. Otherwise uses
-        execCommand insertText for speed.
+        Text over 1 KB is delivered as a single paste event, which the
+        editor handles in one update. For shorter text containing '#' or
+        '@', uses CDP Input.insertText to avoid triggering X's
+        autocomplete popups. Otherwise uses execCommand insertText for
+        speed.
 
         Args:
             selector: CSS selector of the target element
             text: Text to insert
         """
-        js_selector = selector.replace("'", "\\'")
-
-        # Focus the target element
-        await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  if (!el) throw new Error('Element not found: {js_selector}');"
-            f"  el.focus();"
-            f"}})()"
-        )
+        if len(text) > _PASTE_THRESHOLD:
+            # An editor that handles the paste cancels the event; if it
+            # doesn't, fall back to inserting the text
+            await self.call_function(
+                "function(sel, text) {"
+                "  const el = document.querySelector(sel);"
+                "  if (!el) throw new Error('Element not found: ' + sel);"
+                "  el.focus();"
+                "  const dt = new DataTransfer();"
+                "  dt.setData('text/plain', text);"
+                "  const evt = new ClipboardEvent('paste', {"
+                "    clipboardData: dt, bubbles: true, cancelable: true"
+                "  });"
+                "  if (el.dispatchEvent(evt)) document.execCommand('insertText', false, text);"
+                "}",
+                selector,
+                text,
+            )
+            return
 
         if '#' in text or '@' in text:
+            await self.call_function(
+                "function(sel) {"
+                "  const el = document.querySelector(sel);"
+                "  if (!el) throw new Error('Element not found: ' + sel);"
+                "  el.focus();"
+                "}",
+                selector,
+            )
             await self._insert_text_via_cdp(text)
             return
 
-        escaped_text = text.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
-        await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  if (!el) throw new Error('Element not found: {js_selector}');"
-            f"  el.focus();"
-            f"  document.execCommand('insertText', false, '{escaped_text}');"
-            f"}})()"
+        # Focus and insert in one round trip; the text is passed as an
+        # argument, so it needs no escaping
+        await self.call_function(
+            "function(sel, text) {"
+            "  const el = document.querySelector(sel);"
+            "  if (!el) throw new Error('Element not found: ' + sel);"
+            "  el.focus();"
+            "  document.execCommand('insertText', false, text);"
+            "}",
+            selector,
+            text,
         )
 
     async def _insert_text_via_cdp(self, text: str) -> None:
@@ -283,85 +659,133 @@ class PageHelper:
     async def upload_file(self, file_path: str, selector: str = 'input[type="file"]') -> None:
         """Upload a file by setting it on a file input element.
 
-        Uses CDP DOM.setFileInputFiles to bypass the file dialog.
+        Uses CDP DOM.setFileInputFiles to bypass the file dialog. The
+        input is looked up as a JS object reference, which needs no
+        DOM.getDocument round-trip and no node IDs that go stale.
 
         Args:
             file_path: Absolute path to the file
             selector: CSS selector of the file input
         """
-        # Get the DOM node
-        doc = await self.cdp.send(
-            "DOM.getDocument", {"depth": 0}, session_id=self.session_id
+        node = await self.call_function(
+            "function(sel) { return document.querySelector(sel); }",
+            selector,
+            by_value=False,
         )
-        root_node_id = doc["root"]["nodeId"]
+        object_id = node.get("objectId")
 
-        js_selector = selector.replace("'", "\\'")
-        node = await self.cdp.send(
-            "DOM.querySelector",
-            {"nodeId": root_node_id, "selector": selector},
-            session_id=self.session_id,
-        )
-        node_id = node.get("nodeId", 0)
-
-        if node_id == 0:
+        if not object_id:
             raise RuntimeError(f"File input '{selector}' not found")
 
-        await self.cdp.send(
-            "DOM.setFileInputFiles",
-            {"files": [file_path], "nodeId": node_id},
-            session_id=self.session_id,
-        )
+        try:
+            await self.cdp.send(
+                "DOM.setFileInputFiles",
+                {"files": [file_path], "objectId": object_id},
+                session_id=self.session_id,
+            )
+        finally:
+            # The reference would otherwise pin the input until navigation
+            try:
+                await self.cdp.send(
+                    "Runtime.releaseObject",
+                    {"objectId": object_id},
+                    session_id=self.session_id,
+                )
+            except CdpError:
+                pass
         logger.debug("File uploaded: %s", file_path)
 
     async def count_elements(self, selector: str) -> int:
         """Count elements matching a CSS selector."""
-        js_selector = selector.replace("'", "\\'")
-        count = await self.evaluate(
-            f"document.querySelectorAll('{js_selector}').length"
+        count = await self.call_function(
+            "function(sel) { return document.querySelectorAll(sel).length; }",
+            selector,
         )
         return count or 0
 
     async def get_element_text(self, selector: str) -> Optional[str]:
         """Get text content of an element."""
-        js_selector = selector.replace("'", "\\'")
-        return await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  return el ? el.textContent : null;"
-            f"}})()"
+        return await self.call_function(
+            "function(sel) {"
+            "  const el = document.querySelector(sel);"
+            "  return el ? el.textContent : null;"
+            "}",
+            selector,
         )
 
     async def get_element_attribute(self, selector: str, attribute: str) -> Optional[str]:
         """Get an attribute value of an element."""
-        js_selector = selector.replace("'", "\\'")
-        attr = attribute.replace("'", "\\'")
-        return await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  return el ? el.getAttribute('{attr}') : null;"
-            f"}})()"
+        return await self.call_function(
+            "function(sel, attr) {"
+            "  const el = document.querySelector(sel);"
+            "  return el ? el.getAttribute(attr) : null;"
+            "}",
+            selector,
+            attribute,
         )
 
     async def is_element_enabled(self, selector: str) -> bool:
         """Check if a button/input element is not disabled."""
-        js_selector = selector.replace("'", "\\'")
-        result = await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  if (!el) return false;"
-            f"  return !el.disabled && !el.getAttribute('aria-disabled');"
-            f"}})()"
+        result = await self.call_function(
+            "function(sel) {"
+            "  const el = document.querySelector(sel);"
+            "  if (!el) return false;"
+            "  return !el.disabled && !el.getAttribute('aria-disabled');"
+            "}",
+            selector,
         )
         return bool(result)
 
+    async def inspect_element(
+        self,
+        selector: str,
+        *,
+        text: bool = False,
+        attrs: Optional[List[str]] = None,
+        enabled: bool = False,
+        count: bool = False,
+    ) -> Dict[str, Any]:
+        """Read several properties of an element in one round-trip.
+
+        Use instead of chaining get_element_text(), get_element_attribute(),
+        is_element_enabled() and count_elements() on the same selector.
+
+        Args:
+            selector: CSS selector
+            text: Include the element's textContent as "text"
+            attrs: Attribute names to include in "attrs" (name -> value)
+            enabled: Include "enabled" (not disabled / aria-disabled)
+            count: Include the number of matching elements as "count"
+
+        Returns:
+            Dict with "exists" plus the requested keys; only "exists" and
+            "count" are set when no element matches
+        """
+        return await self.call_function(
+            "function(sel, want) {"
+            "  const el = document.querySelector(sel);"
+            "  const info = {exists: !!el};"
+            "  if (want.count) info.count = el ? document.querySelectorAll(sel).length : 0;"
+            "  if (!el) return info;"
+            "  if (want.text) info.text = el.textContent;"
+            "  if (want.enabled) info.enabled = !el.disabled && !el.getAttribute('aria-disabled');"
+            "  if (want.attrs.length) {"
+            "    info.attrs = Object.fromEntries(want.attrs.map(k => [k, el.getAttribute(k)]));"
+            "  }"
+            "  return info;"
+            "}",
+            selector,
+            {"text": text, "attrs": list(attrs or ()), "enabled": enabled, "count": count},
+        )
+
     async def scroll_to_element(self, selector: str) -> None:
         """Scroll an element into view."""
-        js_selector = selector.replace("'", "\\'")
-        await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  if (el) el.scrollIntoView({{behavior: 'smooth', block: 'center'}});"
-            f"}})()"
+        await self.call_function(
+            "function(sel) {"
+            "  const el = document.querySelector(sel);"
+            "  if (el) el.scrollIntoView({behavior: 'smooth', block: 'center'});"
+            "}",
+            selector,
         )
 
     async def paste_html_content(self, html: str, selector: str) -> bool:
@@ -376,28 +800,22 @@ class PageHelper:
         Returns:
             True if paste was successful
         """
-        js_selector = selector.replace("'", "\\'")
-        escaped_html = (
-            html.replace("\\", "\\\\")
-            .replace("`", "\\`")
-            .replace("$", "\\$")
-        )
-
         # Try ClipboardEvent first
-        success = await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  if (!el) return false;"
-            f"  el.focus();"
-            f"  const html = `{escaped_html}`;"
-            f"  const dt = new DataTransfer();"
-            f"  dt.setData('text/html', html);"
-            f"  dt.setData('text/plain', el.textContent || '');"
-            f"  const evt = new ClipboardEvent('paste', {{"
-            f"    clipboardData: dt, bubbles: true, cancelable: true"
-            f"  }});"
-            f"  return el.dispatchEvent(evt);"
-            f"}})()"
+        success = await self.call_function(
+            "function(sel, html) {"
+            "  const el = document.querySelector(sel);"
+            "  if (!el) return false;"
+            "  el.focus();"
+            "  const dt = new DataTransfer();"
+            "  dt.setData('text/html', html);"
+            "  dt.setData('text/plain', el.textContent || '');"
+            "  const evt = new ClipboardEvent('paste', {"
+            "    clipboardData: dt, bubbles: true, cancelable: true"
+            "  });"
+            "  return el.dispatchEvent(evt);"
+            "}",
+            selector,
+            html,
         )
 
         if success:
@@ -405,12 +823,14 @@ class PageHelper:
 
         # Fallback to execCommand
         logger.debug("ClipboardEvent paste failed, trying execCommand")
-        await self.evaluate(
-            f"(() => {{"
-            f"  const el = document.querySelector('{js_selector}');"
-            f"  if (!el) return;"
-            f"  el.focus();"
-            f"  document.execCommand('insertHTML', false, `{escaped_html}`);"
-            f"}})()"
+        await self.call_function(
+            "function(sel, html) {"
+            "  const el = document.querySelector(sel);"
+            "  if (!el) return;"
+            "  el.focus();"
+            "  document.execCommand('insertHTML', false, html);"
+            "}",
+            selector,
+            html,
         )
         return True
@@ -1,20 +1,471 @@
 """
-macOS paste key simulation via osascript.
+macOS paste key simulation via Quartz events or osascript.
 
-Sends real Cmd+V keystrokes through macOS System Events,
-which bypasses X's detection of synthetic clipboard events.
+Sends real Cmd+V keystrokes, which bypasses X's detection of synthetic
+clipboard events. With pyobjc installed they are posted natively (see
+paste_native); otherwise they go through macOS System Events.
+
+Scripts run in one long-lived interactive osascript process, so each
+keystroke costs a pipe round trip instead of an osascript launch. A
+one-shot osascript is used if the interactive process is unavailable.
+The scripts are compiled once with osacompile and cached by a hash of
+their source, so neither path reparses them per keystroke.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import logging
+import os
+import select
+import shutil
 import subprocess
+import threading
 import time
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import paste_native
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TARGET_APP = "Google Chrome"
+DEFAULT_BUNDLE_ID = "com.google.Chrome"
+
+# Resolved once so launches do not search PATH each time. Together with
+# close_fds=False below, an absolute path lets subprocess launch these
+# with posix_spawn instead of fork+exec. Python's own descriptors are
+# non-inheritable by default (PEP 446), so keeping fds open only passes
+# ones explicitly marked inheritable.
+_OSASCRIPT = shutil.which("osascript") or "/usr/bin/osascript"
+_OSACOMPILE = shutil.which("osacompile") or "/usr/bin/osacompile"
+
+# Seconds to wait for compilation and other non-keystroke scripts
+SCRIPT_TIMEOUT = 10.0
+
+# A keystroke script gets this long plus its own delays before osascript
+# is sent SIGTERM, and KILL_GRACE more before SIGKILL. AppleScript can
+# hang for seconds in rare cases; waiting the full SCRIPT_TIMEOUT for
+# every retry only stretches the tail.
+SOFT_TIMEOUT = 1.5
+KILL_GRACE = 1.5
+
+# Printed after each script so the reader knows where its output ends
+_SENTINEL = "__XPOST_DONE__"
+
+CACHE_DIR = os.path.expanduser("~/.cache/x-poster/paste")
+
+# Arguments: target app name, bundle ID ("" to address the app by name),
+# pre-delay and inter-key delay in milliseconds, then a key and a
+# modifier string (e.g. "command down, shift down") per keystroke. The
+# app is only activated if it is not already in front, and the pre-delay
+# caps the wait for it to get there.
+KEYS_SCRIPT = """\
+on run argv
+    if item 2 of argv is "" then
+        set target to application (item 1 of argv)
+    else
+        set target to application id (item 2 of argv)
+    end if
+    tell target
+        if not frontmost then
+            activate
+            set focusLimit to ((item 3 of argv) as integer) / 1000
+            set waited to 0
+            repeat while waited < focusLimit and not frontmost
+                delay 0.01
+                set waited to waited + 0.01
+            end repeat
+        end if
+    end tell
+    set gap to ((item 4 of argv) as integer) / 1000
+    tell application "System Events"
+        repeat with i from 5 to (count argv) by 2
+            if i > 5 then delay gap
+            set mods to item (i + 1) of argv
+            set flags to {}
+            if mods contains "command" then set end of flags to command down
+            if mods contains "shift" then set end of flags to shift down
+            if mods contains "option" then set end of flags to option down
+            if mods contains "control" then set end of flags to control down
+            keystroke (item i of argv) using flags
+        end repeat
+    end tell
+end run
+"""
+
+# Compiled script paths by name, so warm calls skip the filesystem
+_COMPILED_SCRIPTS: Dict[str, str] = {}
+_compile_lock = threading.Lock()
+
+# Target app and monotonic time of the last successful paste, for
+# send_paste's dedupe_window
+_last_paste: Optional[Tuple[str, float]] = None
+_last_paste_lock = threading.Lock()
+
+
+class _OsascriptServer:
+    """A persistent ``osascript -i`` child that runs scripts line by line.
+
+    Interactive mode compiles and runs one line at a time, so scripts
+    must be single statements per line (``tell application "X" to ...``).
+    With ``-s so`` results are printed in source form and errors go to
+    stdout too, which lets one pipe carry everything for a script.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+
+    def _ensure_running(self) -> subprocess.Popen:
+        """Start the child, or restart it if it has exited."""
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        logger.debug("Starting interactive osascript")
+        self._proc = subprocess.Popen(
+            [_OSASCRIPT, "-i", "-s", "so"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            close_fds=False,
+        )
+        self._buffer = b""
+        return self._proc
+
+    def _readline(self, proc: subprocess.Popen, deadline: float) -> str:
+        """Read one stdout line, raising TimeoutError past the deadline."""
+        fd = proc.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("osascript timed out")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                raise OSError("osascript exited")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line.decode("utf-8", "replace")
+
+    def run(self, lines: List[str], timeout: float = SCRIPT_TIMEOUT) -> Optional[str]:
+        """Run script lines and wait for them to finish.
+
+        Returns:
+            None on success, the first error osascript reported otherwise
+
+        Raises:
+            OSError: If the child cannot be started or exits mid-script
+            TimeoutError: If the script does not finish in time (the
+                child is killed, since its state is unknown)
+        """
+        with self._lock:
+            proc = self._ensure_running()
+            payload = _encode_payload(tuple(lines))
+            deadline = time.monotonic() + timeout
+            error = None
+            try:
+                proc.stdin.write(payload)
+                while True:
+                    line = self._readline(proc, deadline)
+                    if _SENTINEL in line:
+                        return error
+                    if error is None and "error" in line:
+                        # Drop the interactive prompt, if one is echoed
+                        error = line.lstrip("> ").strip()
+            except (OSError, TimeoutError):
+                self._kill()
+                raise
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            _stop(self._proc)
+        self._proc = None
+
+    def close(self) -> None:
+        """Ask the child to exit by closing its stdin."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+
+
+@functools.lru_cache(maxsize=16)
+def _encode_payload(lines: Tuple[str, ...]) -> bytes:
+    """Script lines plus the sentinel, encoded once per distinct script."""
+    return "\n".join([*lines, f'"{_SENTINEL}"', ""]).encode("utf-8")
+
+
+def _stop(proc: subprocess.Popen) -> None:
+    """Terminate a child, escalating to SIGKILL after KILL_GRACE."""
+    if proc.poll() is not None:
+        return
+    proc.terminate()
+    try:
+        proc.wait(timeout=KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+_server = _OsascriptServer()
+atexit.register(_server.close)
+
+
+def _escape(value: str) -> str:
+    """Escape a value for use inside an AppleScript string literal."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _ensure_compiled(source: str, name: str) -> str:
+    """Compile an AppleScript to a cached .scpt if not already cached.
+
+    Returns:
+        Path to the compiled script
+
+    Raises:
+        OSError: If osacompile cannot be run
+        RuntimeError: If compilation fails
+    """
+    cached = _COMPILED_SCRIPTS.get(name)
+    if cached is not None:
+        return cached
+
+    with _compile_lock:
+        source_hash = hashlib.blake2b(source.encode(), digest_size=6).hexdigest()
+        script_path = os.path.join(CACHE_DIR, f"{name}-{source_hash}.scpt")
+        if not os.path.isfile(script_path):
+            logger.debug("Compiling AppleScript: %s", name)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Rename into place so a concurrent process never runs a
+            # partially written script
+            tmp_path = f"{script_path}.{os.getpid()}.tmp.scpt"
+            try:
+                result = subprocess.run(
+                    [_OSACOMPILE, "-o", tmp_path, "-e", source],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    close_fds=False,
+                    timeout=SCRIPT_TIMEOUT,
+                )
+                if result.returncode != 0:
+                    stderr = result.stderr.decode("utf-8", "replace")
+                    raise RuntimeError(f"AppleScript compilation failed:\n{stderr}")
+                os.replace(tmp_path, script_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        _COMPILED_SCRIPTS[name] = script_path
+        return script_path
+
+
+@functools.lru_cache(maxsize=16)
+def _run_script_line(script_path: str, args: Tuple[str, ...]) -> str:
+    """Interactive-osascript line that runs a compiled script with args.
+
+    Cached because callers repeat the same app, delays and keystroke.
+    """
+    params = ", ".join(f'"{_escape(arg)}"' for arg in args)
+    return f'run script (POSIX file "{_escape(script_path)}") with parameters {{{params}}}'
+
+
+def _run_compiled(
+    source: str, name: str, args: List[str], timeout: float = SCRIPT_TIMEOUT
+) -> Optional[str]:
+    """Run a compiled AppleScript with arguments.
+
+    Returns:
+        None on success, an error message on failure
+
+    Raises:
+        OSError: If osacompile or osascript cannot be run
+        RuntimeError: If compilation fails
+        subprocess.TimeoutExpired: If the one-shot fallback times out
+        TimeoutError: If the persistent osascript times out
+    """
+    script_path = _ensure_compiled(source, name)
+    line = _run_script_line(script_path, tuple(args))
+    return _run_script([line], [_OSASCRIPT, script_path, *args], timeout)
+
+
+def _run_script(
+    lines: List[str],
+    command: Optional[List[str]] = None,
+    timeout: float = SCRIPT_TIMEOUT,
+) -> Optional[str]:
+    """Run AppleScript lines, preferring the persistent osascript.
+
+    Args:
+        lines: Script lines for the interactive osascript
+        command: One-shot command to run instead if it is unavailable
+            (default: osascript reading the lines from stdin)
+        timeout: Seconds before osascript is terminated
+
+    Returns:
+        None on success, an error message on failure
+
+    Raises:
+        subprocess.TimeoutExpired: If the one-shot fallback times out
+        TimeoutError: If the persistent osascript times out
+    """
+    try:
+        return _server.run(lines, timeout)
+    except TimeoutError:
+        raise
+    except OSError as e:
+        logger.debug("Interactive osascript unavailable, running one-shot: %s", e)
+
+    # Without a command the script goes in on stdin, which unlike argv
+    # has no length limit
+    script = None if command else "\n".join(lines).encode("utf-8")
+    with subprocess.Popen(
+        command or [_OSASCRIPT, "-"],
+        stdin=subprocess.PIPE if script is not None else None,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    ) as proc:
+        try:
+            _, stderr = proc.communicate(script, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _stop(proc)
+            raise
+    if proc.returncode == 0:
+        return None
+    # stderr is only decoded on failure; success output is never read
+    return stderr.decode("utf-8", "replace").strip() or f"osascript exited with {proc.returncode}"
+
+
+def warm_up() -> None:
+    """Get keystrokes ready without sending one.
+
+    Compiles the keystroke script and starts the interactive osascript,
+    so the first paste pays for neither. Nothing needs preparing when
+    keystrokes can be posted natively.
+
+    Raises:
+        OSError: If osascript or osacompile cannot be run
+        RuntimeError: If compilation fails
+        TimeoutError: If the interactive osascript does not respond
+    """
+    if paste_native.ready():
+        return
+    _ensure_compiled(KEYS_SCRIPT, "keys")
+    _server.run([])
+
+
+def _resolve_target(
+    target_app: Optional[str], bundle_id: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    """Fill in the default app, which is also addressed by bundle ID."""
+    if not target_app:
+        return DEFAULT_TARGET_APP, bundle_id or DEFAULT_BUNDLE_ID
+    return target_app, bundle_id
+
+
+def _send_keys(
+    target_app: str,
+    bundle_id: Optional[str],
+    sequence: Sequence[Tuple[str, Optional[str]]],
+    pre_delay: float,
+    inter_delay: float,
+) -> Optional[str]:
+    """Send keystrokes natively if possible, else in one osascript run.
+
+    Returns:
+        None on success, an error message on failure
+
+    Raises:
+        subprocess.TimeoutExpired, TimeoutError: If osascript times out
+    """
+    if paste_native.send_keys(
+        target_app, sequence, pre_delay, inter_delay, bundle_id
+    ):
+        return None
+    args = [
+        target_app,
+        bundle_id or "",
+        str(round(pre_delay * 1000)),
+        str(round(inter_delay * 1000)),
+    ]
+    for key, modifiers in sequence:
+        args += [key, modifiers or ""]
+    try:
+        timeout = SOFT_TIMEOUT + pre_delay + inter_delay * len(sequence)
+        return _run_compiled(KEYS_SCRIPT, "keys", args, timeout)
+    except TimeoutError:
+        raise  # an OSError subclass, but reported as a timeout by callers
+    except (OSError, RuntimeError) as e:
+        return str(e)
+
+
+def _is_duplicate_paste(target_app: str, dedupe_window: float) -> bool:
+    """Whether a paste to target_app succeeded within dedupe_window seconds."""
+    if not dedupe_window:
+        return False
+    with _last_paste_lock:
+        if (
+            _last_paste is not None
+            and _last_paste[0] == target_app
+            and time.monotonic() - _last_paste[1] < dedupe_window
+        ):
+            logger.debug("Skipping duplicate paste to %s", target_app)
+            return True
+    return False
+
+
+def _paste_once(
+    target_app: str, bundle_id: Optional[str], pre_delay: float, attempt: int
+) -> Optional[str]:
+    """Make one paste attempt.
+
+    Returns:
+        None on success, an error message on failure
+    """
+    global _last_paste
+    try:
+        error = _send_keys(target_app, bundle_id, [("v", "command down")], pre_delay, 0.0)
+    except (subprocess.TimeoutExpired, TimeoutError):
+        logger.warning("osascript timed out (attempt %d)", attempt + 1)
+        return "osascript timed out"
+    if error is not None:
+        logger.warning("osascript failed (attempt %d): %s", attempt + 1, error)
+        return error
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Paste keystroke sent to %s", target_app)
+    with _last_paste_lock:
+        _last_paste = (target_app, time.monotonic())
+    return None
+
+
+def _retry_delays(delay: float) -> Iterator[float]:
+    """Waits before each retry: a quarter of delay, doubling up to delay.
+
+    A transient focus race usually clears quickly, so the first retry
+    comes early; persistent failures back off to the full delay.
+    """
+    wait = delay / 4
+    while True:
+        yield wait
+        wait = min(wait * 2, delay)
+
+
+def _paste_failed(retries: int, last_error: Optional[str]) -> RuntimeError:
+    return RuntimeError(
+        f"Failed to send paste keystroke after {retries} attempts: {last_error}\n"
+        "Make sure:\n"
+        "  1. Terminal/IDE has Accessibility permissions in System Preferences\n"
+        "  2. Google Chrome is running and not minimized\n"
+        "  3. System Preferences > Privacy & Security > Accessibility"
+    )
 
 
 def send_paste(
@@ -22,109 +473,143 @@ def send_paste(
     retries: int = 1,
     delay: float = 0.5,
     pre_delay: float = 0.3,
+    dedupe_window: float = 0.0,
+    bundle_id: Optional[str] = None,
 ) -> None:
-    """Send a real Cmd+V paste keystroke via osascript.
+    """Send a real Cmd+V paste keystroke.
 
     This activates the target application and sends a keystroke "v"
-    using command down through System Events, which produces a real
-    paste event that X cannot distinguish from human input.
+    using command down, natively when possible and otherwise through
+    System Events, which produces a real paste event that X cannot
+    distinguish from human input.
 
     Args:
         target_app: Application name to activate before pasting
                    (default: "Google Chrome")
         retries: Number of retry attempts on failure
-        delay: Delay between retries in seconds
-        pre_delay: Delay before sending keystroke (to let app focus)
+        delay: Longest delay between retries in seconds (earlier retries
+            wait less, backing off exponentially)
+        pre_delay: Longest wait for the app to come to the front before
+            sending the keystroke
+        dedupe_window: Skip the paste if one was sent to the same app
+            less than this many seconds ago (0 disables the check)
+        bundle_id: Bundle identifier to address the app by, which skips
+            the lookup by name (default: Chrome's, when target_app is
+            not given)
 
     Raises:
         RuntimeError: If paste fails after all retries
     """
-    target_app = target_app or DEFAULT_TARGET_APP
-    # Escape double quotes in app name to prevent AppleScript injection
-    safe_app = target_app.replace("\\", "\\\\").replace('"', '\\"')
-
-    script = f'''
-tell application "{safe_app}"
-    activate
-end tell
-delay {pre_delay}
-tell application "System Events"
-    keystroke "v" using command down
-end tell
-'''
+    target_app, bundle_id = _resolve_target(target_app, bundle_id)
+    if _is_duplicate_paste(target_app, dedupe_window):
+        return
 
     last_error = None
+    waits = _retry_delays(delay)
     for attempt in range(retries):
         if attempt > 0:
-            time.sleep(delay)
+            time.sleep(next(waits))
             logger.debug("Paste retry %d/%d", attempt + 1, retries)
+        last_error = _paste_once(target_app, bundle_id, pre_delay, attempt)
+        if last_error is None:
+            return
 
-        try:
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
+    raise _paste_failed(retries, last_error)
 
-            if result.returncode == 0:
-                logger.debug("Paste keystroke sent to %s", target_app)
-                return
 
-            last_error = result.stderr.strip()
-            logger.warning("osascript failed (attempt %d): %s", attempt + 1, last_error)
+async def send_paste_async(
+    target_app: Optional[str] = None,
+    retries: int = 1,
+    delay: float = 0.5,
+    pre_delay: float = 0.3,
+    dedupe_window: float = 0.0,
+    bundle_id: Optional[str] = None,
+) -> None:
+    """Coroutine version of send_paste for callers on an event loop.
 
-        except subprocess.TimeoutExpired:
-            last_error = "osascript timed out"
-            logger.warning("osascript timed out (attempt %d)", attempt + 1)
+    Each attempt runs in a worker thread and the retry delay is awaited,
+    so the loop keeps running throughout. Arguments are as for send_paste.
 
-    raise RuntimeError(
-        f"Failed to send paste keystroke after {retries} attempts: {last_error}\n"
-        "Make sure:\n"
-        "  1. Terminal/IDE has Accessibility permissions in System Preferences\n"
-        "  2. Google Chrome is running and not minimized\n"
-        "  3. System Preferences > Privacy & Security > Accessibility"
-    )
+    Raises:
+        RuntimeError: If paste fails after all retries
+    """
+    target_app, bundle_id = _resolve_target(target_app, bundle_id)
+    if _is_duplicate_paste(target_app, dedupe_window):
+        return
+
+    last_error = None
+    waits = _retry_delays(delay)
+    for attempt in range(retries):
+        if attempt > 0:
+            await asyncio.sleep(next(waits))
+            logger.debug("Paste retry %d/%d", attempt + 1, retries)
+        last_error = await asyncio.to_thread(
+            _paste_once, target_app, bundle_id, pre_delay, attempt
+        )
+        if last_error is None:
+            return
+
+    raise _paste_failed(retries, last_error)
+
+
+def send_keys(
+    sequence: Sequence[Tuple[str, Optional[str]]],
+    target_app: Optional[str] = None,
+    inter_delay: float = 0.05,
+    bundle_id: Optional[str] = None,
+) -> None:
+    """Send several keystrokes in one go, e.g. Cmd+A then Cmd+V.
+
+    Args:
+        sequence: (key, modifiers) pairs, as for send_key
+        target_app: App to activate first
+        inter_delay: Delay between keystrokes in seconds
+        bundle_id: Bundle identifier of the app, as for send_paste
+
+    Raises:
+        RuntimeError: If the keystrokes cannot be sent
+    """
+    target_app, bundle_id = _resolve_target(target_app, bundle_id)
+    try:
+        error = _send_keys(target_app, bundle_id, sequence, 0.2, inter_delay)
+    except (subprocess.TimeoutExpired, TimeoutError):
+        error = "osascript timed out"
+    if error is not None:
+        raise RuntimeError(f"osascript keystroke failed: {error}")
 
 
 def send_key(
     key: str,
     modifiers: Optional[str] = None,
     target_app: Optional[str] = None,
+    bundle_id: Optional[str] = None,
 ) -> None:
-    """Send an arbitrary keystroke via osascript.
+    """Send an arbitrary keystroke, natively if possible, else via osascript.
 
     Args:
         key: Key to press (e.g. "v", "a", "return")
         modifiers: Modifier string (e.g. "command down", "command down, shift down")
         target_app: App to activate first
+        bundle_id: Bundle identifier of the app, as for send_paste
     """
-    target_app = target_app or DEFAULT_TARGET_APP
-    # Escape to prevent AppleScript injection
-    safe_app = target_app.replace("\\", "\\\\").replace('"', '\\"')
-    safe_key = key.replace("\\", "\\\\").replace('"', '\\"')
-
-    if modifiers:
-        keystroke_line = f'keystroke "{safe_key}" using {{{modifiers}}}'
-    else:
-        keystroke_line = f'keystroke "{safe_key}"'
-
-    script = f'''
-tell application "{safe_app}"
-    activate
-end tell
-delay 0.2
-tell application "System Events"
-    {keystroke_line}
-end tell
-'''
-
-    result = subprocess.run(
-        ["osascript", "-e", script],
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
+    send_keys([(key, modifiers)], target_app, bundle_id=bundle_id)
+
 
-    if result.returncode != 0:
-        raise RuntimeError(f"osascript keystroke failed: {result.stderr}")
+async def send_keys_async(
+    sequence: Sequence[Tuple[str, Optional[str]]],
+    target_app: Optional[str] = None,
+    inter_delay: float = 0.05,
+    bundle_id: Optional[str] = None,
+) -> None:
+    """Coroutine version of send_keys, run in a worker thread."""
+    await asyncio.to_thread(send_keys, sequence, target_app, inter_delay, bundle_id)
+
+
+async def send_key_async(
+    key: str,
+    modifiers: Optional[str] = None,
+    target_app: Optional[str] = None,
+    bundle_id: Optional[str] = None,
+) -> None:
+    """Coroutine version of send_key, run in a worker thread."""
+    await asyncio.to_thread(send_key, key, modifiers, target_app, bundle_id)
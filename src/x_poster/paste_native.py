@@ -0,0 +1,232 @@
+"""
+macOS keystrokes via Quartz event taps (pyobjc).
+
+Posts key events straight to the HID event tap, the same place real
+keyboard input enters, without an osascript or System Events round
+trip. Requires the optional pyobjc Quartz, AppKit and ApplicationServices
+bindings; when they are missing AVAILABLE is False and paste.py uses
+osascript. It also uses osascript when the process lacks Accessibility
+access (so the user sees System Events' error) or the keyboard layout
+is not one KEYCODES is valid for.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    from AppKit import (
+        NSApplicationActivateIgnoringOtherApps,
+        NSRunningApplication,
+        NSWorkspace,
+    )
+    from ApplicationServices import AXIsProcessTrusted
+    from CoreFoundation import CFPreferencesCopyAppValue
+    from Quartz import (
+        CGEventCreateKeyboardEvent,
+        CGEventPost,
+        CGEventSetFlags,
+        CGWindowListCopyWindowInfo,
+        kCGEventFlagMaskAlternate,
+        kCGEventFlagMaskCommand,
+        kCGEventFlagMaskControl,
+        kCGEventFlagMaskShift,
+        kCGHIDEventTap,
+        kCGNullWindowID,
+        kCGWindowListExcludeDesktopElements,
+        kCGWindowListOptionOnScreenOnly,
+    )
+except ImportError:  # optional: falls back to osascript
+    NSWorkspace = None
+
+logger = logging.getLogger(__name__)
+
+AVAILABLE = NSWorkspace is not None
+
+# Virtual key codes (ANSI layout) for the keys send_key can post natively.
+# A keycode names a physical key, so these only type the intended
+# character on the US-style layouts in ANSI_LAYOUTS.
+KEYCODES: Dict[str, int] = {
+    "a": 0, "s": 1, "d": 2, "f": 3, "h": 4, "g": 5, "z": 6, "x": 7,
+    "c": 8, "v": 9, "b": 11, "q": 12, "w": 13, "e": 14, "r": 15,
+    "y": 16, "t": 17, "1": 18, "2": 19, "3": 20, "4": 21, "6": 22,
+    "5": 23, "=": 24, "9": 25, "7": 26, "-": 27, "8": 28, "0": 29,
+    "]": 30, "o": 31, "u": 32, "[": 33, "i": 34, "p": 35, "l": 37,
+    "j": 38, "'": 39, "k": 40, ";": 41, "\\": 42, ",": 43, "/": 44,
+    "n": 45, "m": 46, ".": 47, " ": 49, "`": 50,
+}
+
+# Keyboard layouts that agree with KEYCODES for every key it lists
+ANSI_LAYOUTS = {
+    "com.apple.keylayout.US",
+    "com.apple.keylayout.ABC",
+    "com.apple.keylayout.USExtended",
+    "com.apple.keylayout.USInternational-PC",
+}
+
+_MODIFIER_NAMES = ("command", "shift", "option", "control")
+
+# Seconds between frontmost checks while waiting for activation
+_FOCUS_POLL = 0.01
+
+# time.sleep can overshoot by a few ms; the last stretch of a delay is
+# spun on the monotonic clock instead
+_SPIN_NS = 2_000_000
+
+
+def _precise_sleep(seconds: float) -> None:
+    """Sleep for a duration with sub-millisecond accuracy."""
+    deadline = time.monotonic_ns() + int(seconds * 1e9)
+    remaining = deadline - time.monotonic_ns() - _SPIN_NS
+    if remaining > 0:
+        time.sleep(remaining / 1e9)
+    while time.monotonic_ns() < deadline:
+        pass
+
+
+def _current_layout() -> Optional[str]:
+    """Return the input source ID of the active keyboard layout.
+
+    Input methods such as Pinyin type through an underlying layout, which
+    is the one recorded here.
+    """
+    layout = CFPreferencesCopyAppValue(
+        "AppleCurrentKeyboardLayoutInputSourceID", "com.apple.HIToolbox"
+    )
+    return str(layout) if layout else None
+
+
+def ready() -> bool:
+    """Check whether keystrokes can be posted natively right now.
+
+    Posted events are silently dropped without Accessibility access, and
+    KEYCODES would type the wrong keys on e.g. AZERTY or Dvorak.
+    """
+    if not AVAILABLE or not AXIsProcessTrusted():
+        return False
+    layout = _current_layout()
+    if layout not in ANSI_LAYOUTS:
+        logger.debug("Keyboard layout %s is not ANSI, using osascript", layout)
+        return False
+    return True
+
+
+def _modifier_flags(modifiers: Optional[str]) -> int:
+    """Convert an AppleScript modifier string to Quartz event flags.
+
+    Args:
+        modifiers: e.g. "command down, shift down" (None for no modifiers)
+    """
+    if not modifiers:
+        return 0
+    masks = {
+        "command": kCGEventFlagMaskCommand,
+        "shift": kCGEventFlagMaskShift,
+        "option": kCGEventFlagMaskAlternate,
+        "control": kCGEventFlagMaskControl,
+    }
+    flags = 0
+    for name in _MODIFIER_NAMES:
+        if name in modifiers:
+            flags |= masks[name]
+    return flags
+
+
+def _frontmost_pid() -> Optional[int]:
+    """PID of the application owning the frontmost normal window.
+
+    Asks the window server directly: NSWorkspace.frontmostApplication
+    is only refreshed by a running AppKit run loop, which a CLI lacks.
+    """
+    windows = CGWindowListCopyWindowInfo(
+        kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
+        kCGNullWindowID,
+    )
+    for window in windows or ():
+        # Layer 0 holds normal windows; higher layers are menus, the Dock etc.
+        if window.get("kCGWindowLayer") == 0:
+            return window.get("kCGWindowOwnerPID")
+    return None
+
+
+def _wait_until_frontmost(pid: int, timeout: float) -> None:
+    """Wait for an app's window to come to the front, at most timeout.
+
+    Activation usually lands in a few tens of milliseconds, well inside
+    the fixed focus delay callers ask for.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _frontmost_pid() == pid:
+            return
+        time.sleep(_FOCUS_POLL)
+
+
+def find_app(name: str, bundle_id: Optional[str] = None):
+    """Find a running application, by bundle ID first and then by name.
+
+    Returns:
+        The NSRunningApplication, or None if it is not running
+    """
+    if bundle_id:
+        apps = NSRunningApplication.runningApplicationsWithBundleIdentifier_(bundle_id)
+        if apps:
+            return apps[0]
+    for app in NSWorkspace.sharedWorkspace().runningApplications():
+        if app.localizedName() == name:
+            return app
+    return None
+
+
+def post_key(key: str, modifiers: Optional[str] = None) -> None:
+    """Post a key down/up pair with modifiers to the HID event tap.
+
+    Raises:
+        KeyError: If the key has no entry in KEYCODES
+    """
+    keycode = KEYCODES[key]
+    flags = _modifier_flags(modifiers)
+    for key_down in (True, False):
+        event = CGEventCreateKeyboardEvent(None, keycode, key_down)
+        CGEventSetFlags(event, flags)
+        CGEventPost(kCGHIDEventTap, event)
+
+
+def send_keys(
+    target_app: str,
+    sequence: Sequence[Tuple[str, Optional[str]]],
+    pre_delay: float = 0.0,
+    inter_delay: float = 0.0,
+    bundle_id: Optional[str] = None,
+) -> bool:
+    """Activate an app and post (key, modifiers) keystrokes to it.
+
+    The activation is skipped if the app is already in front, which is
+    the common case for consecutive keystrokes. Otherwise pre_delay caps
+    the wait for the app to come to the front.
+
+    Returns:
+        False if the keystrokes cannot be sent natively (see ready(), a
+        key without a keycode or app not running), so the caller can use
+        osascript
+    """
+    if any(key not in KEYCODES for key, _ in sequence):
+        return False
+    if not ready():
+        return False
+    app = find_app(target_app, bundle_id)
+    if app is None:
+        return False
+    pid = app.processIdentifier()
+    if _frontmost_pid() != pid:
+        app.activateWithOptions_(NSApplicationActivateIgnoringOtherApps)
+        _wait_until_frontmost(pid, pre_delay)
+    for i, (key, modifiers) in enumerate(sequence):
+        if i and inter_delay:
+            _precise_sleep(inter_delay)
+        post_key(key, modifiers)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Posted %d native keystroke(s) to %s", len(sequence), target_app)
+    return True
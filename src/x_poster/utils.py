@@ -4,10 +4,86 @@ Shared utility functions for x-poster.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
 import re
+import signal
+import sys
+import threading
+from typing import Any, Awaitable, TypeVar
 
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_T = TypeVar("_T")
+
+# Handles are ASCII-only, so \w need not consider Unicode word characters
+_TWEET_URL_RE = re.compile(r"https://x\.com/\w+/status/\d+", re.ASCII)
+
+# Scheme-less URL prefixes, told apart from bare handles
+_X_HOSTS = ("x.com/", "twitter.com/", "www.x.com/", "www.twitter.com/")
+
+
+def progress(message: str) -> None:
+    """Echo a progress line, unless stdout is not a TTY or XPOST_QUIET=1.
+
+    Use for intermediate steps only; final results and prompts that need
+    the user's attention should go through click.echo directly. stdout is
+    checked on every call, as the daemon swaps it for a buffer per command.
+    """
+    if os.environ.get("XPOST_QUIET") != "1" and sys.stdout.isatty():
+        click.echo(message)
+
+
+def login_prompt(message: str, err: bool = False) -> None:
+    """Ask the user to log in to X in the Chrome window.
+
+    Under `xpost serve` the client only sees output once the command has
+    finished and its Ctrl+C never reaches the command, so waiting for a
+    login there would hang the client silently; fail right away instead.
+
+    Raises:
+        RuntimeError: If running inside the daemon
+    """
+    if os.environ.get("XPOST_DAEMON") == "1":
+        raise RuntimeError(
+            "Login required. Log in to X in the xpost daemon's Chrome window, "
+            "then run the command again."
+        )
+    click.echo(message, err=err)
+
+
+def dump_json(data: Any, indent: bool = True) -> str:
+    """Serialize command output as non-ASCII-preserving JSON.
+
+    Uses orjson when installed (the `fast` extra); the output matches
+    json.dumps(data, ensure_ascii=False, indent=2), or the compact form
+    on a single line with indent=False (for NDJSON).
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _to_https_x_url(url: str) -> str:
+    """Strip whitespace, force https://, drop www. and map twitter.com to x.com."""
+    url = url.strip()
+    if url.startswith("https://"):
+        url = url[len("https://"):]
+    elif url.startswith("http://"):
+        url = url[len("http://"):]
+    if url.startswith("www."):
+        url = url[len("www."):]
+    return "https://" + url.replace("twitter.com", "x.com")
+
 
 def normalize_tweet_url(url: str) -> str:
     """Normalize a tweet URL to ensure it's a valid https://x.com/... format.
@@ -24,18 +100,10 @@ def normalize_tweet_url(url: str) -> str:
     Raises:
         click.UsageError: If the URL doesn't match expected tweet URL pattern.
     """
-    url = url.strip()
-
-    # Add scheme if missing
-    if not url.startswith("http"):
-        url = "https://" + url
-
-    # Normalize twitter.com → x.com
-    url = url.replace("twitter.com", "x.com")
+    url = _to_https_x_url(url)
 
     # Validate pattern
-    pattern = r"https://x\.com/\w+/status/\d+"
-    if not re.match(pattern, url):
+    if not _TWEET_URL_RE.match(url):
         raise click.UsageError(
             f"Invalid tweet URL: {url}\n"
             "Expected format: https://x.com/username/status/1234567890"
@@ -58,16 +126,56 @@ def normalize_profile_url(url_or_handle: str) -> str:
     s = url_or_handle.strip()
 
     # Just a handle
-    if not s.startswith("http"):
+    if not s.startswith(("http://", "https://") + _X_HOSTS):
         s = s.lstrip("@")
         return f"https://x.com/{s}"
 
-    s = s.replace("twitter.com", "x.com")
+    return _to_https_x_url(s)
+
+
+async def wait_for_interrupt() -> None:
+    """Block until the user presses Ctrl+C.
+
+    Waits on an event set by a SIGINT handler, so the event loop stays
+    idle instead of waking up periodically. Returns normally on Ctrl+C.
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    if threading.current_thread() is not threading.main_thread():
+        # Under `xpost serve` commands run in an executor thread, where
+        # SIGINT is never delivered; just wait to be cancelled
+        await stop.wait()
+        return
+    try:
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+    except (NotImplementedError, RuntimeError, ValueError):
+        # No loop signal support here (uvloop raises ValueError);
+        # asyncio.run cancels us on Ctrl+C
+        await stop.wait()
+        return
+    try:
+        await stop.wait()
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+
+
+async def interruptible(awaitable: Awaitable[_T]) -> _T:
+    """Await something long-running, giving up as soon as Ctrl+C is pressed.
 
-    if not s.startswith("https://"):
-        if s.startswith("http://"):
-            s = "https://" + s[len("http://"):]
-        else:
-            s = "https://" + s
+    Returns:
+        The awaitable's result
 
-    return s
+    Raises:
+        click.Abort: If the user pressed Ctrl+C first
+    """
+    task = asyncio.ensure_future(awaitable)
+    interrupt = asyncio.ensure_future(wait_for_interrupt())
+    try:
+        await asyncio.wait({task, interrupt}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        interrupt.cancel()
+        if not task.done():
+            task.cancel()
+    if task.done() and not task.cancelled():
+        return task.result()
+    raise click.Abort()
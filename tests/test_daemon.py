@@ -0,0 +1,35 @@
+"""Tests for x_poster.daemon."""
+
+import click
+
+from x_poster import cli as cli_module
+from x_poster.daemon import _run_cli
+from x_poster.daemon_client import can_serve
+
+
+@click.command()
+@click.pass_context
+def _echo_profile(ctx):
+    click.echo(ctx.obj["profile"])
+
+
+def test_run_cli_uses_daemon_profile_for_env_only_clients(monkeypatch):
+    """A client that chose the socket via XPOST_PROFILE sends no --profile."""
+    monkeypatch.delenv("XPOST_PROFILE", raising=False)
+    monkeypatch.setattr(cli_module.cli, "get_command", lambda ctx, name: _echo_profile)
+
+    argv = ["check"]
+    assert can_serve(argv)
+    code, out, _ = _run_cli(argv, profile_dir="/tmp/xpost-profile-a")
+    assert code == 0
+    assert out.strip() == "/tmp/xpost-profile-a"
+
+
+def test_run_cli_keeps_explicit_profile(monkeypatch):
+    monkeypatch.setattr(cli_module.cli, "get_command", lambda ctx, name: _echo_profile)
+
+    code, out, _ = _run_cli(
+        ["--profile", "/tmp/xpost-profile-b", "check"], profile_dir="/tmp/xpost-profile-b"
+    )
+    assert code == 0
+    assert out.strip() == "/tmp/xpost-profile-b"
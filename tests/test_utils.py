@@ -0,0 +1,24 @@
+"""Tests for x_poster.utils."""
+
+import asyncio
+import threading
+
+from x_poster.utils import interruptible
+
+
+def test_interruptible_in_worker_thread():
+    """Off the main thread (as under `xpost serve`) the awaitable still runs."""
+
+    async def answer():
+        await asyncio.sleep(0)
+        return 42
+
+    result = {}
+
+    def worker():
+        result["value"] = asyncio.run(interruptible(answer()))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join(timeout=5)
+    assert result.get("value") == 42